@@ -1,19 +1,24 @@
 from sqlalchemy.orm import Session
-from app.models import Users
-from app.utils.security import verify_password
-from sqlalchemy import or_
+from app.services.user_service import get_user_by_login
+from app.utils.security import verify_and_update_password
 
 
 def authenticate_user(session: Session, username_or_email: str, password: str):
     """
     Authentifie un utilisateur par email ou nom d'utilisateur.
     Retourne (utilisateur, erreur) : erreur est None si authentification réussie.
+    Un mot de passe haché avec un coût bcrypt dépassé est rehaché et enregistré.
     """
-    user = session.query(Users).filter(
-        or_(Users.email == username_or_email, Users.username == username_or_email)
-    ).first()
+    user = get_user_by_login(session, username_or_email)
+    if not user:
+        return None, "Identifiants invalides."
 
-    if not user or not verify_password(password, user.hashed_password):
+    valid, new_hash = verify_and_update_password(password, user.hashed_password)
+    if not valid:
         return None, "Identifiants invalides."
 
+    if new_hash:
+        user.hashed_password = new_hash
+        session.commit()
+
     return user, None
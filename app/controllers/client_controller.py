@@ -1,16 +1,30 @@
+import re
 import sentry_sdk
+from app.utils.audit import audit_log
+from app.utils.helpers import EMAIL_PATTERN, PHONE_PATTERN
+from app.models.mixins import blind_index, encrypt_many
 from app.services.client_service import get_all_clients as service_get_all_clients
+from app.services.client_service import get_clients_page as service_get_clients_page
+from app.services.client_service import get_client_by_email
+from app.services.client_service import get_existing_blind_indexes, insert_clients
+from app.repositories.pagination import DEFAULT_PAGE_SIZE
 from app.models import Clients
+from datetime import datetime
 
 
-def list_all_clients(session):
-    clients = service_get_all_clients(session)
+def list_all_clients(session, decrypt=()):
+    clients = service_get_all_clients(session, decrypt=decrypt)
     return clients
 
 
+def list_clients_page(session, after=None, limit=DEFAULT_PAGE_SIZE, decrypt=()):
+    """Retourne (clients, curseur suivant) : une page de clients à partir du curseur `after`."""
+    return service_get_clients_page(session, after=after, limit=limit, decrypt=decrypt)
+
+
 def create_client(session, first_name, last_name, email, phone, company_name, commercial_id):
     try:
-        existing_client = session.query(Clients).filter_by(email=email).first()
+        existing_client = get_client_by_email(session, email)
         if existing_client:
             return None, f"❌ Un client avec cet email existe déjà."
 
@@ -26,10 +40,11 @@ def create_client(session, first_name, last_name, email, phone, company_name, co
         session.add(client)
         session.commit()
 
-        # Sentry log: création
-        sentry_sdk.capture_message(
+        # Audit (envoyé à Sentry en arrière-plan)
+        audit_log(
+            "client.create",
             f"Client crée: {client.first_name} {client.last_name} | Email: {client.email} | ID Commercial: {commercial_id}",
-            level="info"
+            client_id=client.id, commercial_id=commercial_id
         )
 
         return client, None
@@ -51,7 +66,7 @@ def update_client(session, client_id, updates, current_user):
 
         new_email = updates.get("email")
         if new_email and new_email != client.email:
-            existing_client = session.query(Clients).filter_by(email=new_email).first()
+            existing_client = get_client_by_email(session, new_email)
             if existing_client and existing_client.id != client.id:
                 return None, f"❌ Cet email est déjà utilisé par un autre client."
 
@@ -61,10 +76,11 @@ def update_client(session, client_id, updates, current_user):
 
         session.commit()
 
-        # Sentry log: modification
-        sentry_sdk.capture_message(
+        # Audit (envoyé à Sentry en arrière-plan)
+        audit_log(
+            "client.update",
             f"Client modifié : {client.first_name} {client.last_name} (ID : {client.id}) par l’utilisateur ID {current_user.id}",
-            level="info"
+            client_id=client.id, user_id=current_user.id, fields=sorted(updates)
         )
 
         return client, None
@@ -73,3 +89,94 @@ def update_client(session, client_id, updates, current_user):
         session.rollback()
         sentry_sdk.capture_exception(e)
         return None, "❌ Erreur inattendue lors de la mise à jour du client."
+
+
+IMPORT_FIELDS = ("first_name", "last_name", "email", "phone", "company_name")
+
+
+def validate_client_row(data):
+    """
+    Valide une ligne d'import (dict lu dans le fichier).
+    Retourne (données nettoyées, None) ou (None, message d'erreur).
+    """
+    if not isinstance(data, dict):
+        return None, "ligne illisible"
+
+    row = {field: str(data.get(field) or "").strip() for field in IMPORT_FIELDS}
+    missing = [field for field in IMPORT_FIELDS if not row[field]]
+    if missing:
+        return None, f"champ(s) manquant(s) : {', '.join(missing)}"
+    if not re.match(EMAIL_PATTERN, row["email"]):
+        return None, f"email invalide : {row['email']}"
+    if not re.match(PHONE_PATTERN, row["phone"]):
+        return None, f"téléphone invalide : {row['phone']}"
+    return row, None
+
+
+def import_clients_chunk(session, rows, commercial_id=None):
+    """
+    Importe un lot de clients `rows` : liste de (numéro de ligne, dict lu).
+
+    Les doublons (dans le lot ou déjà en base) sont détectés en une requête sur
+    l'index aveugle, les emails et téléphones chiffrés en masse, puis les clients
+    insérés en un executemany et validés par un seul commit.
+    Retourne (nombre de clients importés, erreurs [(numéro de ligne, message)]).
+    """
+    errors = []
+    valid = []
+    seen = set()
+    for line, data in rows:
+        row, error = validate_client_row(data)
+        if error:
+            errors.append((line, error))
+            continue
+        bidx = blind_index(row["email"])
+        if bidx in seen:
+            errors.append((line, f"email en double dans le fichier : {row['email']}"))
+            continue
+        seen.add(bidx)
+        valid.append((line, row, bidx))
+
+    existing = get_existing_blind_indexes(session, [bidx for _, _, bidx in valid])
+    new_rows = []
+    for line, row, bidx in valid:
+        if bidx in existing:
+            errors.append((line, f"un client avec cet email existe déjà : {row['email']}"))
+        else:
+            new_rows.append((row, bidx))
+
+    if not new_rows:
+        return 0, errors
+
+    emails = encrypt_many(row["email"] for row, _ in new_rows)
+    phones = encrypt_many(row["phone"] for row, _ in new_rows)
+    now = datetime.utcnow()
+    try:
+        insert_clients(session, [
+            {
+                "first_name": row["first_name"],
+                "last_name": row["last_name"],
+                "email": email,
+                "email_bidx": bidx,
+                "phone": phone,
+                "company_name": row["company_name"],
+                "commercial_id": commercial_id,
+                "date_created": now,
+                "date_updated": now,
+            }
+            for (row, bidx), email, phone in zip(new_rows, emails, phones)
+        ])
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        sentry_sdk.capture_exception(e)
+        errors.extend((line, "lot rejeté : erreur inattendue à l'insertion") for line, _, bidx in valid
+                      if bidx not in existing)
+        return 0, errors
+
+    audit_log(
+        "client.import",
+        f"Import de {len(new_rows)} client(s) | ID Commercial: {commercial_id}",
+        imported=len(new_rows), commercial_id=commercial_id
+    )
+    return len(new_rows), errors
@@ -1,8 +1,12 @@
 from app.services.contract_service import get_all_contracts as service_get_all_contracts
+from app.services.contract_service import get_contracts_page as service_get_contracts_page
+from app.services.contract_service import get_contracts as service_get_contracts
+from app.services.contract_service import get_contract_totals as service_get_contract_totals
+from app.repositories.pagination import DEFAULT_PAGE_SIZE
 from app.models import Contracts, Clients, Users
 from datetime import datetime
 from app.models import Contracts
-import sentry_sdk
+from app.utils.audit import audit_log
 
 
 def list_all_contracts(session):
@@ -10,6 +14,31 @@ def list_all_contracts(session):
     return contracts
 
 
+def list_contracts_page(session, after=None, limit=DEFAULT_PAGE_SIZE, criteria=(), commercial_id=None,
+                        profile="contract_list"):
+    """
+    Retourne (contrats, curseur suivant) : une page de contrats à partir du curseur `after`,
+    éventuellement filtrée (`criteria`) et restreinte aux clients d'un commercial.
+    `profile` désigne les relations préchargées (cf. app/repositories/load_profiles.py).
+    """
+    return service_get_contracts_page(
+        session, after=after, limit=limit, criteria=criteria, commercial_id=commercial_id, profile=profile
+    )
+
+
+def list_contracts(session, commercial_id=None, profile="contract_list"):
+    """Retourne les contrats, restreints aux clients de `commercial_id` si indiqué."""
+    return service_get_contracts(session, commercial_id=commercial_id, profile=profile)
+
+
+def summarize_contracts(session, criteria=(), commercial_id=None):
+    """
+    Nombre de contrats et montants cumulés (total, signé, reste dû) des contrats vérifiant
+    `criteria`, calculés en base sans charger les contrats.
+    """
+    return service_get_contract_totals(session, criteria=criteria, commercial_id=commercial_id)
+
+
 def create_contract(session, client_id, commercial_id, total_amount, amount_due, is_signed=False):
     # Check if the client exists
     client = session.query(Clients).filter_by(id=client_id).first()
@@ -36,10 +65,12 @@ def create_contract(session, client_id, commercial_id, total_amount, amount_due,
     session.add(contract)
     session.commit()
 
-    # Log Sentry seulement si signé dès création
+    # Audit seulement si signé dès création
     if is_signed:
-        sentry_sdk.capture_message(
-            f"Contrat signé dès création : id={contract.id}, client_id={client.id}, commercial_id={commercial.id}, total_amount={total_amount}"
+        audit_log(
+            "contract.signed",
+            f"Contrat signé dès création : id={contract.id}, client_id={client.id}, commercial_id={commercial.id}, total_amount={total_amount}",
+            contract_id=contract.id, client_id=client.id, commercial_id=commercial.id
         )
     return contract, None
 
@@ -61,10 +92,12 @@ def update_contract(session, contract_id, updates, current_user):
 
     session.commit()
 
-    # LOG signature Sentry si signé
+    # Audit de la signature
     if updates.get("is_signed") is True:
-        sentry_sdk.capture_message(
-            f"Contrat signé : id={contract.id}, client_id={contract.client_id}, signé par user_id={current_user.id}"
+        audit_log(
+            "contract.signed",
+            f"Contrat signé : id={contract.id}, client_id={contract.client_id}, signé par user_id={current_user.id}",
+            contract_id=contract.id, client_id=contract.client_id, user_id=current_user.id
         )
 
 
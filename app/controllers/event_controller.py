@@ -1,5 +1,21 @@
 from app.services.event_service import get_all_events as service_get_all_events
+from app.services.event_service import get_events_page as service_get_events_page
+from app.services.event_service import get_events as service_get_events
+from app.services.event_service import find_overlapping_event as service_find_overlapping_event
+from app.services.event_service import iter_schedule as service_iter_schedule
+from app.services.event_service import get_unassigned_events as service_get_unassigned_events
+from app.services.event_service import get_support_schedule as service_get_support_schedule
+from app.services.event_service import assign_support_contacts as service_assign_support_contacts
+from app.services.user_service import get_users_by_role
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 from app.models import Events, Clients, Contracts, Users
+from app.utils.assignment import ASSIGNMENT_WINDOW_DAYS, plan_assignments
+from app.utils.audit import audit_log
+from app.utils.schedule import overlapping_pairs
+from datetime import datetime, timedelta
+
+# Libellés des clés de planning dans les messages et le rapport de conflits
+SCHEDULE_LABELS = {"support": "Support", "location": "Lieu"}
 
 
 def list_all_events(session):
@@ -7,6 +23,112 @@ def list_all_events(session):
     return events
 
 
+def list_events_page(session, after=None, limit=DEFAULT_PAGE_SIZE):
+    """Retourne (événements, curseur suivant) : une page d'événements à partir du curseur `after`."""
+    return service_get_events_page(session, after=after, limit=limit)
+
+
+def list_events(session, criteria=(), profile="event_list", order_by=None):
+    """
+    Retourne les événements vérifiant `criteria`, triés par `order_by` (par défaut date de début).
+    `profile` désigne les relations préchargées (cf. app/repositories/load_profiles.py).
+    """
+    return service_get_events(session, criteria=criteria, profile=profile, order_by=order_by)
+
+
+def check_schedule(session, support_contact_id, location, date_start, date_end, exclude_id=None):
+    """
+    Vérifie qu'un événement prévu du `date_start` au `date_end` peut être tenu :
+    dates cohérentes, support et lieu libres sur la période.
+    Retourne le message d'erreur du premier problème trouvé, ou None.
+    """
+    if date_start is None or date_end is None:
+        return None
+    if date_end < date_start:
+        return "❌ La date de fin doit être postérieure à la date de début."
+
+    for key, value in (("support", support_contact_id), ("location", location)):
+        if not value:
+            continue
+        other = service_find_overlapping_event(session, key, value, date_start, date_end, exclude_id=exclude_id)
+        if other is not None:
+            period = f"{other.date_start.strftime('%d/%m/%Y')} → {other.date_end.strftime('%d/%m/%Y')}"
+            if key == "support":
+                return (f"❌ Conflit de planning : le support ID {value} est déjà affecté "
+                        f"à l'événement ID {other.id} ({other.name}, {period}).")
+            return (f"❌ Conflit de planning : le lieu « {value} » est déjà réservé "
+                    f"pour l'événement ID {other.id} ({other.name}, {period}).")
+    return None
+
+
+def find_schedule_conflicts(session, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rapport de tous les chevauchements du planning, par support puis par lieu.
+    Retourne une liste de dicts (type, clé, les deux événements, période commune).
+    """
+    conflicts = []
+    for key, label in SCHEDULE_LABELS.items():
+        rows = (row for batch in service_iter_schedule(session, key, batch_size=batch_size) for row in batch)
+        for value, first, second in overlapping_pairs(rows):
+            conflicts.append({
+                "type": label,
+                "key": value,
+                "first": {"id": first[1], "name": first[2], "date_start": first[3], "date_end": first[4]},
+                "second": {"id": second[1], "name": second[2], "date_start": second[3], "date_end": second[4]},
+                "overlap": (second[3], min(first[4], second[4])),
+            })
+    return conflicts
+
+
+def propose_assignments(session, since=None, window_days=ASSIGNMENT_WINDOW_DAYS):
+    """
+    Calcule l'affectation des supports à tous les événements sans support non terminés,
+    en équilibrant la charge (cf. app/utils/assignment.py). Rien n'est enregistré.
+    Retourne (proposition, erreur) ; la proposition contient :
+    - "assignments" : liste de (event_id, support_id) ;
+    - "unassigned" : ids des événements pour lesquels aucun support n'est libre ;
+    - "supports" : {support_id: {"name", "events", "attendees"}} pour les affectations proposées.
+    """
+    supports = get_users_by_role(session, "support")
+    if not supports:
+        return None, "❌ Aucun support disponible."
+
+    since = since or datetime.now()
+    events = service_get_unassigned_events(session, since)
+    # Les événements affectés qui finissent avant la fenêtre du premier événement ne comptent pas
+    schedule = service_get_support_schedule(session, since - timedelta(days=window_days))
+    assignments, unassigned = plan_assignments(
+        [support.id for support in supports], schedule, events, window_days=window_days
+    )
+
+    summary = {
+        support.id: {"name": f"{support.first_name} {support.last_name}", "events": 0, "attendees": 0}
+        for support in supports
+    }
+    attendees = {event_id: count or 0 for event_id, _, _, count in events}
+    for event_id, support_id in assignments:
+        summary[support_id]["events"] += 1
+        summary[support_id]["attendees"] += attendees[event_id]
+    return {"assignments": assignments, "unassigned": unassigned, "supports": summary}, None
+
+
+def apply_assignments(session, assignments, current_user):
+    """
+    Enregistre les affectations proposées par propose_assignments en une seule transaction.
+    Retourne (nombre d'événements affectés, erreur).
+    """
+    if not assignments:
+        return 0, "❌ Aucune affectation à enregistrer."
+    count = service_assign_support_contacts(session, assignments)
+    session.commit()
+    audit_log(
+        "event.auto_assign",
+        f"Affectation automatique : {count} événement(s) affecté(s) par user_id={current_user.id}",
+        user_id=current_user.id, count=count,
+    )
+    return count, None
+
+
 def create_event(
     session, name, contract_id, client_id,
     support_contact_id=None, date_start=None, date_end=None,
@@ -26,6 +148,11 @@ def create_event(
         if not support_contact or support_contact.role.name != "support":
             return None, f"❌ Support contact ID {support_contact_id} invalide."
 
+    # Un support ou un lieu ne peut pas être réservé deux fois sur la même période
+    error = check_schedule(session, support_contact_id, location, date_start, date_end)
+    if error:
+        return None, error
+
     event = Events(
         name=name,
         contract_id=contract_id,
@@ -64,14 +191,28 @@ def update_event(session, event_id, updates, current_user):
 
     allowed_fields = allowed_fields_by_role.get(role, set())
 
-    # Appliquer les modifications autorisées uniquement
+    # Retenir les modifications autorisées uniquement
+    changes = {}
     for field, value in updates.items():
         if value is not None:
             if field in allowed_fields:
-                setattr(event, field, value)
+                changes[field] = value
             else:
                 return None, f"⛔ Vous n'avez pas la permission de modifier '{field}' en tant que '{role}'."
 
+    # Vérifier le planning avant d'appliquer un changement de dates, de lieu ou de support
+    if changes.keys() & {"support_contact_id", "date_start", "date_end", "location"}:
+        planned = {
+            field: changes.get(field, getattr(event, field))
+            for field in ("support_contact_id", "location", "date_start", "date_end")
+        }
+        error = check_schedule(session, exclude_id=event.id, **planned)
+        if error:
+            return None, error
+
+    for field, value in changes.items():
+        setattr(event, field, value)
+
     session.commit()
     return event, None
 
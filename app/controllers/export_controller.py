@@ -0,0 +1,100 @@
+from app.services.client_service import iter_clients
+from app.services.contract_service import iter_contracts
+from app.services.event_service import iter_events
+from app.repositories.pagination import DEFAULT_BATCH_SIZE
+
+# Colonnes exportées par entité (ordre des colonnes du fichier) et leur type, fixé
+# pour tout l'export (Parquet) : toutes les colonnes acceptent les valeurs nulles.
+EXPORT_SCHEMAS = {
+    "clients": (
+        ("id", "int"), ("first_name", "string"), ("last_name", "string"), ("email", "string"),
+        ("phone", "string"), ("company_name", "string"), ("commercial_id", "int"),
+        ("date_created", "datetime"), ("date_updated", "datetime"),
+    ),
+    "contracts": (
+        ("id", "int"), ("client_id", "int"), ("client_name", "string"), ("commercial_id", "int"),
+        ("total_amount", "money"), ("amount_due", "money"), ("is_signed", "bool"),
+        ("date_created", "datetime"),
+    ),
+    "events": (
+        ("id", "int"), ("name", "string"), ("contract_id", "int"), ("client_id", "int"),
+        ("client_name", "string"), ("support_contact_id", "int"), ("support_contact_name", "string"),
+        ("date_start", "datetime"), ("date_end", "datetime"), ("location", "string"),
+        ("attendees", "int"), ("notes", "string"),
+    ),
+}
+EXPORT_COLUMNS = {entity: tuple(name for name, _ in schema) for entity, schema in EXPORT_SCHEMAS.items()}
+EXPORT_TYPES = {entity: dict(schema) for entity, schema in EXPORT_SCHEMAS.items()}
+
+
+def _full_name(person):
+    return f"{person.first_name} {person.last_name}" if person else None
+
+
+def _client_rows(clients):
+    return [
+        {
+            "id": c.id, "first_name": c.first_name, "last_name": c.last_name,
+            "email": c.email, "phone": c.phone, "company_name": c.company_name,
+            "commercial_id": c.commercial_id, "date_created": c.date_created, "date_updated": c.date_updated,
+        }
+        for c in clients
+    ]
+
+
+def _contract_rows(contracts):
+    return [
+        {
+            "id": c.id, "client_id": c.client_id, "client_name": _full_name(c.client),
+            "commercial_id": c.commercial_id, "total_amount": c.total_amount, "amount_due": c.amount_due,
+            "is_signed": c.is_signed, "date_created": c.date_created,
+        }
+        for c in contracts
+    ]
+
+
+def _event_rows(events):
+    return [
+        {
+            "id": e.id, "name": e.name, "contract_id": e.contract_id, "client_id": e.client_id,
+            "client_name": _full_name(e.client), "support_contact_id": e.support_contact_id,
+            "support_contact_name": _full_name(e.support_contact),
+            "date_start": e.date_start, "date_end": e.date_end, "location": e.location,
+            "attendees": e.attendees, "notes": e.notes,
+        }
+        for e in events
+    ]
+
+
+def export_batches(session, entity, current_user, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Prépare l'export de `entity` (clients, contracts ou events) selon le rôle, comme les vues :
+    - gestion : tout ;
+    - commercial : ses clients, leurs contrats et leurs événements ;
+    - support : les événements qui lui sont assignés.
+    Retourne (générateur de lots de lignes (dicts), None) ou (None, message d'erreur).
+    """
+    if entity not in EXPORT_COLUMNS:
+        return None, f"❌ Export inconnu : {entity} (choix : {', '.join(EXPORT_COLUMNS)})"
+
+    role = current_user.role.name
+    commercial_id = current_user.id if role == "commercial" else None
+
+    if role == "support":
+        if entity != "events":
+            return None, "⛔ Le support ne peut exporter que ses événements."
+        batches = iter_events(session, support_contact_id=current_user.id, batch_size=batch_size)
+        return (_event_rows(batch) for batch in batches), None
+    if role not in ("gestion", "commercial"):
+        return None, f"⛔ Export non autorisé pour le rôle {role}."
+
+    if entity == "clients":
+        # Champs chiffrés déchiffrés en masse, lot par lot
+        batches = iter_clients(session, commercial_id=commercial_id, batch_size=batch_size,
+                               decrypt=("email", "phone"))
+        return (_client_rows(batch) for batch in batches), None
+    if entity == "contracts":
+        batches = iter_contracts(session, commercial_id=commercial_id, batch_size=batch_size)
+        return (_contract_rows(batch) for batch in batches), None
+    batches = iter_events(session, commercial_id=commercial_id, batch_size=batch_size)
+    return (_event_rows(batch) for batch in batches), None
@@ -0,0 +1,52 @@
+from app.models.revenue import REVENUE_COLUMNS, REVENUE_SCOPES
+from app.services.revenue_service import get_commercial_revenue, get_top_clients_by_amount_due
+from app.services.revenue_service import rebuild_revenue, compute_revenue, get_stored_revenue
+from app.repositories.revenue_repository import DEFAULT_TOP_CLIENTS
+
+
+def _amounts(revenue):
+    return {column: getattr(revenue, column) for column in REVENUE_COLUMNS}
+
+
+def revenue_dashboard(session, top_clients=DEFAULT_TOP_CLIENTS):
+    """
+    Chiffre d'affaires signé et créances, lus dans les agrégats (une ligne par commercial,
+    plus les `top_clients` clients ayant le plus de créances).
+    Retourne {"commercials": [...], "clients": [...], "totals": {...}}.
+    """
+    commercials = [
+        {"id": user.id, "name": f"{user.first_name} {user.last_name}", **_amounts(revenue)}
+        for user, revenue in get_commercial_revenue(session)
+    ]
+    clients = [
+        {"id": client.id, "name": f"{client.first_name} {client.last_name}",
+         "company_name": client.company_name, **_amounts(revenue)}
+        for client, revenue in get_top_clients_by_amount_due(session, limit=top_clients)
+    ]
+    totals = {column: sum(row[column] for row in commercials) for column in REVENUE_COLUMNS}
+    return {"commercials": commercials, "clients": clients, "totals": totals}
+
+
+def rebuild_revenue_summaries(session):
+    """Recalcule tous les agrégats à partir des contrats. Retourne {agrégat: nombre de lignes}."""
+    rebuild_revenue(session)
+    session.commit()
+    return {scope: len(get_stored_revenue(session, scope)) for scope in REVENUE_SCOPES}
+
+
+def check_revenue_summaries(session):
+    """
+    Compare les agrégats enregistrés à ceux recalculés à partir des contrats
+    (montants en centimes : la comparaison est exacte).
+    Retourne la liste des écarts : (agrégat, clé, colonne, attendu, enregistré).
+    """
+    mismatches = []
+    empty = dict.fromkeys(REVENUE_COLUMNS, 0)
+    for scope in REVENUE_SCOPES:
+        expected, stored = compute_revenue(session, scope), get_stored_revenue(session, scope)
+        for key in sorted(expected.keys() | stored.keys()):
+            for column in REVENUE_COLUMNS:
+                want, got = expected.get(key, empty)[column], stored.get(key, empty)[column]
+                if want != got:
+                    mismatches.append((scope, key, column, want, got))
+    return mismatches
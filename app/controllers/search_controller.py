@@ -0,0 +1,26 @@
+import re
+from app.models.mixins import prefetch_decrypted
+from app.repositories.search_repository import DEFAULT_SEARCH_LIMIT, build_match_query
+from app.services.client_service import get_client_by_email
+from app.services.search_service import search_clients, search_events
+from app.utils.helpers import EMAIL_PATTERN
+
+
+def search(session, terms, limit=DEFAULT_SEARCH_LIMIT):
+    """
+    Recherche des clients et des événements.
+    - un email complet est cherché tel quel via l'index aveugle (les emails chiffrés
+      ne sont pas dans l'index plein texte) ;
+    - sinon, chaque mot est cherché comme préfixe, les résultats les plus pertinents d'abord.
+    Retourne ({"clients": [...], "events": [...]}, None) ou (None, message d'erreur).
+    """
+    terms = (terms or "").strip()
+    if re.fullmatch(EMAIL_PATTERN, terms):
+        client = get_client_by_email(session, terms)
+        return {"clients": [client] if client else [], "events": []}, None
+
+    if build_match_query(terms) is None:
+        return None, "❌ Merci de saisir au moins un mot à rechercher."
+
+    clients = prefetch_decrypted(search_clients(session, terms, limit=limit), "email")
+    return {"clients": clients, "events": search_events(session, terms, limit=limit)}, None
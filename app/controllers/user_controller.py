@@ -1,6 +1,8 @@
 from app.models import Users, Roles
+from app.services.user_service import get_user_by_email
 from app.utils.security import hash_password
-import sentry_sdk
+from app.utils.auth_context import clear_auth_context
+from app.utils.audit import audit_log
 
 
 def create_user(session, username, first_name, last_name, email, password, role_name):
@@ -10,7 +12,7 @@ def create_user(session, username, first_name, last_name, email, password, role_
         return None, f"❌ Rôle '{role_name}' introuvable."
 
     # check if user already exists
-    if session.query(Users).filter_by(email=email).first():
+    if get_user_by_email(session, email):
         return None, f"❌ Un utilisateur existe déjà avec cet email : {email}"
 
     hashed_pw = hash_password(password)
@@ -26,9 +28,11 @@ def create_user(session, username, first_name, last_name, email, password, role_
     session.add(user)
     session.commit()
 
-    # LOG SENTRY
-    sentry_sdk.capture_message(
-        f"Utilisateur créé : id={user.id}, username={user.username}, email={user.email}, role={role_name}"
+    # Audit (envoyé à Sentry en arrière-plan)
+    audit_log(
+        "user.create",
+        f"Utilisateur créé : id={user.id}, username={user.username}, email={user.email}, role={role_name}",
+        user_id=user.id, role=role_name
     )
 
     return user, None
@@ -51,7 +55,7 @@ def update_user(session, user_id, **updates):
         user.last_name = updates['last_name']
     if 'email' in updates:
         # Vérifier doublon
-        existing = session.query(Users).filter(Users.email == updates['email'], Users.id != user.id).first()
+        existing = get_user_by_email(session, updates['email'], exclude_id=user.id)
         if existing:
             return None, f"❌ Un autre utilisateur a déjà cet email : {updates['email']}"
         user.email = updates['email']
@@ -65,9 +69,15 @@ def update_user(session, user_id, **updates):
 
     session.commit()
 
-    # LOG SENTRY
-    sentry_sdk.capture_message(
-        f"Utilisateur modifié : id={user.id}, username={user.username}, email={user.email}, updates={list(updates.keys())}"
+    if 'role_name' in updates:
+        # Le rôle mis en cache pour cet utilisateur n'est plus à jour
+        clear_auth_context(user.id)
+
+    # Audit (envoyé à Sentry en arrière-plan)
+    audit_log(
+        "user.update",
+        f"Utilisateur modifié : id={user.id}, username={user.username}, email={user.email}, updates={list(updates.keys())}",
+        user_id=user.id, fields=sorted(updates)
     )
 
     return user, None
@@ -0,0 +1,113 @@
+import os
+from sqlalchemy import create_engine, event
+
+# Profils de performance SQLite, appliqués à chaque nouvelle connexion.
+#
+# - "safe"     : journal classique (rollback), fsync complet à chaque commit.
+#                Le plus prudent, mais lecteurs et rédacteurs se bloquent.
+# - "balanced" : WAL + synchronous=NORMAL. Les lectures ne bloquent plus les
+#                écritures ; une coupure de courant peut perdre le dernier commit
+#                mais jamais corrompre la base. Profil par défaut.
+# - "fast"     : WAL + synchronous=OFF, gros cache. Réservé aux traitements de
+#                masse (seeds, imports) qu'on peut relancer en cas de crash.
+#
+# cache_size négatif = taille en Kio (convention SQLite).
+SQLITE_PROFILES = {
+    "safe": {
+        "pragmas": {
+            "journal_mode": "DELETE",
+            "synchronous": "FULL",
+            "mmap_size": 0,
+            "cache_size": -2000,
+            "busy_timeout": 5000,
+            "temp_store": "DEFAULT",
+        },
+        "pool": {"pool_size": 2, "max_overflow": 0},
+    },
+    "balanced": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 256 * 1024 * 1024,
+            "cache_size": -64000,
+            "busy_timeout": 5000,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 5, "max_overflow": 5},
+    },
+    "fast": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "OFF",
+            "mmap_size": 1024 * 1024 * 1024,
+            "cache_size": -256000,
+            "busy_timeout": 10000,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 2, "max_overflow": 0},
+    },
+}
+
+DEFAULT_SQLITE_PROFILE = "balanced"
+
+
+def is_memory_sqlite(url):
+    """Vrai pour une base SQLite en mémoire (tests), où WAL, mmap et pool n'ont pas de sens."""
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Exécute les PRAGMA du profil à chaque ouverture de connexion DBAPI."""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def postgres_engine_options():
+    """
+    Options du pool PostgreSQL, lues dans l'environnement au moment de la création :
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE (secondes)
+    et DB_STATEMENT_TIMEOUT_MS (0 = pas de limite).
+    """
+    statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        # Vérifie la connexion avant usage (serveur redémarré, connexion coupée...)
+        "pool_pre_ping": True,
+        # Passé au serveur à l'ouverture de chaque connexion (psycopg / psycopg2)
+        "connect_args": {"options": f"-c statement_timeout={statement_timeout}"},
+    }
+
+
+def create_app_engine(url, profile=DEFAULT_SQLITE_PROFILE, **kwargs):
+    """
+    Crée le moteur SQLAlchemy de l'application.
+    - SQLite : applique le profil `profile` (PRAGMA + taille du pool) ;
+    - PostgreSQL : applique les options de pool de postgres_engine_options().
+    """
+    if url.startswith("postgresql"):
+        return create_engine(url, **{**postgres_engine_options(), **kwargs})
+    if not url.startswith("sqlite"):
+        return create_engine(url, **kwargs)
+
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Profil SQLite inconnu : {profile} (choix : {', '.join(SQLITE_PROFILES)})")
+    settings = SQLITE_PROFILES[profile]
+
+    if is_memory_sqlite(url):
+        engine = create_engine(url, **kwargs)
+        pragmas = {k: v for k, v in settings["pragmas"].items() if k not in ("journal_mode", "mmap_size")}
+    else:
+        engine = create_engine(url, **{**settings["pool"], **kwargs})
+        pragmas = settings["pragmas"]
+
+    apply_sqlite_pragmas(engine, pragmas)
+    return engine
@@ -3,9 +3,20 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from app.utils.auth import role_required
-from app.views.client_view import create_client_view, update_client_view, show_all_clients_view
-from app.views.contract_view import update_contract_view, filter_contracts_view, show_all_contracts_view
-from app.views.event_view import create_event_view, show_all_events_view
+from app.utils.lazy import lazy_import
+from app.utils.profiling import profile_action
+from app.utils.sql_metrics import track_action
+
+# Vues chargées à leur première ouverture (cf. app/utils/lazy.py)
+create_client_view = lazy_import("app.views.client_view", "create_client_view")
+update_client_view = lazy_import("app.views.client_view", "update_client_view")
+show_all_clients_view = lazy_import("app.views.client_view", "show_all_clients_view")
+update_contract_view = lazy_import("app.views.contract_view", "update_contract_view")
+filter_contracts_view = lazy_import("app.views.contract_view", "filter_contracts_view")
+show_all_contracts_view = lazy_import("app.views.contract_view", "show_all_contracts_view")
+create_event_view = lazy_import("app.views.event_view", "create_event_view")
+show_all_events_view = lazy_import("app.views.event_view", "show_all_events_view")
+search_view = lazy_import("app.views.search_view", "search_view")
 
 console = Console()
 
@@ -49,6 +60,7 @@ def commercial_clients_menu(user):
         ("1", "Créer un client (associé automatiquement)", create_client_view),
         ("2", "Modifier un client (dont vous êtes responsable)", update_client_view),
         ("3", "Lister tous les clients", show_all_clients_view),
+        ("4", "Rechercher un client ou un événement", search_view),
         ("0", "[red]Retour", None),
     ]
     display_action_menu(actions, user)
@@ -94,10 +106,11 @@ def display_action_menu(actions, user):
         valid_choices = [code for code, _, _ in actions]
         choice = Prompt.ask("\n[bold cyan]Votre choix[/bold cyan]", choices=valid_choices, default="0")
 
-        for code, _, action in actions:
+        for code, label, action in actions:
             if choice == code:
                 if action:
-                    action(user)
+                    with track_action(label, console), profile_action(label, console):
+                        action(user)
                 break  # permet d'exécuter une seule action puis re-afficher
         if choice == "0":
             break
@@ -2,11 +2,27 @@ from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt
 
-from app.views.client_view import show_all_clients_view
-from app.views.contract_view import create_contract_view, update_contract_view, show_all_contracts_view
-from app.views.event_view import update_event_view, show_all_events_view, filter_events_view
-from app.views.user_view import create_user_view, update_user_view, delete_user_view, show_all_users_view
 from app.utils.auth import role_required
+from app.utils.lazy import lazy_import
+from app.utils.profiling import profile_action
+from app.utils.sql_metrics import track_action
+
+# Vues chargées à leur première ouverture (cf. app/utils/lazy.py)
+show_all_clients_view = lazy_import("app.views.client_view", "show_all_clients_view")
+create_contract_view = lazy_import("app.views.contract_view", "create_contract_view")
+update_contract_view = lazy_import("app.views.contract_view", "update_contract_view")
+show_all_contracts_view = lazy_import("app.views.contract_view", "show_all_contracts_view")
+update_event_view = lazy_import("app.views.event_view", "update_event_view")
+show_all_events_view = lazy_import("app.views.event_view", "show_all_events_view")
+filter_events_view = lazy_import("app.views.event_view", "filter_events_view")
+schedule_conflicts_view = lazy_import("app.views.event_view", "schedule_conflicts_view")
+auto_assign_view = lazy_import("app.views.event_view", "auto_assign_view")
+create_user_view = lazy_import("app.views.user_view", "create_user_view")
+update_user_view = lazy_import("app.views.user_view", "update_user_view")
+delete_user_view = lazy_import("app.views.user_view", "delete_user_view")
+show_all_users_view = lazy_import("app.views.user_view", "show_all_users_view")
+search_view = lazy_import("app.views.search_view", "search_view")
+revenue_dashboard_view = lazy_import("app.views.revenue_view", "revenue_dashboard_view")
 
 console = Console()
 
@@ -69,6 +85,7 @@ def collaborateurs_menu(user):
 def clients_menu(user):
     actions = [
         ("1", "Lister tous les clients", show_all_clients_view),
+        ("2", "Rechercher un client ou un événement", search_view),
         ("0", "[red]Retour", None),
     ]
     display_action_menu(actions, user)
@@ -79,6 +96,7 @@ def contrats_menu(user):
         ("1", "Créer un contrat", create_contract_view),
         ("2", "Modifier un contrat", update_contract_view),
         ("3", "Lister tous les contrats", show_all_contracts_view),
+        ("4", "Tableau de bord : chiffre d'affaires et créances", revenue_dashboard_view),
         ("0", "[red]Retour", None),
     ]
     display_action_menu(actions, user)
@@ -89,6 +107,8 @@ def evenements_menu(user):
         ("1", "Modifier un événement (attribuer support)", update_event_view),
         ("2", "Lister tous les événements", show_all_events_view),
         ("3", "Filtrer les événements", filter_events_view),
+        ("4", "Rapport des conflits de planning", schedule_conflicts_view),
+        ("5", "Affecter automatiquement les supports", auto_assign_view),
         ("0", "[red]Retour", None),
     ]
     display_action_menu(actions, user)
@@ -109,7 +129,8 @@ def display_action_menu(actions, user):
         for action in actions:
             if action[0] == choice:
                 if len(action) >= 3 and action[2]:
-                    action[2](user)
+                    with track_action(action[1], console), profile_action(action[1], console):
+                        action[2](user)
                 if action[0] == "0" or len(action) < 3 or not action[2]:
                     return
 
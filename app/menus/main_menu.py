@@ -3,7 +3,6 @@ from app.utils.auth import role_required
 from app.menus.gestion_menu import gestion_main_menu
 from app.menus.commercial_menu import commercial_menu
 from app.menus.support_menu import support_menu
-import sentry_sdk
 
 console = Console()
 
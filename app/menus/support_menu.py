@@ -1,17 +1,19 @@
 from rich.console import Console
 from rich.table import Table
 
-from app.views.event_view import (
-    filter_events_view,
-    update_event_view,
-    show_all_events_view,
-    show_user_events_view
-)
-from app.views.client_view import show_all_clients_view
-from app.views.contract_view import show_all_contracts_view
 from app.utils.auth import role_required
+from app.utils.lazy import lazy_import
 from app.menus.utils import display_action_menu, safe_prompt_ask
 
+# Vues chargées à leur première ouverture (cf. app/utils/lazy.py)
+filter_events_view = lazy_import("app.views.event_view", "filter_events_view")
+update_event_view = lazy_import("app.views.event_view", "update_event_view")
+show_all_events_view = lazy_import("app.views.event_view", "show_all_events_view")
+show_user_events_view = lazy_import("app.views.event_view", "show_user_events_view")
+show_all_clients_view = lazy_import("app.views.client_view", "show_all_clients_view")
+show_all_contracts_view = lazy_import("app.views.contract_view", "show_all_contracts_view")
+search_view = lazy_import("app.views.search_view", "search_view")
+
 console = Console()
 
 @role_required("support")
@@ -23,6 +25,7 @@ def support_menu(user):
         ("4", "Filtrer les événements", filter_events_view),
         ("5", "Afficher mes événements", show_user_events_view),
         ("6", "Mettre à jour un événement dont vous êtes responsable", update_event_view),
+        ("7", "Rechercher un client ou un événement", search_view),
         ("0", "[red]Quitter", None),
     ]
 
@@ -2,6 +2,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt
 
+from app.utils.profiling import profile_action
+from app.utils.sql_metrics import track_action
+
 console = Console()
 
 
@@ -54,14 +57,15 @@ def display_action_menu(actions, user=None):
                 func = action[2] if len(action) > 2 else None
 
                 if func:
-                    try:
-                        # Test d'appel sans argument
-                        func()
-                    except TypeError as e:
-                        if "positional argument" in str(e):
-                            func(user)
-                        else:
-                            raise
+                    with track_action(action[1], console), profile_action(action[1], console):
+                        try:
+                            # Test d'appel sans argument
+                            func()
+                        except TypeError as e:
+                            if "positional argument" in str(e):
+                                func(user)
+                            else:
+                                raise
                 else:
                     console.print("[yellow]⚠️ Aucune action définie pour ce choix.[/yellow]")
                 break
@@ -3,4 +3,6 @@ from .role import Roles
 from .user import Users
 from .client import Clients
 from .contract import Contracts
-from .event import Events
\ No newline at end of file
+from .event import Events
+from . import search  # index plein texte : tables FTS5 et synchronisation ORM
+from .revenue import CommercialRevenue, ClientRevenue  # agrégats par commercial et par client
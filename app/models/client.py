@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base
-from .mixins import EncryptedString
+from .mixins import encrypted_property
 
 
 class Clients(Base):
@@ -11,14 +11,26 @@ class Clients(Base):
     id = Column(Integer, primary_key=True)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
-    email = Column(EncryptedString, unique=True, nullable=False)
-    phone = Column(EncryptedString, nullable=False)
+    # Colonnes chiffrées (Fernet), déchiffrées à la lecture des attributs email/phone
+    _email = Column('email', String, nullable=False)
+    email_bidx = Column(String(64), unique=True, index=True)
+    _phone = Column('phone', String, nullable=False)
     company_name = Column(String, nullable=False)
     date_created = Column(DateTime, default=datetime.utcnow)
     date_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     commercial_id = Column(Integer, ForeignKey('users.id'))
+
+    # Clients d'un commercial et pages triées par (last_name, id)
+    __table_args__ = (
+        Index('ix_clients_commercial_id', commercial_id),
+        Index('ix_clients_last_name_id', last_name, id),
+    )
+
     commercial = relationship('Users', back_populates='created_clients')
 
     contracts = relationship('Contracts', back_populates='client')
     events = relationship('Events', back_populates='client')
+
+    email = encrypted_property('_email', blind_index_key='email_bidx')
+    phone = encrypted_property('_phone')
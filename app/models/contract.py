@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base
+from .types import Money
 
 class Contracts(Base):
     __tablename__ = 'contracts'
@@ -10,10 +11,24 @@ class Contracts(Base):
     client_id = Column(Integer, ForeignKey('clients.id'))
     commercial_id = Column(Integer, ForeignKey('users.id'))
 
-    total_amount = Column(Float, nullable=False)
-    amount_due = Column(Float, nullable=False)
+    # Montants exacts : centimes en base, Decimal en Python (cf. types.py)
+    total_amount = Column(Money, nullable=False)
+    amount_due = Column(Money, nullable=False)
     date_created = Column(DateTime, default=datetime.utcnow)
     is_signed = Column(Boolean, default=False)
 
+    # Index des requêtes fréquentes : pages triées par (date_created, id) et filtres
+    # de filter_contracts_view (signé / non signé, payé / non payé)
+    __table_args__ = (
+        Index('ix_contracts_client_id', client_id),
+        Index('ix_contracts_commercial_id', commercial_id),
+        Index('ix_contracts_date_created_id', date_created, id),
+        Index('ix_contracts_signed_created', is_signed, date_created, id),
+        Index('ix_contracts_unpaid_created', date_created, id,
+              sqlite_where=amount_due > 0, postgresql_where=amount_due > 0),
+        Index('ix_contracts_paid_created', date_created, id,
+              sqlite_where=amount_due == 0, postgresql_where=amount_due == 0),
+    )
+
     client = relationship('Clients', back_populates='contracts')
 
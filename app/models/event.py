@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -17,5 +17,23 @@ class Events(Base):
     attendees = Column(Integer)
     notes = Column(String)
 
+    # Index des requêtes fréquentes : pages triées par (date_start, id), événements
+    # d'un support (show_user_events_view) et filtres de filter_events_view
+    __table_args__ = (
+        Index('ix_events_client_id', client_id),
+        Index('ix_events_contract_id', contract_id),
+        Index('ix_events_date_start_id', date_start, id),
+        # Filtre "passés" (date_end < maintenant), trié par date_end décroissante
+        Index('ix_events_date_end', date_end),
+        # Sert aussi au filtre "sans support" (support_contact_id IS NULL)
+        Index('ix_events_support_date_start', support_contact_id, date_start),
+        # Rapport des conflits de planning par lieu (cf. iter_schedule)
+        Index('ix_events_location_date_start', location, date_start),
+        # Test de chevauchement (cf. find_overlapping_event) : parcours des événements
+        # de la clé qui finissent après le début demandé, date_start lue dans l'index
+        Index('ix_events_support_date_end_start', support_contact_id, date_end, date_start),
+        Index('ix_events_location_date_end_start', location, date_end, date_start),
+    )
+
     client = relationship('Clients', back_populates='events')
     support_contact = relationship('Users', back_populates='assigned_events')
\ No newline at end of file
@@ -1,29 +1,241 @@
-from cryptography.fernet import Fernet
-from sqlalchemy.types import TypeDecorator, String
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+import atexit
+import hashlib
+import hmac
 import os
+import threading
 
 # Load encryption key from environment variable
 FERNET_KEY = os.getenv("FERNET_KEY")
 if not FERNET_KEY:
     raise ValueError("FERNET_KEY is not set in environment variables.")
 
-fernet = Fernet(FERNET_KEY)
+# Objet Fernet créé au premier chiffrement (cryptography n'est pas chargé au démarrage)
+_fernet = None
 
+# Déchiffrement en masse : nombre de processus et taille des lots envoyés à chacun
+DECRYPT_WORKERS = int(os.getenv("DECRYPT_WORKERS", os.cpu_count() or 1))
+DECRYPT_CHUNK_SIZE = int(os.getenv("DECRYPT_CHUNK_SIZE", 2000))
 
-class EncryptedString(TypeDecorator):
-    """A SQLAlchemy column type for AES encryption/decryption using Fernet."""
-    impl = String
+_decrypt_executor = None
+_decrypt_executor_lock = threading.Lock()
 
-    cache_ok = True
+# Clé HMAC de l'index aveugle : dérivée de FERNET_KEY si BLIND_INDEX_KEY est absente
+BLIND_INDEX_KEY = os.getenv("BLIND_INDEX_KEY")
+if BLIND_INDEX_KEY:
+    _blind_index_key = BLIND_INDEX_KEY.encode()
+else:
+    _blind_index_key = hmac.new(FERNET_KEY.encode(), b"blind-index", hashlib.sha256).digest()
 
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        if not isinstance(value, str):
+
+def get_fernet():
+    """Objet Fernet de FERNET_KEY, créé à la première utilisation."""
+    global _fernet
+    if _fernet is None:
+        from cryptography.fernet import Fernet
+        _fernet = Fernet(FERNET_KEY)
+    return _fernet
+
+
+def __getattr__(name):
+    # mixins.fernet reste disponible, sans être construit à l'import
+    if name == "fernet":
+        return get_fernet()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def blind_index(value):
+    """
+    Calcule l'index aveugle (HMAC-SHA256) d'une valeur chiffrée.
+
+    Fernet étant aléatoire, deux chiffrements d'un même email diffèrent :
+    l'index aveugle est déterministe et permet une recherche d'égalité indexée
+    sans jamais stocker la valeur en clair. La valeur est normalisée
+    (espaces retirés, minuscules) avant hachage.
+    """
+    if value is None:
+        return None
+    normalized = str(value).strip().lower()
+    return hmac.new(_blind_index_key, normalized.encode(), hashlib.sha256).hexdigest()
+
+
+def encrypt_value(value):
+    """Chiffre une valeur avec Fernet (None reste None)."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = str(value)
+    return get_fernet().encrypt(value.encode()).decode()
+
+
+def decrypt_value(value):
+    """Déchiffre une valeur Fernet (None reste None)."""
+    if value is None:
+        return None
+    return get_fernet().decrypt(value.encode()).decode()
+
+
+def _decrypt_chunk(values):
+    return [decrypt_value(value) for value in values]
+
+
+def _encrypt_chunk(values):
+    return [encrypt_value(value) for value in values]
+
+
+def _get_decrypt_executor():
+    """Pool de processus du déchiffrement en masse, créé au premier gros volume et arrêté à la sortie."""
+    global _decrypt_executor
+    if _decrypt_executor is None:
+        with _decrypt_executor_lock:
+            if _decrypt_executor is None:
+                _decrypt_executor = ProcessPoolExecutor(max_workers=DECRYPT_WORKERS)
+                atexit.register(shutdown_decrypt_executor)
+    return _decrypt_executor
+
+
+def shutdown_decrypt_executor():
+    """Arrête le pool de déchiffrement s'il existe ; un prochain gros volume en recrée un."""
+    global _decrypt_executor
+    with _decrypt_executor_lock:
+        executor, _decrypt_executor = _decrypt_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _map_chunks(func, values, chunk_size):
+    """Applique `func` par lots, sur le pool de processus si le volume le justifie."""
+    values = list(values)
+    chunk_size = chunk_size or DECRYPT_CHUNK_SIZE
+    if DECRYPT_WORKERS <= 1 or len(values) <= chunk_size:
+        return func(values)
+
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    results = []
+    for chunk in _get_decrypt_executor().map(func, chunks):
+        results.extend(chunk)
+    return results
+
+
+def decrypt_many(values, chunk_size=None):
+    """
+    Déchiffre une série de valeurs Fernet en conservant leur ordre.
+
+    Fernet s'exécute essentiellement sous le GIL : les gros volumes sont donc
+    découpés en lots répartis sur un pool de processus. Les petits volumes
+    (un lot ou moins), ou DECRYPT_WORKERS <= 1, sont traités sur place.
+    """
+    return _map_chunks(_decrypt_chunk, values, chunk_size)
+
+
+def encrypt_many(values, chunk_size=None):
+    """Chiffre une série de valeurs en conservant leur ordre (même pool que decrypt_many)."""
+    return _map_chunks(_encrypt_chunk, values, chunk_size)
+
+
+# Clé, dans le __dict__ des instances, du cache {colonne: (chiffré, clair)}
+_PLAINTEXT_CACHE = "_plaintext_cache"
+
+
+def _plaintext_cache(instance):
+    cache = instance.__dict__.get(_PLAINTEXT_CACHE)
+    if cache is None:
+        cache = instance.__dict__[_PLAINTEXT_CACHE] = {}
+    return cache
+
+
+def encrypted_property(column_key, blind_index_key=None):
+    """
+    Attribut chiffré à déchiffrement différé.
+
+    La colonne `column_key` contient le chiffré Fernet tel qu'en base : rien n'est
+    déchiffré au chargement. La valeur claire est calculée à la première lecture
+    puis mémorisée sur l'instance (tant que le chiffré ne change pas).
+    L'affectation chiffre la valeur et met à jour l'index aveugle `blind_index_key`.
+
+    Au niveau de la classe, seules `==`, `!=` et `in_` sont permises, et seulement
+    avec un index aveugle (`Clients.email == "x"` devient `email_bidx == blind_index("x")`).
+    Toute autre expression lève TypeError : le chiffré Fernet ne se compare pas.
+    """
+    def fget(self):
+        ciphertext = getattr(self, column_key)
+        cache = _plaintext_cache(self)
+        if column_key in cache and cache[column_key][0] == ciphertext:
+            return cache[column_key][1]
+        plaintext = decrypt_value(ciphertext)
+        cache[column_key] = (ciphertext, plaintext)
+        return plaintext
+
+    def fset(self, value):
+        if value is not None and not isinstance(value, str):
             value = str(value)
-        return fernet.encrypt(value.encode()).decode()
+        # Même valeur claire : on garde le chiffré existant (pas d'UPDATE inutile)
+        if getattr(self, column_key) is not None and fget(self) == value:
+            return
+        ciphertext = encrypt_value(value)
+        setattr(self, column_key, ciphertext)
+        _plaintext_cache(self)[column_key] = (ciphertext, value)
+        if blind_index_key:
+            setattr(self, blind_index_key, blind_index(value))
+
+    def comparator(cls):
+        index = getattr(cls, blind_index_key) if blind_index_key else None
+        return _EncryptedComparator(index, f"{cls.__name__}.{fget.__name__}")
+
+    fget.__name__ = column_key.lstrip("_")
+    prop = hybrid_property(fget, fset, custom_comparator=comparator)
+    fget.column_key = column_key
+    return prop
+
+
+class _EncryptedComparator(Comparator):
+    """Expression de classe d'un attribut chiffré : égalité via l'index aveugle, rien d'autre."""
+
+    def __init__(self, index, name):
+        super().__init__(index)
+        self.name = name
+
+    def _index(self):
+        if self.expression is None:
+            raise TypeError(f"{self.name} est chiffré sans index aveugle : il ne peut pas servir dans une requête.")
+        return self.expression
+
+    def __eq__(self, other):
+        return self._index() == blind_index(other)
+
+    def __ne__(self, other):
+        return self._index() != blind_index(other)
+
+    def in_(self, other):
+        return self._index().in_([blind_index(value) for value in other])
+
+    def operate(self, op, *other, **kwargs):
+        raise TypeError(f"{self.name} est chiffré : seules ==, != et in_ (via l'index aveugle) sont permises.")
+
+    def reverse_operate(self, op, other, **kwargs):
+        return self.operate(op, other, **kwargs)
+
+    def __clause_element__(self):
+        return self.operate(None)
+
+
+def prefetch_decrypted(instances, *names):
+    """
+    Déchiffre en masse les attributs `names` (créés par `encrypted_property`)
+    d'une liste d'instances et remplit leur cache, pour les écrans qui affichent
+    ces champs sur toutes les lignes. Retourne la liste des instances.
+    """
+    instances = list(instances)
+    if not instances:
+        return instances
+
+    mapper_descriptors = type(instances[0]).__mapper__.all_orm_descriptors
+    for name in names:
+        column_key = mapper_descriptors[name].fget.column_key
+        ciphertexts = [getattr(instance, column_key) for instance in instances]
+        for instance, ciphertext, plaintext in zip(instances, ciphertexts, decrypt_many(ciphertexts)):
+            _plaintext_cache(instance)[column_key] = (ciphertext, plaintext)
+
+    return instances
 
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        return fernet.decrypt(value.encode()).decode()
@@ -0,0 +1,139 @@
+"""
+Agrégats de chiffre d'affaires et de créances, par commercial et par client.
+
+Les tables commercial_revenue et client_revenue sont tenues à jour dans la
+transaction qui modifie les contrats (événements ORM d'insertion, de modification
+et de suppression) : chaque écriture applique un delta par UPSERT, sans relire
+les autres contrats. Le tableau de bord lit donc une ligne par commercial.
+
+Les insertions hors ORM (insert() en masse) ne passent pas par ces événements :
+rebuild_revenue (revenue_summary.py --rebuild) recalcule alors tout.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from .base import Base
+from .contract import Contracts
+from .types import Money, to_money
+
+
+class RevenueColumns:
+    """Colonnes communes aux deux agrégats."""
+
+    contracts = Column(Integer, nullable=False, default=0)
+    signed_contracts = Column(Integer, nullable=False, default=0)
+    signed_total = Column(Money, nullable=False, default=0)     # total_amount des contrats signés
+    amount_due = Column(Money, nullable=False, default=0)       # reste dû, tous contrats
+    unpaid_contracts = Column(Integer, nullable=False, default=0)
+
+
+class CommercialRevenue(RevenueColumns, Base):
+    __tablename__ = 'commercial_revenue'
+
+    commercial_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+
+
+class ClientRevenue(RevenueColumns, Base):
+    __tablename__ = 'client_revenue'
+
+    client_id = Column(Integer, ForeignKey('clients.id'), primary_key=True)
+
+    # Clients ayant le plus de créances (tableau de bord)
+    __table_args__ = (
+        Index('ix_client_revenue_amount_due', 'amount_due'),
+    )
+
+
+REVENUE_COLUMNS = ("contracts", "signed_contracts", "signed_total", "amount_due", "unpaid_contracts")
+
+# Agrégat -> (modèle, colonne du contrat qui en est la clé)
+REVENUE_SCOPES = {
+    "commercial": (CommercialRevenue, "commercial_id"),
+    "client": (ClientRevenue, "client_id"),
+}
+
+_TRACKED = ("commercial_id", "client_id", "total_amount", "amount_due", "is_signed")
+
+
+def contribution(total_amount, amount_due, is_signed):
+    """Part d'un contrat dans les agrégats de son commercial et de son client."""
+    signed = bool(is_signed)
+    due = to_money(amount_due or 0)
+    return {
+        "contracts": 1,
+        "signed_contracts": int(signed),
+        "signed_total": to_money(total_amount or 0) if signed else 0,
+        "amount_due": due,
+        "unpaid_contracts": int(due > 0),
+    }
+
+
+def _add(deltas, scope, key, values, sign):
+    if key is None:
+        return
+    delta = deltas.setdefault((scope, key), dict.fromkeys(REVENUE_COLUMNS, 0))
+    for column, value in values.items():
+        delta[column] += sign * value
+
+
+def _record(deltas, values, sign):
+    part = contribution(values["total_amount"], values["amount_due"], values["is_signed"])
+    for scope, (_, key_column) in REVENUE_SCOPES.items():
+        _add(deltas, scope, values[key_column], part, sign)
+
+
+def apply_revenue_deltas(connection, deltas):
+    """Ajoute les deltas {(agrégat, clé): {colonne: delta}} par INSERT ... ON CONFLICT DO UPDATE."""
+    dialect = {"sqlite": sqlite, "postgresql": postgresql}.get(connection.dialect.name)
+    if dialect is None:
+        return
+    for (scope, key), delta in deltas.items():
+        if not any(delta.values()):
+            continue
+        model, key_column = REVENUE_SCOPES[scope]
+        table = model.__table__
+        statement = dialect.insert(table).values({key_column: key, **delta})
+        statement = statement.on_conflict_do_update(
+            index_elements=[key_column],
+            set_={column: table.c[column] + statement.excluded[column] for column in REVENUE_COLUMNS},
+        )
+        connection.execute(statement)
+
+
+def _old_values(target):
+    """Valeurs du contrat avant la modification en cours."""
+    state = inspect(target)
+    values = {}
+    for name in _TRACKED:
+        history = state.attrs[name].history
+        values[name] = history.deleted[0] if history.deleted else getattr(target, name)
+    return values
+
+
+def _current_values(target):
+    return {name: getattr(target, name) for name in _TRACKED}
+
+
+@event.listens_for(Contracts, "after_insert")
+def _contract_inserted(mapper, connection, target):
+    deltas = {}
+    _record(deltas, _current_values(target), 1)
+    apply_revenue_deltas(connection, deltas)
+
+
+@event.listens_for(Contracts, "after_update")
+def _contract_updated(mapper, connection, target):
+    old, new = _old_values(target), _current_values(target)
+    if old == new:
+        return
+    deltas = {}
+    _record(deltas, old, -1)
+    _record(deltas, new, 1)
+    apply_revenue_deltas(connection, deltas)
+
+
+@event.listens_for(Contracts, "after_delete")
+def _contract_deleted(mapper, connection, target):
+    deltas = {}
+    _record(deltas, _old_values(target), -1)
+    apply_revenue_deltas(connection, deltas)
@@ -0,0 +1,100 @@
+"""
+Index plein texte (SQLite FTS5) des clients et des événements.
+
+Les tables clients_fts et events_fts ont pour rowid l'id de la ligne indexée et ne
+contiennent que des champs en clair : les champs chiffrés (email, téléphone) n'y
+figurent jamais, la recherche exacte par email passe par l'index aveugle.
+
+Elles sont créées avec le schéma (événement after_create de la metadata) et tenues
+à jour par les événements ORM d'insertion, de modification et de suppression.
+Sur un autre moteur que SQLite, rien n'est créé ni synchronisé.
+"""
+
+from sqlalchemy import DDL, event, inspect, text
+from .base import Base
+from .client import Clients
+from .event import Events
+
+# Table FTS -> (modèle, colonnes indexées, poids bm25 de chaque colonne)
+SEARCH_INDEXES = {
+    "clients_fts": (Clients, ("last_name", "first_name", "company_name"), (10.0, 5.0, 3.0)),
+    "events_fts": (Events, ("name", "location", "notes"), (10.0, 5.0, 1.0)),
+}
+
+
+def _create_statements(table, columns, weights):
+    # remove_diacritics : "elise" trouve "Élise" ; prefix : index des préfixes de 2 à 4
+    # caractères, pour que les recherches "dur*" ne parcourent pas tout le vocabulaire
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+        f"{', '.join(columns)}, tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')",
+        f"INSERT INTO {table}({table}, rank) VALUES('rank', 'bm25({', '.join(map(str, weights))})')",
+    ]
+
+
+def create_search_tables(connection):
+    """Crée les tables FTS5 (si besoin) et fixe le classement bm25 pondéré."""
+    for table, (_, columns, weights) in SEARCH_INDEXES.items():
+        for statement in _create_statements(table, columns, weights):
+            connection.exec_driver_sql(statement)
+
+
+def rebuild_search_index(connection):
+    """Reconstruit entièrement l'index à partir des tables (bases existantes, réparation)."""
+    for table, (model, columns, _) in SEARCH_INDEXES.items():
+        connection.exec_driver_sql(f"DELETE FROM {table}")
+        connection.exec_driver_sql(
+            f"INSERT INTO {table}(rowid, {', '.join(columns)}) "
+            f"SELECT id, {', '.join(columns)} FROM {model.__tablename__}"
+        )
+
+
+def index_rows(connection, table, rows):
+    """
+    (Ré)indexe des lignes : `rows` sont des dicts portant l'id et les colonnes indexées.
+    Utilisé par les événements ORM et par les insertions en masse (hors ORM).
+    """
+    if connection.dialect.name != "sqlite" or not rows:
+        return
+    _, columns, _ = SEARCH_INDEXES[table]
+    connection.execute(text(f"DELETE FROM {table} WHERE rowid = :id"), [{"id": row["id"]} for row in rows])
+    connection.execute(
+        text(f"INSERT INTO {table}(rowid, {', '.join(columns)}) "
+             f"VALUES (:id, {', '.join(':' + column for column in columns)})"),
+        [{"id": row["id"], **{column: row[column] for column in columns}} for row in rows],
+    )
+
+
+def _row(target, columns):
+    return {"id": target.id, **{column: getattr(target, column) for column in columns}}
+
+
+def _register_sync(table, model, columns):
+    @event.listens_for(model, "after_insert")
+    def index_inserted(mapper, connection, target):
+        index_rows(connection, table, [_row(target, columns)])
+
+    @event.listens_for(model, "after_update")
+    def index_updated(mapper, connection, target):
+        state = inspect(target)
+        if any(state.attrs[column].history.has_changes() for column in columns):
+            index_rows(connection, table, [_row(target, columns)])
+
+    @event.listens_for(model, "after_delete")
+    def unindex_deleted(mapper, connection, target):
+        if connection.dialect.name == "sqlite":
+            connection.execute(text(f"DELETE FROM {table} WHERE rowid = :id"), {"id": target.id})
+
+
+for _table, (_model, _columns, _) in SEARCH_INDEXES.items():
+    _register_sync(_table, _model, _columns)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_tables(metadata, connection, **kwargs):
+    if connection.dialect.name == "sqlite":
+        create_search_tables(connection)
+
+
+for _table in SEARCH_INDEXES:
+    event.listen(Base.metadata, "before_drop", DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"))
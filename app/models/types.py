@@ -0,0 +1,48 @@
+"""
+Montants exacts : stockés en centimes (entier), exposés en Decimal à deux décimales.
+
+Les sommes et les comparaisons (amount_due == 0, > 0) se font donc sur des entiers,
+sans dérive d'arrondi, en Python comme en SQL.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+
+def to_money(value):
+    """Convertit un montant (Decimal, int, float, str) en Decimal arrondi au centime."""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        value = repr(value)  # 0.1 -> "0.1", et non 0.1000000000000000055...
+    return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def to_cents(value):
+    """Montant -> nombre entier de centimes."""
+    money = to_money(value)
+    return None if money is None else int(money * 100)
+
+
+def from_cents(cents):
+    """Nombre de centimes -> Decimal à deux décimales."""
+    return None if cents is None else Decimal(int(cents)).scaleb(-2)
+
+
+class Money(TypeDecorator):
+    """Colonne monétaire : BIGINT de centimes en base, Decimal côté Python."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return to_cents(value)
+
+    def process_literal_param(self, value, dialect):
+        return str(to_cents(value))
+
+    def process_result_value(self, value, dialect):
+        return from_cents(value)
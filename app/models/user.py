@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from .base import Base
-from .mixins import EncryptedString
+from .mixins import encrypted_property
 
 class Users(Base):
     __tablename__ = 'users'
@@ -10,10 +10,16 @@ class Users(Base):
     username = Column(String, unique=True, nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
-    email = Column(EncryptedString, unique=True, nullable=False)
+    # Email chiffré (Fernet), déchiffré à la lecture de l'attribut email
+    _email = Column('email', String, nullable=False)
+    email_bidx = Column(String(64), unique=True, index=True)
     hashed_password = Column(String, nullable=False)
     role_id = Column(Integer, ForeignKey('roles.id'), nullable=False)
 
-    role = relationship('Roles')
+    # Le rôle est lu à chaque contrôle d'accès : chargé par jointure avec l'utilisateur
+    role = relationship('Roles', lazy='joined')
     created_clients = relationship('Clients', back_populates='commercial')
     assigned_events = relationship('Events', back_populates='support_contact')
+
+    email = encrypted_property('_email', blind_index_key='email_bidx')
+
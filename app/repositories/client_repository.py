@@ -1,5 +1,79 @@
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from app.models import Clients
+from app.models.mixins import blind_index, prefetch_decrypted
+from app.models.search import SEARCH_INDEXES, index_rows
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE, keyset_page
 
-def get_all_clients(session: Session):
-    return session.query(Clients).order_by(Clients.last_name).all()
+def get_all_clients(session: Session, decrypt=()):
+    """
+    Récupère tous les clients triés par nom.
+    Les champs chiffrés sont déchiffrés à la lecture ; ceux listés dans `decrypt`
+    (ex. ("email",) pour un écran qui les affiche tous) sont déchiffrés en masse.
+    """
+    clients = session.query(Clients).order_by(Clients.last_name).all()
+    return prefetch_decrypted(clients, *decrypt)
+
+
+def get_clients_page(session: Session, after=None, limit=DEFAULT_PAGE_SIZE, decrypt=()):
+    """
+    Récupère une page de clients triés par nom (curseur : (last_name, id)).
+    Retourne (clients, curseur de la page suivante ou None).
+    """
+    clients, next_cursor = keyset_page(
+        session.query(Clients), (Clients.last_name, Clients.id), after=after, limit=limit
+    )
+    return prefetch_decrypted(clients, *decrypt), next_cursor
+
+
+def get_client_by_email(session: Session, email, exclude_id=None):
+    """
+    Recherche un client par email via l'index aveugle (requête indexée,
+    sans déchiffrer la table).
+    """
+    query = session.query(Clients).filter_by(email_bidx=blind_index(email))
+    if exclude_id is not None:
+        query = query.filter(Clients.id != exclude_id)
+    return query.first()
+
+
+def get_existing_blind_indexes(session: Session, blind_indexes):
+    """Parmi les index aveugles `blind_indexes`, retourne (set) ceux déjà en base, en une requête."""
+    if not blind_indexes:
+        return set()
+    return set(session.scalars(select(Clients.email_bidx).where(Clients.email_bidx.in_(blind_indexes))))
+
+
+def insert_clients(session: Session, rows):
+    """
+    Insère des clients en un seul executemany, sans passer par l'ORM.
+    Les lignes portent les colonnes de la table (email et phone déjà chiffrés).
+    Les événements ORM ne s'appliquant pas ici, les clients insérés sont ajoutés
+    explicitement à l'index plein texte. Retourne leurs ids, dans l'ordre de `rows`.
+    """
+    if not rows:
+        return []
+    table = Clients.__table__
+    ids = session.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+    _, columns, _ = SEARCH_INDEXES["clients_fts"]
+    index_rows(session.connection(), "clients_fts", [
+        {"id": client_id, **{column: row[column] for column in columns}}
+        for client_id, row in zip(ids, rows)
+    ])
+    return ids
+
+
+def iter_clients(session: Session, commercial_id=None, batch_size=DEFAULT_BATCH_SIZE, decrypt=()):
+    """
+    Parcourt les clients (ceux de `commercial_id` si indiqué) par lots de `batch_size`,
+    sans tout charger en mémoire (yield_per : curseur côté serveur si le pilote le permet).
+    Les champs listés dans `decrypt` sont déchiffrés en masse, lot par lot.
+    """
+    query = select(Clients).order_by(Clients.id)
+    if commercial_id is not None:
+        query = query.where(Clients.commercial_id == commercial_id)
+    result = session.execute(query.execution_options(yield_per=batch_size)).scalars()
+    for batch in result.partitions():
+        yield prefetch_decrypted(batch, *decrypt)
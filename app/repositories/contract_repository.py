@@ -1,5 +1,8 @@
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session, joinedload
-from app.models import Contracts
+from app.models import Clients, Contracts
+from app.repositories.load_profiles import with_profile
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE, keyset_page
 
 def get_all_contracts(session: Session):
     """
@@ -10,4 +13,74 @@ def get_all_contracts(session: Session):
         .options(joinedload(Contracts.client))
         .order_by(Contracts.date_created.desc())
         .all()
-    )
\ No newline at end of file
+    )
+
+
+def get_contracts_page(session: Session, after=None, limit=DEFAULT_PAGE_SIZE, criteria=(), commercial_id=None,
+                       profile="contract_list"):
+    """
+    Récupère une page de contrats, du plus récent au plus ancien, avec les relations
+    du profil de chargement `profile` (curseur : (date_created, id)).
+    `criteria` sont des conditions de filtre supplémentaires ; `commercial_id`
+    restreint aux contrats des clients de ce commercial.
+    Retourne (contrats, curseur de la page suivante ou None).
+    """
+    query = session.query(Contracts)
+    if commercial_id is not None:
+        query = query.join(Contracts.client).filter(Clients.commercial_id == commercial_id)
+    query = with_profile(query, profile, client_joined=commercial_id is not None)
+    if criteria:
+        query = query.filter(*criteria)
+
+    return keyset_page(
+        query,
+        (Contracts.date_created, Contracts.id),
+        after=after,
+        limit=limit,
+        descending=True,
+    )
+
+
+def get_contracts(session: Session, commercial_id=None, profile="contract_list"):
+    """
+    Récupère les contrats (ceux des clients de `commercial_id` si indiqué),
+    avec les relations du profil de chargement `profile`.
+    """
+    query = session.query(Contracts)
+    if commercial_id is not None:
+        query = query.join(Contracts.client).filter(Clients.commercial_id == commercial_id)
+    return with_profile(query, profile, client_joined=commercial_id is not None).order_by(Contracts.id).all()
+
+
+def iter_contracts(session: Session, commercial_id=None, batch_size=DEFAULT_BATCH_SIZE, profile="contract_list"):
+    """
+    Parcourt les contrats (ceux des clients de `commercial_id` si indiqué) par lots
+    de `batch_size`, avec les relations du profil `profile`, sans tout charger en mémoire.
+    """
+    query = select(Contracts).order_by(Contracts.id)
+    if commercial_id is not None:
+        query = query.join(Contracts.client).where(Clients.commercial_id == commercial_id)
+    query = with_profile(query, profile, client_joined=commercial_id is not None)
+    result = session.execute(query.execution_options(yield_per=batch_size)).scalars()
+    yield from result.partitions()
+
+
+def get_contract_totals(session: Session, criteria=(), commercial_id=None):
+    """
+    Totaux des contrats vérifiant `criteria` (restreints aux clients de `commercial_id`),
+    calculés par la base en une requête : sommes exactes en centimes, rendues en Decimal.
+    Retourne {"contracts", "signed_contracts", "total_amount", "signed_total", "amount_due"}.
+    """
+    signed = Contracts.is_signed == True  # noqa: E712
+    query = select(
+        func.count(Contracts.id).label("contracts"),
+        func.coalesce(func.sum(case((signed, 1), else_=0)), 0).label("signed_contracts"),
+        func.coalesce(func.sum(Contracts.total_amount), 0).label("total_amount"),
+        func.coalesce(func.sum(case((signed, Contracts.total_amount), else_=0)), 0).label("signed_total"),
+        func.coalesce(func.sum(Contracts.amount_due), 0).label("amount_due"),
+    )
+    if commercial_id is not None:
+        query = query.join(Contracts.client).where(Clients.commercial_id == commercial_id)
+    if criteria:
+        query = query.where(*criteria)
+    return dict(session.execute(query).one()._mapping)
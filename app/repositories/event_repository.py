@@ -1,13 +1,143 @@
-from sqlalchemy.orm import Session, joinedload
-from app.models import Events
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+from app.models import Clients, Events
+from app.repositories.load_profiles import with_profile
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE, keyset_page
 
-def get_all_events(session: Session):
+def get_all_events(session: Session, profile="event_list"):
     """
-    Récupère tous les contrats, avec leur client préchargé.
+    Récupère tous les événements, avec les relations du profil de chargement `profile`.
     """
     return (
-        session.query(Events)
-        .options(joinedload(Events.client))
+        with_profile(session.query(Events), profile)
         .order_by(Events.date_start.desc())
         .all()
-    )
\ No newline at end of file
+    )
+
+
+def get_events_page(session: Session, after=None, limit=DEFAULT_PAGE_SIZE, profile="event_list"):
+    """
+    Récupère une page d'événements, du plus tardif au plus ancien, avec les relations
+    du profil de chargement `profile` (curseur : (date_start, id)).
+    Retourne (événements, curseur de la page suivante ou None).
+    """
+    return keyset_page(
+        with_profile(session.query(Events), profile),
+        (Events.date_start, Events.id),
+        after=after,
+        limit=limit,
+        descending=True,
+    )
+
+
+def get_events(session: Session, criteria=(), profile="event_list", order_by=None):
+    """
+    Récupère les événements vérifiant `criteria`, triés par `order_by` (par défaut
+    date de début croissante), avec les relations du profil de chargement `profile`.
+    """
+    query = with_profile(session.query(Events), profile)
+    if criteria:
+        query = query.filter(*criteria)
+    return query.order_by(Events.date_start if order_by is None else order_by).all()
+
+
+def iter_events(session: Session, commercial_id=None, support_contact_id=None, batch_size=DEFAULT_BATCH_SIZE,
+                profile="event_list"):
+    """
+    Parcourt les événements par lots de `batch_size`, sans tout charger en mémoire.
+    `commercial_id` restreint aux événements des clients de ce commercial,
+    `support_contact_id` à ceux assignés à ce support.
+    """
+    query = with_profile(select(Events), profile).order_by(Events.id)
+    if commercial_id is not None:
+        query = query.join(Events.client).where(Clients.commercial_id == commercial_id)
+    if support_contact_id is not None:
+        query = query.where(Events.support_contact_id == support_contact_id)
+    result = session.execute(query.execution_options(yield_per=batch_size)).scalars()
+    yield from result.partitions()
+
+
+# Clés de planning : un support ou un lieu ne peut pas être sur deux événements à la fois
+SCHEDULE_KEYS = {
+    "support": Events.support_contact_id,
+    "location": Events.location,
+}
+
+
+def find_overlapping_event(session: Session, key, value, date_start, date_end, exclude_id=None):
+    """
+    Retourne un événement de même clé (`key` : "support" ou "location", valeur `value`)
+    dont la période [date_start, date_end] (bornes incluses) chevauche celle donnée, ou None.
+
+    Vrai test de chevauchement, correct même si le planning existant contient déjà des
+    conflits. Le tri par date_end suit l'index (clé, date_end, date_start) : le parcours
+    se limite aux événements de la clé qui finissent après `date_start` (le planning à
+    venir, pas l'historique), date_start est vérifiée dans l'index, sans lire la table,
+    et le premier chevauchement trouvé (celui qui finit le plus tôt) est retourné.
+    """
+    query = session.query(Events).filter(
+        SCHEDULE_KEYS[key] == value,
+        Events.date_end >= date_start,
+        Events.date_start <= date_end,
+    )
+    if exclude_id is not None:
+        query = query.filter(Events.id != exclude_id)
+    return query.order_by(Events.date_end).limit(1).first()
+
+
+def iter_schedule(session: Session, key, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Parcourt par lots les événements ayant une clé de planning `key` renseignée,
+    triés par (clé, date_start) : lignes (clé, id, nom, date_start, date_end).
+    """
+    column = SCHEDULE_KEYS[key]
+    query = (
+        select(column, Events.id, Events.name, Events.date_start, Events.date_end)
+        .where(column.is_not(None))
+        .order_by(column, Events.date_start, Events.id)
+    )
+    result = session.execute(query.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+
+def get_unassigned_events(session: Session, since):
+    """
+    Événements sans support qui ne sont pas terminés à `since`, par date de début :
+    lignes (id, date_start, date_end, attendees).
+    """
+    return session.execute(
+        select(Events.id, Events.date_start, Events.date_end, Events.attendees)
+        .where(Events.support_contact_id.is_(None), Events.date_end >= since)
+        .order_by(Events.date_start, Events.id)
+    ).all()
+
+
+def get_support_schedule(session: Session, since):
+    """
+    Événements affectés qui ne sont pas terminés à `since` :
+    lignes (support_contact_id, date_start, date_end, attendees).
+    """
+    return session.execute(
+        select(Events.support_contact_id, Events.date_start, Events.date_end, Events.attendees)
+        .where(Events.support_contact_id.is_not(None), Events.date_end >= since)
+    ).all()
+
+
+def assign_support_contacts(session: Session, assignments):
+    """
+    Affecte en une requête groupée (executemany) les supports aux événements :
+    `assignments` est une liste de (event_id, support_id). Les événements qui ont reçu
+    un support entre-temps ne sont pas modifiés. Retourne le nombre d'événements affectés.
+    """
+    if not assignments:
+        return 0
+    table = Events.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("event_id"), table.c.support_contact_id.is_(None))
+        .values(support_contact_id=bindparam("support_id"))
+    )
+    result = session.execute(
+        statement, [{"event_id": event_id, "support_id": support_id} for event_id, support_id in assignments]
+    )
+    return result.rowcount
@@ -0,0 +1,35 @@
+from sqlalchemy.orm import contains_eager, joinedload
+from app.models import Clients, Contracts, Events
+
+# Relations chargées d'avance pour chaque écran : chaque liste s'exécute en un
+# nombre borné de requêtes, quel que soit le nombre de lignes affichées.
+# (Users.role est toujours chargé par jointure, cf. app/models/user.py.)
+LOAD_PROFILES = {
+    # show_all_contracts_view, update_contract_view : nom du client
+    "contract_list": (joinedload(Contracts.client),),
+    # filter_contracts_view : nom du client et de son commercial
+    "contract_filter": (joinedload(Contracts.client).joinedload(Clients.commercial),),
+    # show_all_events_view, update_event_view, filter_events_view : client et support
+    "event_list": (joinedload(Events.client), joinedload(Events.support_contact)),
+    # show_user_events_view : le support est l'utilisateur connecté
+    "event_user": (joinedload(Events.client),),
+}
+
+
+# Mêmes profils pour une requête de contrats déjà jointe à clients (filtre par
+# commercial) : le client est lu dans cette jointure au lieu d'une seconde
+CLIENT_JOINED_PROFILES = {
+    "contract_list": (contains_eager(Contracts.client),),
+    "contract_filter": (contains_eager(Contracts.client).joinedload(Clients.commercial),),
+}
+
+
+def with_profile(query, profile, client_joined=False):
+    """
+    Applique à `query` les options de chargement du profil `profile` (None : aucune).
+    `client_joined` : la requête joint déjà Contracts.client (CLIENT_JOINED_PROFILES).
+    """
+    if profile is None:
+        return query
+    profiles = CLIENT_JOINED_PROFILES if client_joined else LOAD_PROFILES
+    return query.options(*profiles[profile])
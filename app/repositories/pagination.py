@@ -0,0 +1,36 @@
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+
+# Taille des lots des parcours complets (exports) en yield_per
+DEFAULT_BATCH_SIZE = 1000
+
+
+def keyset_page(query, columns, after=None, limit=DEFAULT_PAGE_SIZE, descending=False):
+    """
+    Pagination par curseur (keyset) d'une requête ORM.
+
+    `columns` sont les colonnes de tri, la dernière devant être unique (l'id)
+    pour départager les ex æquo. `after` est le curseur renvoyé par la page
+    précédente : la requête reprend juste après lui grâce à une comparaison de
+    tuples, au lieu d'un OFFSET qui relirait toutes les lignes précédentes.
+
+    Retourne (éléments, curseur de la page suivante ou None).
+    """
+    if descending:
+        query = query.order_by(*(column.desc() for column in columns))
+    else:
+        query = query.order_by(*columns)
+
+    if after is not None:
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    # Une ligne de plus pour savoir s'il existe une page suivante
+    items = query.limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, tuple(getattr(last, column.key) for column in columns)
@@ -0,0 +1,77 @@
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.orm import Session
+from app.models import Clients, Contracts, Users
+from app.models.revenue import REVENUE_COLUMNS, REVENUE_SCOPES
+
+DEFAULT_TOP_CLIENTS = 10
+
+
+def get_commercial_revenue(session: Session):
+    """
+    Agrégats de tous les commerciaux (une ligne par commercial ayant des contrats),
+    avec le commercial : liste de (Users, CommercialRevenue), par créances décroissantes.
+    """
+    model, _ = REVENUE_SCOPES["commercial"]
+    return session.execute(
+        select(Users, model)
+        .join(model, model.commercial_id == Users.id)
+        .order_by(model.amount_due.desc(), Users.id)
+    ).all()
+
+
+def get_top_clients_by_amount_due(session: Session, limit=DEFAULT_TOP_CLIENTS):
+    """Les `limit` clients ayant le plus de créances : liste de (Clients, ClientRevenue)."""
+    model, _ = REVENUE_SCOPES["client"]
+    return session.execute(
+        select(Clients, model)
+        .join(model, model.client_id == Clients.id)
+        .where(model.amount_due > 0)
+        .order_by(model.amount_due.desc())
+        .limit(limit)
+    ).all()
+
+
+def _aggregate_query(scope):
+    """Agrégats recalculés à partir des contrats : (clé, contracts, signed_contracts, ...)."""
+    _, key_column = REVENUE_SCOPES[scope]
+    key = Contracts.__table__.c[key_column]
+    signed = Contracts.is_signed == True  # noqa: E712
+    return (
+        select(
+            key,
+            func.count(),
+            func.coalesce(func.sum(case((signed, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((signed, Contracts.total_amount), else_=0)), 0),
+            func.coalesce(func.sum(Contracts.amount_due), 0),
+            func.coalesce(func.sum(case((Contracts.amount_due > 0, 1), else_=0)), 0),
+        )
+        .where(key.is_not(None))
+        .group_by(key)
+    )
+
+
+def rebuild_revenue(session: Session):
+    """Recalcule entièrement les deux agrégats à partir des contrats (INSERT ... SELECT)."""
+    for scope, (model, key_column) in REVENUE_SCOPES.items():
+        session.execute(delete(model))
+        session.execute(
+            insert(model).from_select([key_column, *REVENUE_COLUMNS], _aggregate_query(scope))
+        )
+
+
+def compute_revenue(session: Session, scope):
+    """Agrégats attendus, recalculés à partir des contrats : {clé: {colonne: valeur}}."""
+    return {
+        row[0]: dict(zip(REVENUE_COLUMNS, row[1:]))
+        for row in session.execute(_aggregate_query(scope))
+    }
+
+
+def get_stored_revenue(session: Session, scope):
+    """Agrégats enregistrés : {clé: {colonne: valeur}}."""
+    model, key_column = REVENUE_SCOPES[scope]
+    table = model.__table__
+    return {
+        row[0]: dict(zip(REVENUE_COLUMNS, row[1:]))
+        for row in session.execute(select(table.c[key_column], *(table.c[c] for c in REVENUE_COLUMNS)))
+    }
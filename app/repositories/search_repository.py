@@ -0,0 +1,64 @@
+import re
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Session
+from app.models import Clients, Events
+from app.models.search import SEARCH_INDEXES
+from app.repositories.load_profiles import with_profile
+
+DEFAULT_SEARCH_LIMIT = 20
+
+
+def build_match_query(terms):
+    """
+    Transforme la saisie en requête FTS5 : chaque mot devient un préfixe ("dur"*),
+    les mots sont combinés en ET. Les caractères spéciaux FTS5 sont neutralisés.
+    Retourne None si la saisie ne contient aucun mot.
+    """
+    words = re.findall(r"\w+", terms)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _ranked_ids(session, table, match, limit):
+    # ORDER BY rank LIMIT n : FTS5 classe toutes les correspondances et ne garde que les n meilleures
+    rows = session.execute(
+        text(f"SELECT rowid FROM {table} WHERE {table} MATCH :match ORDER BY rank LIMIT :limit"),
+        {"match": match, "limit": limit},
+    )
+    return [row_id for row_id, in rows]
+
+
+def _load_in_order(session, query, model, ids):
+    by_id = {item.id: item for item in query.filter(model.id.in_(ids)).all()} if ids else {}
+    return [by_id[row_id] for row_id in ids if row_id in by_id]
+
+
+def _like_filter(model, columns, terms):
+    """Repli hors SQLite : chaque mot doit apparaître dans l'une des colonnes."""
+    words = re.findall(r"\w+", terms)
+    return and_(*(
+        or_(*(getattr(model, column).ilike(f"%{word}%") for column in columns))
+        for word in words
+    ))
+
+
+def _search(session, table, query, terms, limit):
+    model, columns, _ = SEARCH_INDEXES[table]
+    match = build_match_query(terms)
+    if match is None:
+        return []
+    if session.get_bind().dialect.name != "sqlite":
+        return query.filter(_like_filter(model, columns, terms)).order_by(model.id).limit(limit).all()
+    return _load_in_order(session, query, model, _ranked_ids(session, table, match, limit))
+
+
+def search_clients(session: Session, terms, limit=DEFAULT_SEARCH_LIMIT):
+    """Clients dont le nom, le prénom ou l'entreprise commencent par les mots saisis, les plus pertinents d'abord."""
+    return _search(session, "clients_fts", session.query(Clients), terms, limit)
+
+
+def search_events(session: Session, terms, limit=DEFAULT_SEARCH_LIMIT):
+    """Événements dont le nom, le lieu ou les notes contiennent les mots saisis (préfixes), classés par pertinence."""
+    query = with_profile(session.query(Events), "event_user")
+    return _search(session, "events_fts", query, terms, limit)
@@ -0,0 +1,31 @@
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.models import Roles, Users
+from app.models.mixins import blind_index
+
+
+def get_user_by_email(session: Session, email, exclude_id=None):
+    """
+    Recherche un utilisateur par email via l'index aveugle.
+    `exclude_id` permet d'ignorer l'utilisateur en cours de modification.
+    """
+    query = session.query(Users).filter_by(email_bidx=blind_index(email))
+    if exclude_id is not None:
+        query = query.filter(Users.id != exclude_id)
+    return query.first()
+
+
+def get_user_by_login(session: Session, username_or_email):
+    """
+    Recherche un utilisateur par nom d'utilisateur ou par email (index aveugle).
+    """
+    return session.query(Users).filter(
+        or_(Users.email_bidx == blind_index(username_or_email), Users.username == username_or_email)
+    ).first()
+
+
+def get_users_by_role(session: Session, role_name):
+    """
+    Récupère les utilisateurs d'un rôle, par id.
+    """
+    return session.query(Users).join(Users.role).filter(Roles.name == role_name).order_by(Users.id).all()
@@ -1,4 +1,30 @@
 from app.repositories.client_repository import get_all_clients as repo_get_all_clients
+from app.repositories.client_repository import get_clients_page as repo_get_clients_page
+from app.repositories.client_repository import get_client_by_email as repo_get_client_by_email
+from app.repositories.client_repository import get_existing_blind_indexes as repo_get_existing_blind_indexes
+from app.repositories.client_repository import insert_clients as repo_insert_clients
+from app.repositories.client_repository import iter_clients as repo_iter_clients
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 
-def get_all_clients(session):
-    return repo_get_all_clients(session)
+def get_all_clients(session, decrypt=()):
+    return repo_get_all_clients(session, decrypt=decrypt)
+
+
+def get_clients_page(session, after=None, limit=DEFAULT_PAGE_SIZE, decrypt=()):
+    return repo_get_clients_page(session, after=after, limit=limit, decrypt=decrypt)
+
+
+def get_client_by_email(session, email, exclude_id=None):
+    return repo_get_client_by_email(session, email, exclude_id=exclude_id)
+
+
+def get_existing_blind_indexes(session, blind_indexes):
+    return repo_get_existing_blind_indexes(session, blind_indexes)
+
+
+def insert_clients(session, rows):
+    return repo_insert_clients(session, rows)
+
+
+def iter_clients(session, commercial_id=None, batch_size=DEFAULT_BATCH_SIZE, decrypt=()):
+    return repo_iter_clients(session, commercial_id=commercial_id, batch_size=batch_size, decrypt=decrypt)
@@ -1,4 +1,28 @@
 from app.repositories.contract_repository import get_all_contracts as repo_get_all_contracts
+from app.repositories.contract_repository import get_contracts_page as repo_get_contracts_page
+from app.repositories.contract_repository import get_contracts as repo_get_contracts
+from app.repositories.contract_repository import iter_contracts as repo_iter_contracts
+from app.repositories.contract_repository import get_contract_totals as repo_get_contract_totals
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 
 def get_all_contracts(session):
     return repo_get_all_contracts(session)
+
+
+def get_contracts_page(session, after=None, limit=DEFAULT_PAGE_SIZE, criteria=(), commercial_id=None,
+                       profile="contract_list"):
+    return repo_get_contracts_page(
+        session, after=after, limit=limit, criteria=criteria, commercial_id=commercial_id, profile=profile
+    )
+
+
+def get_contracts(session, commercial_id=None, profile="contract_list"):
+    return repo_get_contracts(session, commercial_id=commercial_id, profile=profile)
+
+
+def iter_contracts(session, commercial_id=None, batch_size=DEFAULT_BATCH_SIZE, profile="contract_list"):
+    return repo_iter_contracts(session, commercial_id=commercial_id, batch_size=batch_size, profile=profile)
+
+
+def get_contract_totals(session, criteria=(), commercial_id=None):
+    return repo_get_contract_totals(session, criteria=criteria, commercial_id=commercial_id)
@@ -1,4 +1,49 @@
 from app.repositories.event_repository import get_all_events as repo_get_all_events
+from app.repositories.event_repository import get_events_page as repo_get_events_page
+from app.repositories.event_repository import get_events as repo_get_events
+from app.repositories.event_repository import iter_events as repo_iter_events
+from app.repositories.event_repository import find_overlapping_event as repo_find_overlapping_event
+from app.repositories.event_repository import iter_schedule as repo_iter_schedule
+from app.repositories.event_repository import get_unassigned_events as repo_get_unassigned_events
+from app.repositories.event_repository import get_support_schedule as repo_get_support_schedule
+from app.repositories.event_repository import assign_support_contacts as repo_assign_support_contacts
+from app.repositories.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 
 def get_all_events(session):
     return repo_get_all_events(session)
+
+
+def get_events_page(session, after=None, limit=DEFAULT_PAGE_SIZE):
+    return repo_get_events_page(session, after=after, limit=limit)
+
+
+def get_events(session, criteria=(), profile="event_list", order_by=None):
+    return repo_get_events(session, criteria=criteria, profile=profile, order_by=order_by)
+
+
+def iter_events(session, commercial_id=None, support_contact_id=None, batch_size=DEFAULT_BATCH_SIZE,
+                profile="event_list"):
+    return repo_iter_events(
+        session, commercial_id=commercial_id, support_contact_id=support_contact_id,
+        batch_size=batch_size, profile=profile
+    )
+
+
+def find_overlapping_event(session, key, value, date_start, date_end, exclude_id=None):
+    return repo_find_overlapping_event(session, key, value, date_start, date_end, exclude_id=exclude_id)
+
+
+def iter_schedule(session, key, batch_size=DEFAULT_BATCH_SIZE):
+    return repo_iter_schedule(session, key, batch_size=batch_size)
+
+
+def get_unassigned_events(session, since):
+    return repo_get_unassigned_events(session, since)
+
+
+def get_support_schedule(session, since):
+    return repo_get_support_schedule(session, since)
+
+
+def assign_support_contacts(session, assignments):
+    return repo_assign_support_contacts(session, assignments)
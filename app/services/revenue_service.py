@@ -0,0 +1,25 @@
+from app.repositories.revenue_repository import get_commercial_revenue as repo_get_commercial_revenue
+from app.repositories.revenue_repository import get_top_clients_by_amount_due as repo_get_top_clients_by_amount_due
+from app.repositories.revenue_repository import rebuild_revenue as repo_rebuild_revenue
+from app.repositories.revenue_repository import compute_revenue as repo_compute_revenue
+from app.repositories.revenue_repository import get_stored_revenue as repo_get_stored_revenue
+from app.repositories.revenue_repository import DEFAULT_TOP_CLIENTS
+
+def get_commercial_revenue(session):
+    return repo_get_commercial_revenue(session)
+
+
+def get_top_clients_by_amount_due(session, limit=DEFAULT_TOP_CLIENTS):
+    return repo_get_top_clients_by_amount_due(session, limit=limit)
+
+
+def rebuild_revenue(session):
+    return repo_rebuild_revenue(session)
+
+
+def compute_revenue(session, scope):
+    return repo_compute_revenue(session, scope)
+
+
+def get_stored_revenue(session, scope):
+    return repo_get_stored_revenue(session, scope)
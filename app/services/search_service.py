@@ -0,0 +1,11 @@
+from app.repositories.search_repository import search_clients as repo_search_clients
+from app.repositories.search_repository import search_events as repo_search_events
+from app.repositories.search_repository import DEFAULT_SEARCH_LIMIT
+
+
+def search_clients(session, terms, limit=DEFAULT_SEARCH_LIMIT):
+    return repo_search_clients(session, terms, limit=limit)
+
+
+def search_events(session, terms, limit=DEFAULT_SEARCH_LIMIT):
+    return repo_search_events(session, terms, limit=limit)
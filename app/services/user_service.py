@@ -0,0 +1,14 @@
+from app.repositories.user_repository import get_user_by_email as repo_get_user_by_email
+from app.repositories.user_repository import get_user_by_login as repo_get_user_by_login
+from app.repositories.user_repository import get_users_by_role as repo_get_users_by_role
+
+def get_user_by_email(session, email, exclude_id=None):
+    return repo_get_user_by_email(session, email, exclude_id=exclude_id)
+
+
+def get_user_by_login(session, username_or_email):
+    return repo_get_user_by_login(session, username_or_email)
+
+
+def get_users_by_role(session, role_name):
+    return repo_get_users_by_role(session, role_name)
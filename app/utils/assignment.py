@@ -0,0 +1,159 @@
+"""
+Affectation automatique des supports aux événements, avec équilibrage de la charge.
+
+La charge d'un support à l'instant t est (nombre d'événements, participants) de ses
+événements qui chevauchent la fenêtre [t - fenêtre, t + fenêtre]. Les événements à
+affecter sont traités par date de début croissante : la fenêtre ne fait qu'avancer,
+donc les charges sont tenues à jour incrémentalement (entrées dans la fenêtre par
+date de début, sorties par date de fin) au lieu d'être recalculées.
+
+Chaque événement va au support libre sur sa période dont la charge est la plus
+faible (puis le moins de participants, puis le moins d'événements au total, puis
+le plus petit id). Un tas à invalidation
+paresseuse donne ce support sans parcourir tous les supports à chaque événement.
+"""
+
+import heapq
+import os
+from bisect import bisect_right
+from datetime import timedelta
+
+# Demi-largeur (en jours) de la fenêtre dans laquelle la charge d'un support est mesurée
+ASSIGNMENT_WINDOW_DAYS = int(os.getenv("ASSIGNMENT_WINDOW_DAYS", 7))
+
+
+class SupportLoadIndex:
+    """
+    Index en mémoire du planning des supports.
+
+    - charge courante de chaque support dans la fenêtre glissante ;
+    - planning trié par date de début, avec le maximum courant des dates de fin,
+      pour vérifier en O(log n) qu'un support est libre, même si son planning
+      existant contient déjà des chevauchements.
+    """
+
+    def __init__(self, support_ids, window):
+        self.window = window
+        self.loads = {support_id: (0, 0) for support_id in support_ids}
+        self._starts = {support_id: [] for support_id in support_ids}
+        # _max_ends[s][i] : plus grande date de fin des événements _starts[s][:i + 1]
+        self._max_ends = {support_id: [] for support_id in support_ids}
+        self._pending = []    # événements existants, triés par début : (début, fin, support, participants)
+        self._next_pending = 0  # premier événement existant pas encore entré dans la fenêtre
+        self._pending_sorted = True
+        self._in_window = []  # tas des événements dans la fenêtre : (fin, support, participants)
+        self._heap = []       # (charge, participants, total, support, version)
+        self._versions = dict.fromkeys(support_ids, 0)
+        for support_id in support_ids:
+            self._push(support_id)
+
+    # --- planning ---
+
+    def add(self, support_id, date_start, date_end, attendees=0):
+        """Ajoute un événement déjà affecté au planning d'un support (avant le premier advance)."""
+        self._insert(support_id, date_start, date_end)
+        self._pending.append((date_start, date_end, support_id, attendees or 0))
+        self._pending_sorted = False
+        self._push(support_id)
+
+    def assign(self, support_id, date_start, date_end, attendees=0):
+        """
+        Affecte un événement commençant à l'instant courant de la fenêtre :
+        il entre aussitôt dans la charge du support.
+        """
+        self._insert(support_id, date_start, date_end)
+        heapq.heappush(self._in_window, (date_end, support_id, attendees or 0))
+        self._change(support_id, 1, attendees or 0)  # met aussi à jour le total dans le tas
+
+    def _insert(self, support_id, date_start, date_end):
+        position = bisect_right(self._starts[support_id], date_start)
+        self._starts[support_id].insert(position, date_start)
+        max_ends = self._max_ends[support_id]
+        max_ends.insert(position, max(date_end, max_ends[position - 1]) if position else date_end)
+        # Les maxima suivants ne changent que s'ils sont inférieurs à date_end (suite croissante)
+        for i in range(position + 1, len(max_ends)):
+            if max_ends[i] >= date_end:
+                break
+            max_ends[i] = date_end
+
+    def is_free(self, support_id, date_start, date_end):
+        """Vrai si le support n'a aucun événement chevauchant [date_start, date_end]."""
+        # Les événements commençant au plus tard à date_end chevauchent si l'un d'eux finit après date_start
+        position = bisect_right(self._starts[support_id], date_end)
+        return position == 0 or self._max_ends[support_id][position - 1] < date_start
+
+    # --- fenêtre glissante ---
+
+    def advance(self, moment):
+        """Déplace la fenêtre sur `moment` (jamais en arrière) et met les charges à jour."""
+        if not self._pending_sorted:
+            self._pending.sort()
+            self._pending_sorted = True
+        low, high = moment - self.window, moment + self.window
+        pending = self._pending
+        while self._next_pending < len(pending) and pending[self._next_pending][0] <= high:
+            date_start, date_end, support_id, attendees = pending[self._next_pending]
+            if date_end >= low:
+                heapq.heappush(self._in_window, (date_end, support_id, attendees))
+                self._change(support_id, 1, attendees)
+            self._next_pending += 1
+        while self._in_window and self._in_window[0][0] < low:
+            _, support_id, attendees = heapq.heappop(self._in_window)
+            self._change(support_id, -1, -attendees)
+
+    def _change(self, support_id, events, attendees):
+        count, total = self.loads[support_id]
+        self.loads[support_id] = (count + events, total + attendees)
+        self._push(support_id)
+
+    def _push(self, support_id):
+        self._versions[support_id] += 1
+        count, total = self.loads[support_id]
+        events = len(self._starts[support_id])
+        heapq.heappush(self._heap, (count, total, events, support_id, self._versions[support_id]))
+
+    # --- choix du support ---
+
+    def least_loaded(self, date_start, date_end):
+        """Support libre sur la période le moins chargé dans la fenêtre courante, ou None."""
+        busy = []
+        chosen = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            support_id, version = entry[3], entry[4]
+            if version != self._versions[support_id]:
+                continue  # charge périmée
+            if self.is_free(support_id, date_start, date_end):
+                chosen = support_id
+                heapq.heappush(self._heap, entry)
+                break
+            busy.append(entry)
+        for entry in busy:
+            heapq.heappush(self._heap, entry)
+        return chosen
+
+
+def plan_assignments(support_ids, schedule, events, window_days=ASSIGNMENT_WINDOW_DAYS):
+    """
+    Calcule les affectations de tous les événements `events` en un seul passage.
+
+    - `schedule` : événements déjà affectés, (support_id, date_start, date_end, participants) ;
+    - `events` : événements à affecter, (id, date_start, date_end, participants),
+      triés par date de début.
+    Retourne (affectations [(event_id, support_id)], ids des événements sans support libre).
+    """
+    index = SupportLoadIndex(support_ids, timedelta(days=window_days))
+    for support_id, date_start, date_end, attendees in schedule:
+        if support_id in index.loads:
+            index.add(support_id, date_start, date_end, attendees)
+
+    assignments, unassigned = [], []
+    for event_id, date_start, date_end, attendees in events:
+        index.advance(date_start)
+        support_id = index.least_loaded(date_start, date_end)
+        if support_id is None:
+            unassigned.append(event_id)
+            continue
+        index.assign(support_id, date_start, date_end, attendees)
+        assignments.append((event_id, support_id))
+    return assignments, unassigned
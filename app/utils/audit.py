@@ -0,0 +1,208 @@
+"""
+File d'audit asynchrone : les contrôleurs y déposent des enregistrements structurés,
+un thread d'arrière-plan les regroupe par lots, limite le débit et les envoie à Sentry.
+
+La file est bornée : quand elle est pleine, la politique de rejet s'applique
+("newest" : le nouvel enregistrement est ignoré, "oldest" : le plus ancien est
+évincé) et le nombre de pertes est signalé dans le lot suivant.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+
+import sentry_sdk
+
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", 1000))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", 50))
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", 0.5))  # secondes
+AUDIT_RATE_LIMIT = float(os.getenv("AUDIT_RATE_LIMIT", 20))  # enregistrements/s, 0 = illimité
+AUDIT_DROP_POLICY = os.getenv("AUDIT_DROP_POLICY", "newest")
+
+DROP_POLICIES = ("newest", "oldest")
+
+
+class SentryTransport:
+    """Envoie chaque enregistrement à Sentry sous forme de message."""
+
+    def send(self, records):
+        for record in records:
+            sentry_sdk.capture_message(
+                record["message"],
+                level=record["level"],
+                tags={"audit.action": record["action"]},
+                extras=record["data"],
+            )
+
+
+class AuditPipeline:
+    """File bornée + thread d'envoi par lots (démarré au premier enregistrement)."""
+
+    def __init__(self, transport, max_queue=AUDIT_QUEUE_SIZE, batch_size=AUDIT_BATCH_SIZE,
+                 flush_interval=AUDIT_FLUSH_INTERVAL, rate_limit=AUDIT_RATE_LIMIT,
+                 drop_policy=AUDIT_DROP_POLICY):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Politique de rejet inconnue : {drop_policy} (choix : {', '.join(DROP_POLICIES)})")
+        self.transport = transport
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rate_limit = rate_limit
+        self.drop_policy = drop_policy
+
+        self.dropped = 0    # enregistrements perdus depuis le démarrage
+        self.failed = 0     # enregistrements dont l'envoi a échoué
+        self._unreported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._tokens = float(batch_size)
+        self._last_refill = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    # --- côté contrôleurs ---
+
+    def submit(self, record):
+        """Dépose un enregistrement sans jamais bloquer. Retourne False s'il a été rejeté."""
+        self.start()
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+
+        if self.drop_policy == "oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                pass
+            self._count_drop()
+            try:
+                self.queue.put_nowait(record)
+                return True
+            except queue.Full:
+                pass
+        self._count_drop()
+        return False
+
+    def _count_drop(self):
+        with self._drop_lock:
+            self.dropped += 1
+            self._unreported_drops += 1
+
+    # --- thread d'envoi ---
+
+    def start(self):
+        """Démarre le thread d'envoi s'il ne tourne pas déjà."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-pipeline", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not (self._stop.is_set() and self.queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._send(batch)
+
+    def _next_batch(self):
+        """Attend un premier enregistrement puis prend ceux déjà en file, jusqu'à batch_size."""
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _throttle(self, count):
+        """Seau à jetons : attend que `count` envois soient permis par rate_limit."""
+        if not self.rate_limit:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(float(self.batch_size), self._tokens + (now - self._last_refill) * self.rate_limit)
+            self._last_refill = now
+            if self._tokens >= count or self._tokens >= self.batch_size:
+                self._tokens -= count
+                return
+            time.sleep((count - self._tokens) / self.rate_limit)
+
+    def _send(self, batch):
+        records = list(batch)
+        with self._drop_lock:
+            drops, self._unreported_drops = self._unreported_drops, 0
+        if drops:
+            records.append(make_record(
+                "audit.dropped", f"{drops} enregistrement(s) d'audit perdu(s) : file pleine",
+                level="warning", dropped=drops,
+            ))
+        try:
+            self._throttle(len(records))
+            self.transport.send(records)
+        except Exception:
+            # L'audit ne doit jamais interrompre l'application
+            self.failed += len(records)
+        finally:
+            for _ in batch:
+                self.queue.task_done()
+
+    # --- arrêt ---
+
+    def flush(self, timeout=None):
+        """Attend que tous les enregistrements déposés soient traités. Retourne False si délai dépassé."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=5):
+        """Vide la file (au plus `timeout` secondes) puis arrête le thread d'envoi."""
+        if self._thread is not None:
+            self.flush(timeout)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def make_record(action, message, level="info", **data):
+    return {"action": action, "message": message, "level": level, "data": data, "time": time.time()}
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_audit_pipeline():
+    """File d'audit du processus (envoi vers Sentry), créée au premier usage."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = AuditPipeline(SentryTransport())
+                atexit.register(_pipeline.close)
+    return _pipeline
+
+
+def set_audit_pipeline(pipeline):
+    """Remplace la file d'audit du processus (tests, autre transport). Retourne l'ancienne."""
+    global _pipeline
+    previous, _pipeline = _pipeline, pipeline
+    return previous
+
+
+def audit_log(action, message, level="info", **data):
+    """Dépose un enregistrement d'audit ; l'envoi se fait hors du chemin critique."""
+    return get_audit_pipeline().submit(make_record(action, message, level=level, **data))
@@ -2,6 +2,7 @@ import os
 from app.config import SessionLocal
 from app.models import Users
 from app.utils.jwt_handler import decode_jwt_token
+from app.utils.auth_context import token_stamp, get_cached_user, remember_user, clear_auth_context
 from functools import wraps
 from app.views.login import login
 
@@ -9,22 +10,40 @@ TOKEN_FILE = ".token"
 
 
 def get_current_user():
-    if not os.path.exists(TOKEN_FILE):
+    stamp = token_stamp(TOKEN_FILE)
+    if stamp is None:
+        clear_auth_context()
         print("🔒 Vous n'êtes pas connecté.")
         return None
 
+    # Token inchangé et non expiré : pas de relecture, de décodage ni de requête
+    user = get_cached_user(stamp)
+    if user is not None:
+        return user
+
     with open(TOKEN_FILE, "r") as f:
         token = f.read()
 
-    payload, error = decode_jwt_token(token)
+    payload, error = decode_jwt_token(token, session_only=True)
 
     if error:
+        clear_auth_context()
         print(f"❌ Erreur d'authentification : {error}")
         print(token)
         return None
 
+    # Le rôle est chargé avec l'utilisateur (lazy='joined') : l'objet reste
+    # utilisable une fois la session fermée
     session = SessionLocal()
-    user = session.query(Users).get(payload["sub"])
+    try:
+        user = session.query(Users).get(payload["sub"])
+        if user is not None:
+            session.expunge(user)
+    finally:
+        session.close()
+
+    if user is not None:
+        remember_user(stamp, payload, user)
     return user
 
 
@@ -0,0 +1,46 @@
+import os
+import time
+
+# Contexte d'authentification du processus : le principal décodé et l'utilisateur
+# (avec son rôle, détaché de toute session) sont gardés en mémoire tant que le
+# fichier token n'a pas changé et que le JWT n'a pas expiré.
+_context = {"stamp": None, "payload": None, "user": None}
+
+
+def token_stamp(path):
+    """
+    Empreinte du fichier token (chemin, inode, date de modification, taille),
+    ou None s'il n'existe pas. Un os.stat suffit à savoir si le token a changé.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (os.path.abspath(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_cached_user(stamp):
+    """Retourne l'utilisateur en cache si le token est le même et n'a pas expiré, sinon None."""
+    if stamp is None or stamp != _context["stamp"]:
+        return None
+    exp = _context["payload"].get("exp")
+    if exp is not None and exp <= time.time():
+        clear_auth_context()
+        return None
+    return _context["user"]
+
+
+def remember_user(stamp, payload, user):
+    """Mémorise le principal décodé et l'utilisateur associés au token `stamp`."""
+    _context.update(stamp=stamp, payload=payload, user=user)
+
+
+def clear_auth_context(user_id=None):
+    """
+    Invalide le contexte (connexion, déconnexion, changement de rôle...).
+    Avec `user_id`, n'invalide que si l'utilisateur en cache est celui-là.
+    """
+    user = _context["user"]
+    if user_id is not None and (user is None or user.id != user_id):
+        return
+    _context.update(stamp=None, payload=None, user=None)
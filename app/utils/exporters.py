@@ -0,0 +1,156 @@
+"""
+Écriture incrémentale des exports : les lignes arrivent par lots et sont écrites
+au fur et à mesure, sans jamais garder tout l'export en mémoire.
+
+Formats : csv, jsonl et parquet (colonnes ; nécessite la dépendance optionnelle pyarrow).
+Le chemin "-" désigne la sortie standard (csv et jsonl).
+
+Le Parquet a besoin du type de chaque colonne (`types`, voir COLUMN_TYPES) : déduit
+du premier lot, il serait faux pour une colonne encore vide (type null) ou pour des
+montants plus grands dans les lots suivants.
+"""
+
+import csv
+import json
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+FORMATS = ("csv", "jsonl", "parquet")
+STDOUT = "-"
+
+# Types de colonnes d'export ; "money" : Decimal à 2 décimales (centimes en BIGINT)
+COLUMN_TYPES = ("int", "string", "datetime", "bool", "money")
+MONEY_PRECISION = 19  # chiffres d'un BIGINT
+
+
+def detect_format(path):
+    """Déduit le format d'export de l'extension du fichier."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "ndjson":
+        return "jsonl"
+    if extension in FORMATS:
+        return extension
+    raise ValueError(f"Format non reconnu pour {path} (formats acceptés : {', '.join(FORMATS)})")
+
+
+def _open_text(path, **options):
+    """Ouvre `path` en écriture ; retourne (fichier, à fermer ?). "-" : sortie standard, jamais fermée."""
+    if path == STDOUT:
+        return sys.stdout, False
+    return open(path, "w", encoding="utf-8", **options), True
+
+
+def _close_text(file, owned):
+    if owned:
+        file.close()
+    else:
+        file.flush()
+
+
+def _to_text(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)  # montants exacts : "1250.50", sans passer par un flottant
+    return value
+
+
+class CsvExportWriter:
+    def __init__(self, path, columns, types=None):
+        self.file, self.owned = _open_text(path, newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=columns)
+        self.writer.writeheader()
+
+    def write_batch(self, rows):
+        self.writer.writerows({key: _to_text(value) for key, value in row.items()} for row in rows)
+
+    def close(self):
+        _close_text(self.file, self.owned)
+
+
+class JsonlExportWriter:
+    def __init__(self, path, columns, types=None):
+        self.file, self.owned = _open_text(path)
+
+    def write_batch(self, rows):
+        self.file.writelines(
+            json.dumps({key: _to_text(value) for key, value in row.items()}, ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+    def close(self):
+        _close_text(self.file, self.owned)
+
+
+def _arrow_type(pyarrow, column_type):
+    if column_type == "int":
+        return pyarrow.int64()
+    if column_type == "string":
+        return pyarrow.string()
+    if column_type == "datetime":
+        return pyarrow.timestamp("us")
+    if column_type == "bool":
+        return pyarrow.bool_()
+    if column_type == "money":
+        return pyarrow.decimal128(MONEY_PRECISION, 2)
+    raise ValueError(f"Type de colonne inconnu : {column_type} (types acceptés : {', '.join(COLUMN_TYPES)})")
+
+
+class ParquetExportWriter:
+    """Un groupe de lignes Parquet par lot ; le schéma est déclaré par `types` (colonne -> type)."""
+
+    def __init__(self, path, columns, types=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("L'export Parquet nécessite pyarrow : pip install pyarrow")
+        if path == STDOUT:
+            raise ValueError("L'export Parquet ne peut pas être écrit sur la sortie standard.")
+        missing = [column for column in columns if column not in (types or {})]
+        if missing:
+            raise ValueError(f"L'export Parquet nécessite le type des colonnes : {', '.join(missing)}")
+        self.pa = pyarrow
+        self.columns = columns
+        self.schema = pyarrow.schema([pyarrow.field(column, _arrow_type(pyarrow, types[column])) for column in columns])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write_batch(self, rows):
+        if not rows:
+            return
+        data = {column: [row[column] for row in rows] for column in self.columns}
+        self.writer.write_table(self.pa.Table.from_pydict(data, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {
+    "csv": CsvExportWriter,
+    "jsonl": JsonlExportWriter,
+    "parquet": ParquetExportWriter,
+}
+
+
+def write_export(path, columns, batches, fmt=None, on_progress=None, types=None):
+    """
+    Écrit les lots de lignes (dicts) `batches` dans `path`, au fur et à mesure.
+    `types` (colonne -> type de COLUMN_TYPES) est nécessaire au format parquet.
+    `on_progress(lignes écrites)` est appelée après chaque lot. Retourne le nombre de lignes.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Format inconnu : {fmt} (formats acceptés : {', '.join(FORMATS)})")
+    writer = WRITERS[fmt](path, columns, types)
+    written = 0
+    try:
+        for rows in batches:
+            writer.write_batch(rows)
+            written += len(rows)
+            if on_progress:
+                on_progress(written)
+    finally:
+        writer.close()
+    return written
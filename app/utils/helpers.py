@@ -1,10 +1,21 @@
 from datetime import datetime
 import re
 
+from app.utils.profiling import paused_profiling
+
+EMAIL_PATTERN = r"[^@]+@[^@]+\.[^@]+"
+PHONE_PATTERN = r"^[\d +()-]{5,20}$"
+
+
+def read_input(prompt):
+    """input() sans profiler l'attente de l'utilisateur (voir app/utils/profiling.py)."""
+    with paused_profiling():
+        return input(prompt)
+
 
 def safe_input_int(prompt, allow_empty=False):
     while True:
-        value = input(prompt).strip()
+        value = read_input(prompt).strip()
         if allow_empty and not value:
             return None
         try:
@@ -15,7 +26,7 @@ def safe_input_int(prompt, allow_empty=False):
 
 def safe_input_float(prompt):
     while True:
-        value = input(prompt).strip()
+        value = read_input(prompt).strip()
         try:
             return float(value)
         except ValueError:
@@ -24,7 +35,7 @@ def safe_input_float(prompt):
 
 def safe_input_yes_no(prompt, default=False):
     while True:
-        value = input(prompt).strip().lower()
+        value = read_input(prompt).strip().lower()
         if not value:
             return default
         if value in ["y", "yes", "o", "oui"]:
@@ -45,7 +56,7 @@ def safe_input_date(prompt, default=None, allow_empty=False):
     while True:
         # Affiche le prompt avec la valeur par défaut entre crochets si elle existe
         message = f"{prompt} [{default}]: " if default else f"{prompt}: "
-        value = input(message).strip()
+        value = read_input(message).strip()
 
         # Si l'utilisateur n'entre rien, utiliser la valeur par défaut
         if not value and default:
@@ -65,7 +76,7 @@ def safe_input_date(prompt, default=None, allow_empty=False):
 def safe_input_choice(prompt, choices):
     choices_str = [str(choice) for choice in choices]
     while True:
-        value = input(f"{prompt} ({'/'.join(choices_str)}): ").strip()
+        value = read_input(f"{prompt} ({'/'.join(choices_str)}): ").strip()
         if value in choices_str:
             for c in choices:
                 if str(c) == value:
@@ -74,9 +85,9 @@ def safe_input_choice(prompt, choices):
 
 
 def safe_input_email(prompt):
-    pattern = r"[^@]+@[^@]+\.[^@]+"
+    pattern = EMAIL_PATTERN
     while True:
-        value = input(prompt).strip()
+        value = read_input(prompt).strip()
         if re.match(pattern, value):
             return value
         print("❌ Merci d'entrer un email valide.")
@@ -87,9 +98,9 @@ def safe_input_phone(prompt):
     Prompt for a valid phone number (simple check).
     Accepts digits, +, spaces, -.
     """
-    pattern = r"^[\d +()-]{5,20}$"
+    pattern = PHONE_PATTERN
     while True:
-        value = input(prompt).strip()
+        value = read_input(prompt).strip()
         if re.match(pattern, value):
             return value
         print("❌ Merci d'entrer un numéro de téléphone valide.")
@@ -0,0 +1,51 @@
+import csv
+import json
+import os
+from itertools import islice
+
+FORMATS = ("csv", "jsonl")
+
+
+def detect_format(path):
+    """Déduit le format (csv / jsonl) de l'extension du fichier."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension == "csv":
+        return "csv"
+    raise ValueError(f"Format non reconnu pour {path} (formats acceptés : {', '.join(FORMATS)})")
+
+
+def read_records(path, fmt=None):
+    """
+    Lit un fichier CSV (avec en-tête) ou JSONL ligne par ligne, sans le charger en mémoire.
+    Génère des (numéro de ligne, dict) ; une ligne illisible donne (numéro de ligne, None).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Format inconnu : {fmt} (formats acceptés : {', '.join(FORMATS)})")
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    data = None
+                yield line_number, data if isinstance(data, dict) else None
+
+
+def chunked(iterable, size):
+    """Découpe un itérable en listes de `size` éléments au plus (la dernière peut être plus courte)."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
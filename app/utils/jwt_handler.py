@@ -10,6 +10,8 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")  # valeur par défaut HS256
 TOKEN_EXPIRE_MINUTES = int(os.getenv("TOKEN_EXPIRE_MINUTES", 600))
+API_TOKEN_EXPIRE_DAYS = int(os.getenv("API_TOKEN_EXPIRE_DAYS", 90))
+API_TOKEN_TYPE = "api"
 
 
 def create_jwt_token(user):
@@ -22,11 +24,34 @@ def create_jwt_token(user):
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def decode_jwt_token(token):
+def create_api_token(user, days=API_TOKEN_EXPIRE_DAYS):
+    """Jeton longue durée pour les scripts (cli.py), marqué "type": "api"."""
+    payload = {
+        "sub": str(user.id),
+        "username": user.username,
+        "role": user.role.name,
+        "type": API_TOKEN_TYPE,
+        "exp": datetime.now(timezone.utc) + timedelta(days=days)
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def is_api_token(payload):
+    """Vrai pour un jeton créé par create_api_token."""
+    return payload.get("type") == API_TOKEN_TYPE
+
+
+def decode_jwt_token(token, session_only=False):
+    """
+    Décode et vérifie un jeton. Retourne (payload, None) ou (None, erreur).
+    `session_only` : refuse les jetons d'API (session interactive de main.py).
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload, None
     except jwt.ExpiredSignatureError:
         return None, "Token expiré"
     except jwt.InvalidTokenError:
         return None, "Token invalide"
+    if session_only and is_api_token(payload):
+        return None, "Jeton d'API refusé : connectez-vous (python main.py)"
+    return payload, None
@@ -0,0 +1,46 @@
+"""
+Chargement différé des modules lourds (vues, SQLAlchemy, chiffrement, Sentry).
+
+`lazy_import("module", "nom")` renvoie une fonction intermédiaire : le module n'est
+importé qu'au premier appel. L'écran de connexion et les menus s'affichent ainsi
+sans charger les vues, les modèles ni leurs dépendances.
+
+Les initialisations lancées par `run_in_background` (Sentry) se font pendant la
+saisie des identifiants. Le premier chargement différé les attend : les imports
+du programme et ceux du fil d'arrière-plan ne se croisent jamais.
+"""
+
+import importlib
+import threading
+
+_background = []
+
+
+def run_in_background(func, name):
+    """Exécute `func` dans un fil démon ; retourne le fil."""
+    thread = threading.Thread(target=func, name=name, daemon=True)
+    thread.start()
+    _background.append(thread)
+    return thread
+
+
+def wait_for_background():
+    """Attend la fin des initialisations lancées par run_in_background."""
+    while _background:
+        _background.pop().join()
+
+
+def lazy_import(module_name, name):
+    """Fonction qui importe `module_name` au premier appel, puis appelle son attribut `name`."""
+    target = None
+
+    def proxy(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            wait_for_background()
+            target = getattr(importlib.import_module(module_name), name)
+        return target(*args, **kwargs)
+
+    proxy.__name__ = proxy.__qualname__ = name
+    proxy.__doc__ = f"Chargé à la demande depuis {module_name}."
+    return proxy
@@ -0,0 +1,169 @@
+"""
+Profilage des actions de menu avec cProfile.
+
+Activé par `python main.py --profile [DOSSIER]` ou par la variable PROFILE_DIR.
+Chaque action lancée depuis un menu écrit dans le dossier :
+- `<horodatage>-<action>.prof` : statistiques complètes (pstats, snakeviz, gprof2dot…) ;
+- `<horodatage>-<action>.txt` : les PROFILE_TOP fonctions les plus coûteuses,
+  également affichées après l'action.
+
+Le temps passé à attendre l'utilisateur n'est pas profilé : le profileur est mis en
+pause pendant les invites Rich (`Prompt.ask`, pager compris) et les saisies de
+`app/utils/helpers.py` (`paused_profiling`). Le préchargement du pager, qui tourne
+dans un autre thread, est aussi profilé (`run_profiled`) : jusqu'à Python 3.11 par un
+profileur propre au thread, fusionné dans celui de l'action ; à partir de 3.12, un
+seul profileur peut être actif et celui de l'action enregistre déjà tous les threads.
+"""
+
+import io
+import os
+import re
+import sys
+import time
+import unicodedata
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "")
+PROFILE_TOP = int(os.getenv("PROFILE_TOP", 15))
+PROFILE_SORT = os.getenv("PROFILE_SORT", "cumulative")  # ou tottime (temps propre)
+
+# Python 3.12+ : cProfile repose sur sys.monitoring, commun à tous les threads,
+# et refuse un second profileur actif (ValueError)
+PROFILER_COVERS_THREADS = sys.version_info >= (3, 12)
+
+_current = ContextVar("profiled_action", default=None)
+
+
+class _ProfiledAction:
+    """Profileur de l'action en cours, temps de saisie et profils des autres threads."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.paused_s = 0.0
+        self.thread_profilers = []
+
+
+def enable_profiling(directory):
+    """Active le profilage des actions ; les fichiers vont dans `directory`."""
+    global PROFILE_DIR
+    PROFILE_DIR = directory
+
+
+def _slug(label):
+    ascii_label = unicodedata.normalize("NFKD", label).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_label.lower()).strip("-")[:40] or "action"
+
+
+def hot_functions(stats, top=PROFILE_TOP, sort=PROFILE_SORT):
+    """Texte pstats des `top` fonctions les plus coûteuses (profileur ou pstats.Stats)."""
+    import pstats
+
+    output = io.StringIO()
+    if not isinstance(stats, pstats.Stats):
+        stats = pstats.Stats(stats)
+    stats.stream = output
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return output.getvalue()
+
+
+@contextmanager
+def paused_profiling():
+    """Suspend le profilage de l'action en cours pendant le bloc `with` (attente d'une saisie)."""
+    action = _current.get()
+    if action is None:
+        yield
+        return
+    action.profiler.disable()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        action.paused_s += time.perf_counter() - start
+        try:
+            action.profiler.enable()
+        except ValueError:
+            # Un autre outil de profilage a pris la main pendant la saisie (3.12+) :
+            # la fin de l'action n'est pas profilée
+            pass
+
+
+def run_profiled(func, *args, **kwargs):
+    """
+    Appelle `func` dans un thread de travail. Si une action est profilée dans le
+    contexte courant (copié avec contextvars.copy_context), l'appel a son propre
+    profileur, fusionné dans le profil de l'action.
+    """
+    action = _current.get()
+    if action is None or PROFILER_COVERS_THREADS:
+        return func(*args, **kwargs)
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Un autre profileur est déjà actif : l'appel n'est pas profilé
+        return func(*args, **kwargs)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        action.thread_profilers.append(profiler)
+
+
+def _install_prompt_hook():
+    """Met le profileur en pause pendant toute invite Rich (PromptBase.get_input)."""
+    from rich.prompt import PromptBase
+
+    get_input = PromptBase.__dict__["get_input"].__func__
+    if getattr(get_input, "pauses_profiling", False):
+        return
+
+    def paused_get_input(cls, *args, **kwargs):
+        with paused_profiling():
+            return get_input(cls, *args, **kwargs)
+
+    paused_get_input.pauses_profiling = True
+    PromptBase.get_input = classmethod(paused_get_input)
+
+
+@contextmanager
+def profile_action(label, console=None):
+    """
+    Profile le bloc `with` si le profilage est activé, puis écrit le profil et le
+    résumé dans PROFILE_DIR et affiche le résumé sur `console`.
+    """
+    if not PROFILE_DIR:
+        yield None
+        return
+
+    import cProfile
+    import pstats
+
+    _install_prompt_hook()
+    profiler = cProfile.Profile()
+    action = _ProfiledAction(profiler)
+    token = _current.set(action)
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        _current.reset(token)
+        elapsed_ms = (time.perf_counter() - start - action.paused_s) * 1000
+        stats = pstats.Stats(profiler)
+        for thread_profiler in list(action.thread_profilers):
+            stats.add(thread_profiler)
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, f"{datetime.now():%Y%m%d-%H%M%S-%f}-{_slug(label)}")
+        stats.dump_stats(base + ".prof")
+        summary = f"{label} : {elapsed_ms:.1f} ms hors saisie\n" + hot_functions(stats, PROFILE_TOP, PROFILE_SORT)
+        with open(base + ".txt", "w", encoding="utf-8") as file:
+            file.write(summary)
+        if console is not None:
+            console.print(f"[dim]🔍 Profil de « {label} » ({elapsed_ms:.1f} ms hors saisie) : {base}.prof[/dim]")
+            console.print(summary, markup=False, highlight=False, style="dim")
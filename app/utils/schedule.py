@@ -0,0 +1,31 @@
+"""
+Balayage (sweep line) d'un planning pour retrouver tous les chevauchements.
+"""
+
+import heapq
+from itertools import count
+
+
+def overlapping_pairs(rows):
+    """
+    Génère les paires d'événements qui se chevauchent.
+
+    `rows` : lignes (clé, id, nom, date_start, date_end) triées par (clé, date_start).
+    Les périodes sont fermées : deux événements qui se touchent sont en conflit.
+    Pour chaque ligne, seuls les événements encore en cours (tas trié par date de fin)
+    sont comparés : O(n log n + nombre de conflits).
+    Produit des tuples (clé, ligne antérieure, ligne).
+    """
+    active = []
+    current_key = None
+    order = count()  # départage les dates de fin égales sans comparer les lignes
+    for row in rows:
+        key, _, _, date_start, date_end = row
+        if key != current_key:
+            active.clear()
+            current_key = key
+        while active and active[0][0] < date_start:
+            heapq.heappop(active)
+        for _, _, other in sorted(active, key=lambda item: item[1]):
+            yield key, other, row
+        heapq.heappush(active, (date_end, next(order), row))
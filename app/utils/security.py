@@ -1,15 +1,93 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-# Create a CryptContext instance configured to use the bcrypt hashing scheme.
-# This context will handle the hashing and verification of passwords.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Coût bcrypt (2^rounds itérations, environ 0,2 s par hachage à 12 sur un cœur).
+# Les mots de passe hachés avec un coût inférieur sont rehachés à la connexion.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+# Hachages/vérifications calculés en parallèle, et demandes acceptées au plus
+# (en cours + en attente) : au-delà, l'appelant attend qu'une place se libère.
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", os.cpu_count() or 1))
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", 64))
+
+
+def make_password_context(rounds=BCRYPT_ROUNDS):
+    """
+    CryptContext bcrypt de l'application. `min_rounds` égal au coût courant :
+    un hachage plus faible est signalé par `needs_update` / `verify_and_update`.
+    """
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+
+pwd_context = make_password_context()
+
+
+class PasswordPool:
+    """
+    Pool de fils borné pour bcrypt (qui libère le GIL pendant le calcul) :
+    `workers` calculs simultanés, `max_pending` demandes acceptées au plus.
+    Les méthodes renvoient des `concurrent.futures.Future`.
+    """
+
+    def __init__(self, context=None, workers=PASSWORD_WORKERS, max_pending=PASSWORD_MAX_PENDING):
+        self.context = context or pwd_context
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="password")
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+
+    def _submit(self, func, *args):
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash(self, password):
+        return self._submit(self.context.hash, password)
+
+    def verify(self, password, hashed_password):
+        return self._submit(self.context.verify, password, hashed_password)
+
+    def verify_and_update(self, password, hashed_password):
+        return self._submit(self.context.verify_and_update, password, hashed_password)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool():
+    """Pool partagé, créé au premier hachage."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PasswordPool()
+        return _pool
+
+
+def set_password_pool(pool):
+    """Remplace le pool partagé (tests, mode serveur) ; retourne l'ancien."""
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, pool
+    return previous
+
 
 def hash_password(password: str) -> str:
     """
     Hash a password for storing.
 
     This function takes a plain text password and returns a hashed version of it.
-    The CryptContext automatically generates a unique salt and hashes the password using bcrypt.
+    The CryptContext automatically generates a unique salt and hashes the password using bcrypt
+    with BCRYPT_ROUNDS rounds, in the shared password pool.
 
     Args:
         password (str): The plain text password to hash.
@@ -17,7 +95,7 @@ def hash_password(password: str) -> str:
     Returns:
         str: The hashed password, which includes the salt and the hash.
     """
-    return pwd_context.hash(password)
+    return get_password_pool().hash(password).result()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -33,4 +111,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the passwords match, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_password_pool().verify(plain_password, hashed_password).result()
+
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """
+    Verify a password and rehash it if its cost is below BCRYPT_ROUNDS.
+
+    Args:
+        plain_password (str): The plain text password provided by the user.
+        hashed_password (str): The stored hashed password to verify against.
+
+    Returns:
+        tuple: (valid, new_hash). new_hash is None unless the password matched
+        and the stored hash must be replaced.
+    """
+    return get_password_pool().verify_and_update(plain_password, hashed_password).result()
@@ -0,0 +1,260 @@
+"""
+Mesure des requêtes SQL par action de menu.
+
+`instrument_engine` branche deux écouteurs sur le moteur (before/after_cursor_execute)
+qui chronomètrent chaque requête, relèvent le nombre de lignes et la vue ou le
+contrôleur appelant. Pour un SELECT, SQLite produit les lignes au fil de leur lecture
+(et `rowcount` vaut -1) : les lignes sont comptées et leur lecture chronométrée
+jusqu'à la fermeture du curseur, où la requête est journalisée si elle est lente.
+`track_action(label)` regroupe les requêtes exécutées pendant une action de menu.
+
+Tout est désactivé par défaut :
+- SQL_METRICS=1 : résumé affiché après chaque action ;
+- SQL_SLOW_MS=200 : les requêtes plus longues sont ajoutées au journal SQL_SLOW_LOG ;
+- SQL_METRICS_FILE=sql_metrics.jsonl : une ligne JSON par action, avec toutes ses requêtes.
+
+Les paramètres des requêtes ne sont jamais enregistrés (données personnelles).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Optional
+
+SQL_METRICS = os.getenv("SQL_METRICS", "0") == "1"
+SQL_SLOW_MS = float(os.getenv("SQL_SLOW_MS", 0))  # 0 = pas de journal des requêtes lentes
+SQL_SLOW_LOG = os.getenv("SQL_SLOW_LOG", "slow_queries.log")
+SQL_METRICS_FILE = os.getenv("SQL_METRICS_FILE", "")
+
+# Modules dont une fonction est désignée comme appelante d'une requête
+CALLER_PACKAGES = ("app.controllers.", "app.views.")
+SUMMARY_TOP = 5
+
+_current = ContextVar("sql_metrics_action", default=None)
+_write_lock = threading.Lock()
+
+
+@dataclass
+class QueryRecord:
+    statement: str
+    duration_ms: float
+    rows: Optional[int]
+    caller: Optional[str]
+
+
+@dataclass
+class ActionStats:
+    """Requêtes exécutées pendant une action de menu."""
+
+    action: str
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    duration_ms: float = 0.0
+    queries: list = field(default_factory=list)
+
+    @property
+    def sql_ms(self):
+        return sum(query.duration_ms for query in self.queries)
+
+    @property
+    def slow(self):
+        if not SQL_SLOW_MS:
+            return []
+        return [query for query in self.queries if query.duration_ms >= SQL_SLOW_MS]
+
+    def by_caller(self):
+        """[(appelant, requêtes, ms, lignes)] par temps SQL décroissant."""
+        groups = {}
+        for query in self.queries:
+            count, total, rows = groups.get(query.caller, (0, 0.0, 0))
+            groups[query.caller] = (count + 1, total + query.duration_ms, rows + max(query.rows or 0, 0))
+        return sorted(((caller, *values) for caller, values in groups.items()), key=lambda group: -group[2])
+
+    def to_dict(self):
+        return {
+            "action": self.action,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "query_count": len(self.queries),
+            "sql_ms": round(self.sql_ms, 3),
+            "queries": [asdict(query) for query in self.queries],
+        }
+
+
+def is_enabled():
+    return SQL_METRICS or bool(SQL_METRICS_FILE) or bool(SQL_SLOW_MS)
+
+
+def find_caller(frame):
+    """Première fonction d'une vue ou d'un contrôleur dans la pile, sous la forme module.fonction."""
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(CALLER_PACKAGES):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None or SQL_SLOW_MS:
+        context._sql_metrics_start = time.perf_counter()
+
+
+class _RowCountingCursor:
+    """
+    Curseur DBAPI qui compte et chronomètre les lignes lues par SQLAlchemy : SQLite
+    produit les lignes d'un SELECT au fil des fetch, pas à l'exécution. La durée de
+    `query` inclut donc la lecture ; la requête est journalisée si elle est lente à
+    la fermeture du curseur.
+    """
+
+    def __init__(self, cursor, query, execute_ms, action=None):
+        self._cursor = cursor
+        self._query = query
+        self._elapsed_ms = execute_ms
+        self._action = action
+        self._closed = False
+
+    def _fetch(self, method, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._elapsed_ms += (time.perf_counter() - start) * 1000
+            self._query.duration_ms = round(self._elapsed_ms, 3)
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        if row is not None:
+            self._query.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._fetch(self._cursor.fetchmany, *args, **kwargs)
+        self._query.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._fetch(self._cursor.fetchall)
+        self._query.rows += len(rows)
+        return rows
+
+    def close(self):
+        self._cursor.close()
+        if self._closed:
+            return
+        self._closed = True
+        if SQL_SLOW_MS and self._elapsed_ms >= SQL_SLOW_MS:
+            log_slow_query(self._query, self._action)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_sql_metrics_start", None)
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    stats = _current.get()
+    action = stats.action if stats else None
+    returns_rows = cursor.description is not None and not executemany
+    is_slow = bool(SQL_SLOW_MS) and duration_ms >= SQL_SLOW_MS
+    # Un SELECT rapide à exécuter peut être lent à lire : décidé à la fermeture
+    if stats is None and not is_slow and not returns_rows:
+        return
+
+    query = QueryRecord(
+        statement=statement,
+        duration_ms=round(duration_ms, 3),
+        rows=None,
+        caller=find_caller(sys._getframe(1)),
+    )
+    if stats is not None:
+        stats.queries.append(query)
+
+    if returns_rows:
+        # SELECT (ou RETURNING) : lignes comptées et chronométrées pendant leur lecture
+        query.rows = 0
+        context.cursor = _RowCountingCursor(cursor, query, duration_ms, action)
+        return
+    rowcount = cursor.rowcount
+    query.rows = rowcount if rowcount >= 0 else None
+    if is_slow:
+        log_slow_query(query, action)
+
+
+def instrument_engine(engine):
+    """Branche la mesure des requêtes sur `engine` (sans effet tant que rien n'est activé)."""
+    from sqlalchemy import event
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _append(path, line):
+    with _write_lock, open(path, "a", encoding="utf-8") as file:
+        file.write(line + "\n")
+
+
+def log_slow_query(query, action=None):
+    """Ajoute une requête lente au journal SQL_SLOW_LOG."""
+    statement = " ".join(query.statement.split())
+    _append(
+        SQL_SLOW_LOG,
+        f"{datetime.now().isoformat(timespec='seconds')} {query.duration_ms:.1f} ms "
+        f"[{action or '-'}] {query.caller or '-'} rows={query.rows if query.rows is not None else '?'} : {statement}",
+    )
+
+
+def print_summary(stats, console):
+    """Affiche le nombre de requêtes, le temps SQL et les appelants les plus coûteux d'une action."""
+    from rich.table import Table
+
+    slow = len(stats.slow)
+    console.print(
+        f"[dim]⏱️ {stats.action} : {len(stats.queries)} requête(s), "
+        f"{stats.sql_ms:.1f} ms SQL sur {stats.duration_ms:.1f} ms"
+        + (f", [red]{slow} lente(s)[/red]" if slow else "") + "[/dim]"
+    )
+    if not stats.queries:
+        return
+    table = Table(show_header=True, header_style="dim", box=None)
+    table.add_column("Appelant", style="dim")
+    table.add_column("Requêtes", justify="right", style="dim")
+    table.add_column("ms", justify="right", style="dim")
+    table.add_column("Lignes", justify="right", style="dim")
+    for caller, count, total, rows in stats.by_caller()[:SUMMARY_TOP]:
+        table.add_row(caller or "-", str(count), f"{total:.1f}", str(rows))
+    console.print(table)
+
+
+@contextmanager
+def track_action(label, console=None):
+    """
+    Regroupe les requêtes exécutées dans le bloc `with` sous le nom `label`.
+    En sortie : résumé sur `console` (SQL_METRICS) et ligne JSON dans SQL_METRICS_FILE.
+    Ne fait rien si la mesure est désactivée.
+    """
+    if not is_enabled():
+        yield None
+        return
+
+    stats = ActionStats(action=label)
+    token = _current.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.duration_ms = (time.perf_counter() - start) * 1000
+        _current.reset(token)
+        if SQL_METRICS_FILE:
+            _append(SQL_METRICS_FILE, json.dumps(stats.to_dict(), ensure_ascii=False))
+        if SQL_METRICS and console is not None:
+            print_summary(stats, console)
@@ -1,7 +1,8 @@
 from app.config import SessionLocal
-from app.controllers.client_controller import list_all_clients, update_client, create_client
+from app.controllers.client_controller import list_clients_page, update_client, create_client
 from app.utils.auth import jwt_required, role_required
 from app.utils.helpers import safe_input_email, safe_input_int, safe_input_phone
+from app.views.pager import TablePager
 from rich.console import Console
 from rich.table import Table
 from app.models import Clients
@@ -9,18 +10,25 @@ from rich.prompt import Prompt, Confirm
 
 console = Console()
 
-@jwt_required
-@role_required("commercial", "gestion", "support")
-def show_all_clients_view(current_user, *args, **kwargs):
-    """Affiche la liste de tous les clients accessibles"""
+def fetch_client_rows(after, limit):
+    """Charge une page de clients et la formate pour le tableau (session dédiée)."""
     session = SessionLocal()
     try:
-        clients = list_all_clients(session)
+        clients, next_cursor = list_clients_page(session, after=after, limit=limit, decrypt=("email",))
+        rows = [
+            (str(client.id), client.first_name, client.last_name, client.email, client.company_name)
+            for client in clients
+        ]
+        return rows, next_cursor
+    finally:
+        session.close()
 
-        if not clients:
-            console.print("[red]Aucun client trouvé.[/red]")
-            return
 
+@jwt_required
+@role_required("commercial", "gestion", "support")
+def show_all_clients_view(current_user, *args, **kwargs):
+    """Affiche la liste de tous les clients accessibles, page par page"""
+    def build_table(page_number):
         table = Table(title=f"📋 Clients accessibles par {current_user.first_name}", 
                      header_style="bold magenta")
         table.add_column("ID", style="cyan", justify="right")
@@ -28,19 +36,10 @@ def show_all_clients_view(current_user, *args, **kwargs):
         table.add_column("Nom", style="yellow")
         table.add_column("Email", style="blue")
         table.add_column("Entreprise", style="green")
+        return table
 
-        for client in clients:
-            table.add_row(
-                str(client.id),
-                client.first_name,
-                client.last_name,
-                client.email,
-                client.company_name
-            )
-
-        console.print(table)
-    finally:
-        session.close()
+    if not TablePager(fetch_client_rows, build_table).run():
+        console.print("[red]Aucun client trouvé.[/red]")
 
 @jwt_required
 @role_required("commercial")
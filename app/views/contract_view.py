@@ -1,8 +1,11 @@
 from app.config import SessionLocal
-from app.controllers.contract_controller import list_all_contracts, create_contract, update_contract
+from app.controllers.client_controller import list_all_clients
+from app.controllers.contract_controller import list_contracts, list_contracts_page, create_contract, update_contract
+from app.controllers.contract_controller import summarize_contracts
 from app.models import Clients, Users, Contracts
 from app.utils.auth import jwt_required, role_required
 from app.utils.helpers import safe_input_int, safe_input_float, safe_input_yes_no
+from app.views.pager import TablePager
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
@@ -16,17 +19,31 @@ from rich.prompt import Confirm
 
 console = Console()
 
-@jwt_required
-def show_all_contracts_view(current_user, *args, **kwargs):
-    """Affiche tous les contrats accessibles"""
+def fetch_contract_rows(after, limit):
+    """Charge une page de contrats et la formate pour le tableau (session dédiée)."""
     session = SessionLocal()
     try:
-        contracts = list_all_contracts(session)
+        contracts, next_cursor = list_contracts_page(session, after=after, limit=limit)
+        rows = [
+            (
+                str(contract.id),
+                f"{contract.client.first_name} {contract.client.last_name}",
+                "✅" if contract.is_signed else "❌",
+                f"{contract.amount_due:.2f}",
+                f"{contract.total_amount:.2f}",
+                str(contract.date_created.date())
+            )
+            for contract in contracts
+        ]
+        return rows, next_cursor
+    finally:
+        session.close()
 
-        if not contracts:
-            console.print("[yellow]Aucun contrat trouvé.[/yellow]")
-            return
 
+@jwt_required
+def show_all_contracts_view(current_user, *args, **kwargs):
+    """Affiche tous les contrats accessibles, page par page"""
+    def build_table(page_number):
         table = Table(title=f"📋 Contrats accessibles par {current_user.first_name}", 
                      show_lines=True, header_style="bold magenta")
         table.add_column("ID", justify="right")
@@ -35,20 +52,10 @@ def show_all_contracts_view(current_user, *args, **kwargs):
         table.add_column("Montant dû", justify="right")
         table.add_column("Montant total", justify="right")
         table.add_column("Créé le", style="dim")
+        return table
 
-        for contract in contracts:
-            table.add_row(
-                str(contract.id),
-                f"{contract.client.first_name} {contract.client.last_name}",
-                "✅" if contract.is_signed else "❌",
-                f"{contract.amount_due:.2f}",
-                f"{contract.total_amount:.2f}",
-                str(contract.date_created.date())
-            )
-
-        console.print(table)
-    finally:
-        session.close()
+    if not TablePager(fetch_contract_rows, build_table).run():
+        console.print("[yellow]Aucun contrat trouvé.[/yellow]")
 
 @jwt_required
 @role_required("gestion", "commercial")
@@ -58,8 +65,8 @@ def create_contract_view(current_user, *args, **kwargs):
     try:
         console.print("\n[bold cyan]=== Créer un nouveau contrat ===[/bold cyan]")
 
-        # Liste des clients
-        clients = session.query(Clients).all()
+        # Liste des clients (emails déchiffrés en masse)
+        clients = list_all_clients(session, decrypt=("email",))
         client_table = Table(title="📌 Clients disponibles", header_style="bold blue")
         client_table.add_column("ID", justify="right")
         client_table.add_column("Nom complet")
@@ -146,11 +153,9 @@ def update_contract_view(current_user, *args, **kwargs):
 
         # Filtrage selon le rôle
         if current_user.role.name == "commercial":
-            contracts = session.query(Contracts).join(Clients).filter(
-                Clients.commercial_id == current_user.id
-            ).all()
+            contracts = list_contracts(session, commercial_id=current_user.id)
         else:
-            contracts = session.query(Contracts).all()
+            contracts = list_contracts(session)
 
         if not contracts:
             console.print("[yellow]Aucun contrat disponible pour modification.[/yellow]")
@@ -253,57 +258,65 @@ def update_contract_view(current_user, *args, **kwargs):
 @role_required("gestion", "commercial")
 def filter_contracts_view(current_user, *args, **kwargs):
     """Filtre les contrats selon différents critères"""
-    session = SessionLocal()
-    try:
-        console.print("\n[bold cyan]=== Filtrer les contrats ===[/bold cyan]")
-
-        # Menu des filtres
-        filters = {
-            "1": ("Contrats non signés", Contracts.is_signed == False),
-            "2": ("Contrats non entièrement payés", Contracts.amount_due > 0),
-            "3": ("Contrats non signés ET non payés", 
-                 (Contracts.is_signed == False, Contracts.amount_due > 0)),
-            "4": ("Contrats signés", Contracts.is_signed == True),
-            "5": ("Contrats entièrement payés", Contracts.amount_due == 0)
-        }
-
-        table = Table(title="🔍 Filtres disponibles", header_style="bold magenta")
-        table.add_column("Choix", style="dim")
-        table.add_column("Description")
-
-        for key, (desc, _) in filters.items():
-            table.add_row(key, desc)
-        table.add_row("0", "[red]Retour[/red]")
-
-        console.print(table)
-
-        choice = Prompt.ask("Votre choix", choices=["0", "1", "2", "3", "4", "5"], default="0")
-
-        if choice == "0":
-            return
-
-        # Construction de la requête
-        query = session.query(Contracts)
-        
-        # Filtre par rôle
-        if current_user.role.name == "commercial":
-            query = query.join(Clients).filter(Clients.commercial_id == current_user.id)
-
-        # Application du filtre
-        filter_cond = filters[choice][1]
-        if isinstance(filter_cond, tuple):
-            query = query.filter(*filter_cond)
-        else:
-            query = query.filter(filter_cond)
-
-        # Exécution
-        results = query.order_by(Contracts.date_created.desc()).all()
-
-        if not results:
-            console.print("[yellow]Aucun contrat trouvé avec ce filtre.[/yellow]")
-            return
-
-        # Affichage résultats
+    console.print("\n[bold cyan]=== Filtrer les contrats ===[/bold cyan]")
+
+    # Menu des filtres
+    filters = {
+        "1": ("Contrats non signés", Contracts.is_signed == False),
+        "2": ("Contrats non entièrement payés", Contracts.amount_due > 0),
+        "3": ("Contrats non signés ET non payés", 
+             (Contracts.is_signed == False, Contracts.amount_due > 0)),
+        "4": ("Contrats signés", Contracts.is_signed == True),
+        "5": ("Contrats entièrement payés", Contracts.amount_due == 0)
+    }
+
+    table = Table(title="🔍 Filtres disponibles", header_style="bold magenta")
+    table.add_column("Choix", style="dim")
+    table.add_column("Description")
+
+    for key, (desc, _) in filters.items():
+        table.add_row(key, desc)
+    table.add_row("0", "[red]Retour[/red]")
+
+    console.print(table)
+
+    choice = Prompt.ask("Votre choix", choices=["0", "1", "2", "3", "4", "5"], default="0")
+
+    if choice == "0":
+        return
+
+    # Filtre par rôle
+    commercial_id = current_user.id if current_user.role.name == "commercial" else None
+
+    # Application du filtre
+    filter_cond = filters[choice][1]
+    criteria = filter_cond if isinstance(filter_cond, tuple) else (filter_cond,)
+
+    def fetch_rows(after, limit):
+        session = SessionLocal()
+        try:
+            contracts, next_cursor = list_contracts_page(
+                session, after=after, limit=limit,
+                criteria=criteria, commercial_id=commercial_id, profile="contract_filter"
+            )
+            rows = [
+                (
+                    str(contract.id),
+                    f"{contract.client.first_name} {contract.client.last_name}",
+                    f"{contract.client.commercial.first_name} {contract.client.commercial.last_name}",
+                    f"{contract.total_amount:.2f}",
+                    f"{contract.amount_due:.2f}",
+                    "✅" if contract.is_signed else "❌",
+                    contract.date_created.strftime("%Y-%m-%d")
+                )
+                for contract in contracts
+            ]
+            return rows, next_cursor
+        finally:
+            session.close()
+
+    # Affichage résultats
+    def build_table(page_number):
         result_table = Table(title=f"📋 Résultats - {filters[choice][0]}", 
                            show_lines=True, header_style="bold green")
         result_table.add_column("ID", justify="right")
@@ -313,18 +326,19 @@ def filter_contracts_view(current_user, *args, **kwargs):
         result_table.add_column("Dû", justify="right")
         result_table.add_column("Signé", justify="center")
         result_table.add_column("Créé le", style="dim")
+        return result_table
 
-        for contract in results:
-            result_table.add_row(
-                str(contract.id),
-                f"{contract.client.first_name} {contract.client.last_name}",
-                f"{contract.client.commercial.first_name} {contract.client.commercial.last_name}",
-                f"{contract.total_amount:.2f}",
-                f"{contract.amount_due:.2f}",
-                "✅" if contract.is_signed else "❌",
-                contract.date_created.strftime("%Y-%m-%d")
-            )
+    if not TablePager(fetch_rows, build_table).run():
+        console.print("[yellow]Aucun contrat trouvé avec ce filtre.[/yellow]")
+        return
 
-        console.print(result_table)
+    # Totaux de tout le filtre (et pas seulement des pages affichées), calculés en base
+    session = SessionLocal()
+    try:
+        totals = summarize_contracts(session, criteria=criteria, commercial_id=commercial_id)
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+    console.print(
+        f"[bold]{totals['contracts']} contrat(s)[/bold] — montant total : {totals['total_amount']:.2f}, "
+        f"dont signé : {totals['signed_total']:.2f}, reste dû : {totals['amount_due']:.2f}"
+    )
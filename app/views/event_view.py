@@ -1,8 +1,11 @@
 from app.config import SessionLocal
-from app.controllers.event_controller import list_all_events, create_event, update_event
+from app.controllers.client_controller import list_all_clients
+from app.controllers.event_controller import list_events, list_events_page, create_event, update_event
+from app.controllers.event_controller import find_schedule_conflicts, propose_assignments, apply_assignments
 from app.models import Clients, Contracts, Users, Events
 from app.utils.auth import jwt_required, role_required
 from app.utils.helpers import safe_input_int, safe_input_date
+from app.views.pager import TablePager
 from app.views.user_view import show_all_users_view
 from datetime import datetime, timedelta
 from rich.table import Table
@@ -11,17 +14,33 @@ from rich.prompt import Prompt, Confirm
 
 console = Console()
 
-@jwt_required
-def show_all_events_view(current_user, *args, **kwargs):
-    """Affiche tous les événements accessibles"""
+def fetch_event_rows(after, limit):
+    """Charge une page d'événements et la formate pour le tableau (session dédiée)."""
     session = SessionLocal()
     try:
-        events = list_all_events(session)
+        events, next_cursor = list_events_page(session, after=after, limit=limit)
+        rows = []
+        for event in events:
+            support = f"{event.support_contact.first_name} {event.support_contact.last_name}" if event.support_contact else "Aucun"
+            dates = f"{event.date_start.strftime('%d/%m')} → {event.date_end.strftime('%d/%m/%Y')}"
+            rows.append((
+                str(event.id),
+                event.name,
+                event.client.company_name,
+                dates,
+                event.location,
+                str(event.attendees),
+                support
+            ))
+        return rows, next_cursor
+    finally:
+        session.close()
 
-        if not events:
-            console.print("[yellow]Aucun événement trouvé.[/yellow]")
-            return
 
+@jwt_required
+def show_all_events_view(current_user, *args, **kwargs):
+    """Affiche tous les événements accessibles, page par page"""
+    def build_table(page_number):
         table = Table(
             title=f"📋 Événements accessibles par {current_user.first_name}",
             header_style="bold magenta"
@@ -33,23 +52,10 @@ def show_all_events_view(current_user, *args, **kwargs):
         table.add_column("Lieu", style="cyan")
         table.add_column("Participants", justify="right")
         table.add_column("Support")
+        return table
 
-        for event in events:
-            support = f"{event.support_contact.first_name} {event.support_contact.last_name}" if event.support_contact else "Aucun"
-            dates = f"{event.date_start.strftime('%d/%m')} → {event.date_end.strftime('%d/%m/%Y')}"
-            table.add_row(
-                str(event.id),
-                event.name,
-                event.client.company_name,
-                dates,
-                event.location,
-                str(event.attendees),
-                support
-            )
-
-        console.print(table)
-    finally:
-        session.close()
+    if not TablePager(fetch_event_rows, build_table).run():
+        console.print("[yellow]Aucun événement trouvé.[/yellow]")
 
 @jwt_required
 @role_required("commercial")
@@ -59,8 +65,8 @@ def create_event_view(current_user, *args, **kwargs):
     try:
         console.print("\n[bold cyan]=== Création d'un événement ===[/bold cyan]")
 
-        # Sélection du client
-        clients = session.query(Clients).all()
+        # Sélection du client (email et téléphone non affichés : jamais déchiffrés)
+        clients = list_all_clients(session)
         client_table = Table(title="📌 Clients disponibles", header_style="bold blue")
         client_table.add_column("ID", justify="right")
         client_table.add_column("Nom")
@@ -161,12 +167,10 @@ def update_event_view(user, *args, **kwargs):
 
         # === Affichage des événements disponibles ===
         if user.role.name == "support":
-            events = session.query(Events).filter(
-                Events.support_contact_id == user.id
-            ).order_by(Events.date_start).all()
+            events = list_events(session, (Events.support_contact_id == user.id,))
             title = f"📋 Événements attribués à {user.first_name}"
         else:  # gestion
-            events = session.query(Events).order_by(Events.date_start).all()
+            events = list_events(session)
             title = "📋 Tous les événements"
 
         if not events:
@@ -307,23 +311,21 @@ def filter_events_view(current_user, *args, **kwargs):
         if choice == "0":
             return
 
-        # Construction de la requête
-        query = session.query(Events)
+        # Construction du filtre
         now = datetime.now()
+        criteria = {
+            "1": Events.date_start > now,
+            "2": Events.date_end < now,
+            "3": Events.support_contact_id == None,
+            "4": Events.support_contact_id != None,
+            "5": Events.attendees > 50,
+        }
 
-        if choice == "1":
-            query = query.filter(Events.date_start > now)
-        elif choice == "2":
-            query = query.filter(Events.date_end < now)
-        elif choice == "3":
-            query = query.filter(Events.support_contact_id == None)
-        elif choice == "4":
-            query = query.filter(Events.support_contact_id != None)
-        elif choice == "5":
-            query = query.filter(Events.attendees > 50)
+        # Événements passés : les plus récents d'abord (index ix_events_date_end)
+        order_by = Events.date_end.desc() if choice == "2" else None
 
         # Exécution
-        events = query.order_by(Events.date_start).all()
+        events = list_events(session, (criteria[choice],), order_by=order_by)
 
         if not events:
             console.print("[yellow]Aucun événement trouvé avec ce filtre.[/yellow]")
@@ -381,9 +383,7 @@ def show_user_events_view(current_user, *args, **kwargs):
         console.print(f"\n[bold cyan]=== Événements attribués à {current_user.first_name} {current_user.last_name} ===[/bold cyan]")
 
         # On récupère uniquement les événements dont le support_contact est l'utilisateur courant
-        events = session.query(Events).filter(
-            Events.support_contact_id == current_user.id
-        ).order_by(Events.date_start).all()
+        events = list_events(session, (Events.support_contact_id == current_user.id,), profile="event_user")
 
         if not events:
             console.print("[yellow]Aucun événement ne vous est attribué.[/yellow]")
@@ -431,3 +431,81 @@ def show_user_events_view(current_user, *args, **kwargs):
                     console.print("[red]Événement introuvable ou non attribué à cet utilisateur.[/red]")
     finally:
         session.close()
+
+
+@jwt_required
+@role_required("gestion")
+def schedule_conflicts_view(current_user, *args, **kwargs):
+    """Affiche tous les chevauchements de planning (même support ou même lieu)."""
+    session = SessionLocal()
+    try:
+        console.print("\n[bold cyan]=== Conflits de planning ===[/bold cyan]")
+
+        conflicts = find_schedule_conflicts(session)
+        if not conflicts:
+            console.print("[green]✅ Aucun conflit de planning.[/green]")
+            return
+
+        table = Table(title=f"⚠️ {len(conflicts)} conflit(s)", header_style="bold red")
+        table.add_column("Type")
+        table.add_column("Support / Lieu", style="cyan")
+        table.add_column("Événement 1", style="green")
+        table.add_column("Événement 2", style="green")
+        table.add_column("Période commune", style="blue")
+
+        for conflict in conflicts:
+            first, second = conflict["first"], conflict["second"]
+            start, end = conflict["overlap"]
+            table.add_row(
+                conflict["type"],
+                str(conflict["key"]),
+                f"{first['id']} - {first['name']}",
+                f"{second['id']} - {second['name']}",
+                f"{start.strftime('%d/%m/%Y')} → {end.strftime('%d/%m/%Y')}",
+            )
+
+        console.print(table)
+    finally:
+        session.close()
+
+
+@jwt_required
+@role_required("gestion")
+def auto_assign_view(current_user, *args, **kwargs):
+    """Propose une affectation équilibrée des supports aux événements sans support, puis l'applique."""
+    session = SessionLocal()
+    try:
+        console.print("\n[bold cyan]=== Affectation automatique des supports ===[/bold cyan]")
+
+        plan, error = propose_assignments(session)
+        if error:
+            console.print(f"[red]{error}[/red]")
+            return
+
+        if plan["unassigned"]:
+            console.print(
+                f"[yellow]{len(plan['unassigned'])} événement(s) sans support libre sur leur période.[/yellow]"
+            )
+        if not plan["assignments"]:
+            console.print("[yellow]Aucun événement à affecter.[/yellow]")
+            return
+
+        table = Table(title=f"📋 {len(plan['assignments'])} affectation(s) proposée(s)", header_style="bold magenta")
+        table.add_column("ID", justify="right", style="cyan")
+        table.add_column("Support", style="green")
+        table.add_column("Événements", justify="right")
+        table.add_column("Participants", justify="right")
+        for support_id, load in plan["supports"].items():
+            table.add_row(str(support_id), load["name"], str(load["events"]), str(load["attendees"]))
+        console.print(table)
+
+        if Confirm.ask("Appliquer ces affectations ?", default=True):
+            count, error = apply_assignments(session, plan["assignments"], current_user)
+            if error:
+                console.print(f"[red]{error}[/red]")
+            else:
+                console.print(f"[green]✅ {count} événement(s) affecté(s).[/green]")
+        else:
+            console.print("[yellow]Affectation annulée.[/yellow]")
+    finally:
+        session.close()
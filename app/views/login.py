@@ -1,28 +1,38 @@
 import os
 from getpass import getpass
-from app.config import SessionLocal
-from app.controllers.auth_controller import authenticate_user
-from app.utils.jwt_handler import create_jwt_token
+from app.utils.auth_context import clear_auth_context
+from app.utils.lazy import lazy_import
+
+# SQLAlchemy, les modèles, bcrypt et PyJWT ne sont chargés qu'une fois les identifiants saisis
+SessionLocal = lazy_import("app.config", "SessionLocal")
+authenticate_user = lazy_import("app.controllers.auth_controller", "authenticate_user")
+create_jwt_token = lazy_import("app.utils.jwt_handler", "create_jwt_token")
 
 TOKEN_FILE = ".token"
 
 
 def login():
-    session = SessionLocal()
     print("== Connexion ==")
     login_input = input("Email ou nom d'utilisateur : ")
     password = getpass("Mot de passe : ")  # masque la saisie
 
-    user, error = authenticate_user(session, login_input, password)
+    # Premier chargement différé : la base (et Sentry) ne sont attendus qu'après la saisie
+    session = SessionLocal()
+    try:
+        user, error = authenticate_user(session, login_input, password)
 
-    if error:
-        print("❌", error)
-        return None
+        if error:
+            print("❌", error)
+            return None
 
-    token = create_jwt_token(user)
+        token = create_jwt_token(user)
 
-    with open(TOKEN_FILE, "w") as f:
-        f.write(token)
+        with open(TOKEN_FILE, "w") as f:
+            f.write(token)
+        # Nouveau token : l'ancien contexte d'authentification n'est plus valable
+        clear_auth_context()
 
-    print(f"✅ Bienvenue {user.first_name} ({user.role.name})")
-    return user
+        print(f"✅ Bienvenue {user.first_name} ({user.role.name})")
+        return user
+    finally:
+        session.close()
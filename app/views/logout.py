@@ -1,6 +1,8 @@
 import os
+from app.utils.auth_context import clear_auth_context
 
 def logout():
+    clear_auth_context()
     if os.path.exists(".token"):
         os.remove(".token")
         print("✅ Déconnexion réussie.")
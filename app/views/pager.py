@@ -0,0 +1,129 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from rich.console import Console
+from rich.prompt import Prompt
+from app.repositories.pagination import DEFAULT_PAGE_SIZE
+from app.utils.profiling import run_profiled
+
+console = Console()
+
+NAVIGATION_HELP = "[dim]n : suivante · p : précédente · j : aller à la page · q : quitter[/dim]"
+
+
+class TablePager:
+    """
+    Affiche un tableau Rich page par page.
+
+    - `fetch_page(after, limit)` retourne (lignes, curseur suivant) où chaque ligne
+      est un tuple de cellules déjà formatées. Elle est appelée depuis un thread
+      d'arrière-plan pour précharger la page suivante : elle doit donc ouvrir sa
+      propre session et ne renvoyer aucun objet ORM. Elle s'exécute dans une copie
+      du contexte courant, pour que ses requêtes et son profil restent rattachés à
+      l'action de menu en cours (app/utils/sql_metrics.py, app/utils/profiling.py).
+    - `build_table(page_number)` retourne une `rich.table.Table` vide (colonnes
+      définies), remplie avec les lignes de la page.
+
+    Les pages visitées sont gardées en mémoire avec leur curseur, ce qui permet de
+    revenir en arrière sans requête.
+    """
+
+    def __init__(self, fetch_page, build_table, page_size=DEFAULT_PAGE_SIZE):
+        self.fetch_page = fetch_page
+        self.build_table = build_table
+        self.page_size = page_size
+        self.pages = []      # pages chargées : (lignes, curseur suivant)
+        self.prefetched = None
+        self.executor = None
+
+    def _load(self, index):
+        """Charge la page `index` (à partir de 0), en consommant le préchargement si possible."""
+        while len(self.pages) <= index:
+            if self.pages and self.pages[-1][1] is None:
+                return False  # plus de page après la dernière chargée
+            if self.prefetched is not None:
+                page = self.prefetched.result()
+                self.prefetched = None
+            else:
+                after = self.pages[-1][1] if self.pages else None
+                page = self.fetch_page(after, self.page_size)
+            self.pages.append(page)
+        return True
+
+    def _prefetch_next(self, index):
+        """Lance en arrière-plan le chargement de la page qui suit `index`."""
+        if self.prefetched is not None or index + 1 < len(self.pages):
+            return
+        next_cursor = self.pages[index][1]
+        if next_cursor is None:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.prefetched = self.executor.submit(
+            contextvars.copy_context().run, run_profiled, self.fetch_page, next_cursor, self.page_size
+        )
+
+    def _render(self, index):
+        rows, _ = self.pages[index]
+        table = self.build_table(index + 1)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+
+    def _ask(self):
+        try:
+            return Prompt.ask(NAVIGATION_HELP, default="q").strip().lower()
+        except OSError:
+            # Pas de stdin (tests, exécution non interactive) : on s'arrête
+            return "q"
+
+    def run(self):
+        """
+        Affiche la première page puis gère la navigation.
+        Retourne False si aucune ligne n'a été trouvée, True sinon.
+        """
+        try:
+            self._load(0)
+            if not self.pages[0][0]:
+                return False
+
+            index = 0
+            while True:
+                self._render(index)
+                if index == 0 and self.pages[0][1] is None:
+                    return True  # une seule page : pas de navigation
+                self._prefetch_next(index)
+
+                console.print(f"[dim]Page {index + 1}[/dim]")
+                choice = self._ask()
+                if choice == "q":
+                    return True
+                if choice == "n":
+                    if self._load(index + 1):
+                        index += 1
+                    else:
+                        console.print("[yellow]Dernière page atteinte.[/yellow]")
+                elif choice == "p":
+                    if index > 0:
+                        index -= 1
+                    else:
+                        console.print("[yellow]Vous êtes sur la première page.[/yellow]")
+                elif choice == "j":
+                    target = self._ask_page_number()
+                    if target is not None and self._load(target - 1):
+                        index = target - 1
+                    elif target is not None:
+                        index = len(self.pages) - 1
+                        console.print(f"[yellow]Seulement {len(self.pages)} page(s) : affichage de la dernière.[/yellow]")
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ask_page_number(self):
+        try:
+            value = Prompt.ask("Numéro de page").strip()
+        except OSError:
+            return None
+        if not value.isdigit() or int(value) < 1:
+            console.print("[red]❌ Merci d'entrer un numéro de page valide.[/red]")
+            return None
+        return int(value)
@@ -0,0 +1,62 @@
+from app.config import SessionLocal
+from app.controllers.revenue_controller import revenue_dashboard
+from app.utils.auth import jwt_required, role_required
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+
+def _money(value):
+    return f"{value:,.2f} €".replace(",", " ")
+
+
+@jwt_required
+@role_required("gestion")
+def revenue_dashboard_view(current_user, *args, **kwargs):
+    """Chiffre d'affaires signé et créances par commercial, et clients ayant le plus de créances"""
+    session = SessionLocal()
+    try:
+        console.print("\n[bold cyan]=== Tableau de bord : chiffre d'affaires et créances ===[/bold cyan]")
+        dashboard = revenue_dashboard(session)
+
+        if not dashboard["commercials"]:
+            console.print("[yellow]Aucun contrat enregistré.[/yellow]")
+            return
+
+        table = Table(title="💶 Par commercial", header_style="bold magenta")
+        table.add_column("ID", justify="right", style="cyan")
+        table.add_column("Commercial", style="green")
+        table.add_column("Contrats", justify="right")
+        table.add_column("Signés", justify="right")
+        table.add_column("CA signé", justify="right")
+        table.add_column("Reste dû", justify="right", style="red")
+        table.add_column("Contrats non soldés", justify="right")
+
+        for row in dashboard["commercials"]:
+            table.add_row(
+                str(row["id"]), row["name"], str(row["contracts"]), str(row["signed_contracts"]),
+                _money(row["signed_total"]), _money(row["amount_due"]), str(row["unpaid_contracts"]),
+            )
+        totals = dashboard["totals"]
+        table.add_row(
+            "", "[bold]Total[/bold]", str(totals["contracts"]), str(totals["signed_contracts"]),
+            _money(totals["signed_total"]), _money(totals["amount_due"]), str(totals["unpaid_contracts"]),
+        )
+        console.print(table)
+
+        if dashboard["clients"]:
+            clients = Table(title="📌 Clients ayant le plus de créances", header_style="bold blue")
+            clients.add_column("ID", justify="right", style="cyan")
+            clients.add_column("Client", style="green")
+            clients.add_column("Entreprise", style="yellow")
+            clients.add_column("Reste dû", justify="right", style="red")
+            clients.add_column("CA signé", justify="right")
+            for row in dashboard["clients"]:
+                clients.add_row(
+                    str(row["id"]), row["name"], row["company_name"] or "",
+                    _money(row["amount_due"]), _money(row["signed_total"]),
+                )
+            console.print(clients)
+    finally:
+        session.close()
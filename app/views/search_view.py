@@ -0,0 +1,60 @@
+from app.config import SessionLocal
+from app.controllers.search_controller import search
+from app.utils.auth import jwt_required
+from rich.console import Console
+from rich.table import Table
+from rich.prompt import Prompt
+
+console = Console()
+
+
+@jwt_required
+def search_view(current_user, *args, **kwargs):
+    """Recherche plein texte de clients et d'événements (une saisie vide pour revenir)"""
+    console.print("\n[bold cyan]=== Rechercher un client ou un événement ===[/bold cyan]")
+    console.print("[dim]Nom, prénom, entreprise, nom d'événement, lieu, notes (début des mots), ou email complet.[/dim]")
+
+    while True:
+        try:
+            terms = Prompt.ask("\nRecherche", default="").strip()
+        except OSError:
+            return
+        if not terms:
+            return
+
+        session = SessionLocal()
+        try:
+            results, error = search(session, terms)
+            if error:
+                console.print(f"[red]{error}[/red]")
+                continue
+
+            clients, events = results["clients"], results["events"]
+            if not clients and not events:
+                console.print(f"[yellow]Aucun résultat pour « {terms} ».[/yellow]")
+                continue
+
+            if clients:
+                table = Table(title=f"👤 Clients ({len(clients)})", header_style="bold magenta")
+                table.add_column("ID", justify="right")
+                table.add_column("Nom complet", style="cyan")
+                table.add_column("Entreprise")
+                table.add_column("Email")
+                for client in clients:
+                    table.add_row(str(client.id), f"{client.first_name} {client.last_name}",
+                                  client.company_name, client.email)
+                console.print(table)
+
+            if events:
+                table = Table(title=f"📅 Événements ({len(events)})", header_style="bold magenta")
+                table.add_column("ID", justify="right")
+                table.add_column("Nom", style="green")
+                table.add_column("Client", style="yellow")
+                table.add_column("Début", style="blue")
+                table.add_column("Lieu")
+                for event in events:
+                    table.add_row(str(event.id), event.name, event.client.company_name if event.client else "-",
+                                  event.date_start.strftime("%d/%m/%Y %H:%M"), event.location or "-")
+                console.print(table)
+        finally:
+            session.close()
@@ -0,0 +1,39 @@
+"""
+Ajoute les colonnes d'index aveugle (email_bidx) et les remplit pour les lignes existantes.
+
+Même traitement que la migration migrations/m000_blind_index.py (appliquée par
+`python migrate.py` avec les autres), conservé pour les bases qui n'ont besoin que de lui.
+"""
+
+from app.config import engine
+from app.models import Base
+from migrations.m000_blind_index import (
+    INDEXED_TABLES, add_blind_index_columns, backfill_table, create_blind_index_indexes, find_duplicates,
+)
+
+
+def main():
+    """Point d'entrée du script."""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for table in add_blind_index_columns(connection):
+            print(f"🔧 Colonne email_bidx ajoutée à la table {table}.")
+
+    for table in INDEXED_TABLES:
+        # Une transaction par table : les lignes indexées restent acquises
+        with engine.begin() as connection:
+            count = backfill_table(connection, table)
+            duplicates = find_duplicates(connection, table)
+        print(f"✅ {count} ligne(s) indexée(s) dans la table {table}.")
+        if duplicates:
+            print(f"❌ {len(duplicates)} email(s) en double dans {table} : "
+                  "corrigez-les avant de relancer le script.")
+            return
+
+    with engine.begin() as connection:
+        create_blind_index_indexes(connection)
+    print("🎉 Index aveugles à jour.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark de l'affectation automatique des supports.
+
+Usage :
+    python -m benchmarks.bench_assignment            # 100 000 événements à affecter
+    python -m benchmarks.bench_assignment 20000
+
+Crée SUPPORTS supports, un historique d'événements déjà affectés et `size`
+événements sans support répartis sur cinq ans, puis mesure le calcul de la
+proposition (lecture + plan_assignments) et son enregistrement.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.event_controller import apply_assignments, propose_assignments
+from app.engine import create_app_engine
+from app.models import Base, Events, Roles, Users
+
+DEFAULT_SIZE = 100_000
+SUPPORTS = 40
+ASSIGNED = 20_000
+INSERT_BATCH = 10_000
+ORIGIN = datetime(2030, 1, 1)
+SPAN_HOURS = 5 * 365 * 24
+
+
+class Manager:
+    id = 0
+    role = type("Role", (), {"name": "gestion"})
+
+
+def populate(engine, size):
+    rng = random.Random(7)
+
+    def event(i, support_id=None):
+        date_start = ORIGIN + timedelta(hours=rng.randrange(SPAN_HOURS))
+        return {
+            "name": f"Événement {i}",
+            "support_contact_id": support_id,
+            "date_start": date_start,
+            "date_end": date_start + timedelta(hours=rng.choice((2, 4, 8, 24))),
+            "attendees": rng.randint(10, 500),
+        }
+
+    with engine.begin() as connection:
+        role_id = connection.execute(insert(Roles.__table__).values(name="support")).inserted_primary_key[0]
+        connection.execute(insert(Users.__table__), [
+            {"username": f"support{i}", "first_name": "Support", "last_name": str(i), "email": "chiffré",
+             "email_bidx": f"bidx{i}", "hashed_password": "x", "role_id": role_id}
+            for i in range(SUPPORTS)
+        ])
+        # Historique : événements réguliers et décalés d'un support à l'autre, sans chevauchement
+        step = timedelta(hours=SPAN_HOURS // (ASSIGNED // SUPPORTS))
+        history = []
+        for i in range(ASSIGNED):
+            date_start = ORIGIN + step * (i // SUPPORTS) + timedelta(hours=2 * (i % SUPPORTS))
+            history.append({"name": f"Affecté {i}", "support_contact_id": i % SUPPORTS + 1, "attendees": 50,
+                            "date_start": date_start, "date_end": date_start + timedelta(hours=4)})
+        connection.execute(insert(Events.__table__), history)
+        for start in range(0, size, INSERT_BATCH):
+            connection.execute(insert(Events.__table__),
+                               [event(i) for i in range(start, min(start + INSERT_BATCH, size))])
+
+
+def run(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        populate(engine, size)
+        print(f"{SUPPORTS} supports, {ASSIGNED:,} événements affectés, {size:,} à affecter")
+
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            start = time.perf_counter()
+            plan, error = propose_assignments(session, since=ORIGIN)
+            print(f"proposition    : {time.perf_counter() - start:6.2f} s "
+                  f"({len(plan['assignments']):,} affectés, {len(plan['unassigned']):,} sans support libre)")
+            loads = sorted(load["events"] for load in plan["supports"].values())
+            print(f"par support    : {loads[0]:,} à {loads[-1]:,} événements")
+
+            start = time.perf_counter()
+            count, error = apply_assignments(session, plan["assignments"], Manager())
+            print(f"enregistrement : {time.perf_counter() - start:6.2f} s ({count:,} lignes)")
+        engine.dispose()
+
+
+def main(argv):
+    run(int(argv[0]) if argv else DEFAULT_SIZE)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
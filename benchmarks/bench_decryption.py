@@ -0,0 +1,95 @@
+"""
+Benchmark du chargement des clients : déchiffrement ligne par ligne vs en masse.
+
+Usage :
+    python -m benchmarks.bench_decryption            # 10k, 100k et 1M clients
+    python -m benchmarks.bench_decryption 10000 50000
+
+Chaque taille est insérée dans une base SQLite temporaire (emails et téléphones
+chiffrés une seule fois en amont), puis chargée :
+- "différé"   : get_all_clients(), aucun champ chiffré lu (rien n'est déchiffré) ;
+- "par ligne" : get_all_clients() puis lecture d'email/phone ligne par ligne ;
+- "en masse"  : get_all_clients(decrypt=...), déchiffrement groupé via decrypt_many.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Clients
+from app.models.mixins import DECRYPT_WORKERS, fernet
+from app.repositories.client_repository import get_all_clients
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+INSERT_BATCH = 10_000
+
+
+def populate(engine, size):
+    """Insère `size` clients chiffrés (les chiffrés sont réutilisés par lot pour aller vite)."""
+    email_ct = [fernet.encrypt(f"client{i}@example.com".encode()).decode() for i in range(INSERT_BATCH)]
+    phone_ct = fernet.encrypt(b"+33 6 12 34 56 78").decode()
+    with engine.begin() as connection:
+        for start in range(0, size, INSERT_BATCH):
+            connection.execute(
+                insert(Clients.__table__),
+                [
+                    {
+                        "first_name": "Jean",
+                        "last_name": f"Client{i:07d}",
+                        "email": email_ct[i % INSERT_BATCH],
+                        "email_bidx": f"bidx{i}",
+                        "phone": phone_ct,
+                        "company_name": "Bench Corp",
+                    }
+                    for i in range(start, min(start + INSERT_BATCH, size))
+                ],
+            )
+
+
+def read_fields(clients):
+    for client in clients:
+        client.email, client.phone
+    return clients
+
+
+def timed(label, size, func):
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    assert len(rows) == size
+    print(f"{size:>10,} | {label:<10} | {elapsed:8.2f} s | {size / elapsed:>12,.0f} lignes/s")
+
+
+def run(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        populate(engine, size)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as session:
+            timed("différé", size, lambda: get_all_clients(session))
+        with Session() as session:
+            timed("par ligne", size, lambda: read_fields(get_all_clients(session)))
+        with Session() as session:
+            timed("en masse", size, lambda: read_fields(get_all_clients(session, decrypt=("email", "phone"))))
+        engine.dispose()
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    print(f"Processus de déchiffrement : {DECRYPT_WORKERS}")
+    print(f"{'clients':>10} | {'mode':<10} | {'durée':>10} | {'débit':>18}")
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,52 @@
+"""
+Benchmark du débit de commits selon le profil SQLite (voir app/engine.py).
+
+Usage :
+    python -m benchmarks.bench_engine_profiles          # 2000 commits par profil
+    python -m benchmarks.bench_engine_profiles 500
+
+Pour chaque profil, une base SQLite temporaire est créée puis on effectue N
+petites transactions (une insertion + un commit chacune), comme le fait
+l'application à chaque création ou modification depuis les menus.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import insert
+
+from app.engine import create_app_engine, SQLITE_PROFILES
+from app.models import Base, Roles
+
+DEFAULT_COMMITS = 2000
+
+
+def run(profile, commits):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", profile=profile)
+        Base.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        for i in range(commits):
+            with engine.begin() as connection:
+                connection.execute(insert(Roles.__table__), {"name": f"role{i}"})
+        elapsed = time.perf_counter() - start
+
+        engine.dispose()
+    print(f"{profile:<10} | {commits:>8,} | {elapsed:8.2f} s | {commits / elapsed:>10,.0f} commits/s")
+
+
+def main(argv):
+    commits = int(argv[0]) if argv else DEFAULT_COMMITS
+    print(f"{'profil':<10} | {'commits':>8} | {'durée':>10} | {'débit':>18}")
+    for profile in SQLITE_PROFILES:
+        run(profile, commits)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,109 @@
+"""
+Benchmark de la détection des conflits de planning.
+
+Usage :
+    python -m benchmarks.bench_event_conflicts            # 500 000 événements
+    python -m benchmarks.bench_event_conflicts 100000
+
+Chaque support et chaque lieu a un historique d'événements consécutifs, sans
+chevauchement. On compare, pour une nouvelle période en fin d'historique :
+- find_overlapping_event (index (clé, date_end, date_start) : seuls les événements
+  qui finissent après le début demandé sont parcourus, cf. event_repository) ;
+- la même requête de chevauchement servie par l'index (clé, date_start), qui
+  parcourt tout l'historique antérieur de la clé ;
+puis on mesure le rapport complet (find_schedule_conflicts).
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.event_controller import find_schedule_conflicts
+from app.engine import create_app_engine
+from app.models import Base, Events
+from app.repositories.event_repository import find_overlapping_event
+
+DEFAULT_SIZE = 500_000
+INSERT_BATCH = 10_000
+SUPPORTS = 50
+REPEAT = 200
+ORIGIN = datetime(2000, 1, 1)
+
+
+def populate(engine, size):
+    """Événements de 1 à 2 jours, consécutifs pour chaque support et chaque lieu."""
+    with engine.begin() as connection:
+        for start in range(0, size, INSERT_BATCH):
+            rows = []
+            for i in range(start, min(start + INSERT_BATCH, size)):
+                slot = i // SUPPORTS
+                date_start = ORIGIN + timedelta(days=3 * slot)
+                rows.append({
+                    "name": f"Événement {i}",
+                    "support_contact_id": i % SUPPORTS + 1,
+                    "location": f"Salle {i % SUPPORTS}",
+                    "date_start": date_start,
+                    "date_end": date_start + timedelta(days=1 + i % 2),
+                })
+            connection.execute(insert(Events.__table__), rows)
+    return ORIGIN + timedelta(days=3 * (size // SUPPORTS))
+
+
+def naive_overlap(session, support_id, date_start, date_end):
+    return (
+        session.query(Events)
+        .filter(Events.support_contact_id == support_id,
+                Events.date_start <= date_end, Events.date_end >= date_start)
+        .first()
+    )
+
+
+def timed(call):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        end_of_history = populate(engine, size)
+        print(f"{size:,} événements ({size // SUPPORTS:,} par support et par lieu)")
+
+        Session = sessionmaker(bind=engine)
+        with Session() as session:
+            # Période libre, juste après l'historique : le pire cas de la requête directe
+            start, end = end_of_history + timedelta(days=1), end_of_history + timedelta(days=2)
+            checks = {
+                "find_overlapping_event": lambda: find_overlapping_event(session, "support", 1, start, end),
+                "requête de chevauchement": lambda: naive_overlap(session, 1, start, end),
+            }
+            for label, call in checks.items():
+                print(f"{label:<26} : {timed(call):8.3f} ms (médiane)")
+
+            start_report = time.perf_counter()
+            conflicts = find_schedule_conflicts(session)
+            print(f"rapport complet            : {time.perf_counter() - start_report:8.2f} s "
+                  f"({len(conflicts)} conflit(s))")
+        engine.dispose()
+
+
+def main(argv):
+    run(int(argv[0]) if argv else DEFAULT_SIZE)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
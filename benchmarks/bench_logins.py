@@ -0,0 +1,96 @@
+"""
+Benchmark des connexions : authenticate_user (recherche + bcrypt) par seconde.
+
+Usage :
+    python -m benchmarks.bench_logins                  # coût BCRYPT_ROUNDS, 1 à nproc fils
+    python -m benchmarks.bench_logins --rounds 10 --logins 40 --threads 1 2 4 8
+
+Chaque fil a sa propre session et connecte tour à tour USERS utilisateurs ;
+les vérifications passent par le pool de app/utils/security.py (PASSWORD_WORKERS
+fils). Le débit par cœur est le débit divisé par min(fils, workers, cœurs).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.auth_controller import authenticate_user
+from app.engine import create_app_engine
+from app.models import Base, Roles, Users
+from app.utils.security import (
+    BCRYPT_ROUNDS, PASSWORD_WORKERS, PasswordPool, make_password_context, set_password_pool,
+)
+
+USERS = 20
+PASSWORD = "bench-password"
+DEFAULT_LOGINS = 20
+
+
+def populate(engine, hashed_password):
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        role = Roles(name="gestion")
+        session.add_all(
+            Users(username=f"user{i}", first_name="Bench", last_name=str(i), email=f"user{i}@bench.example",
+                  hashed_password=hashed_password, role=role)
+            for i in range(USERS)
+        )
+        session.commit()
+
+
+def login_rate(Session, logins, threads):
+    """Connexions par seconde avec `threads` fils concurrents."""
+    def worker(count):
+        with Session() as session:
+            for i in range(count):
+                user, error = authenticate_user(session, f"user{i % USERS}", PASSWORD)
+                assert error is None, error
+
+    shares = [logins // threads + (1 if i < logins % threads else 0) for i in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, shares))
+    return logins / (time.perf_counter() - start)
+
+
+def run(rounds, logins, thread_counts, workers):
+    context = make_password_context(rounds)
+    previous = set_password_pool(PasswordPool(context, workers=workers))
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        populate(engine, context.hash(PASSWORD))
+        Session = sessionmaker(bind=engine)
+        print(f"bcrypt {rounds} rounds, {workers} fil(s) de hachage, {cores} cœur(s), {logins} connexions par mesure")
+        for threads in thread_counts:
+            rate = login_rate(Session, logins, threads)
+            per_core = rate / min(threads, workers, cores)
+            print(f"{threads:3d} fil(s) : {rate:8.2f} connexions/s  ({per_core:.2f} par cœur)")
+        engine.dispose()
+    set_password_pool(previous).close()
+
+
+def main(argv=None):
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Connexions par seconde (bcrypt)")
+    parser.add_argument("--rounds", type=int, default=BCRYPT_ROUNDS, help="coût bcrypt")
+    parser.add_argument("--logins", type=int, default=DEFAULT_LOGINS, help="connexions par mesure")
+    parser.add_argument("--threads", type=int, nargs="+", default=sorted({1, cores}),
+                        help="nombres de fils clients à mesurer")
+    parser.add_argument("--workers", type=int, default=PASSWORD_WORKERS, help="taille du pool de hachage")
+    args = parser.parse_args(argv)
+    run(args.rounds, args.logins, args.threads, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark de la recherche plein texte (FTS5) des clients.
+
+Usage :
+    python -m benchmarks.bench_search            # 1M clients
+    python -m benchmarks.bench_search 100000
+
+Les clients sont insérés dans une base SQLite temporaire puis indexés
+(rebuild_search_index) ; chaque recherche est répétée et on affiche la
+latence médiane et le 95e centile.
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.engine import create_app_engine
+from app.models import Base, Clients
+from app.models.search import rebuild_search_index
+from app.repositories.search_repository import search_clients
+
+DEFAULT_SIZE = 1_000_000
+INSERT_BATCH = 10_000
+REPEAT = 50
+
+FIRST_NAMES = ["Élise", "Jacques", "Sophie", "Martin", "Camille", "Louis", "Chloé", "Hugo", "Léa", "Nathan",
+               "Manon", "Lucas", "Inès", "Jules", "Zoé", "Arthur", "Emma", "Paul", "Alice", "Théo"]
+SYLLABLES = ["mo", "reau", "du", "rand", "blan", "chard", "le", "fè", "vre", "gar", "nier", "rous",
+             "seau", "fon", "taine", "che", "va", "lier", "bon", "net", "mar", "tin", "ber", "tho"]
+COMPANY_WORDS = ["Ateliers", "Conseil", "Vins", "Fromages", "Studio", "Événements", "Logistique", "Design",
+                 "Traiteur", "Voyages", "Immobilier", "Services"]
+# Nom de famille fréquent, préfixe court, prénom + début de nom, mot d'entreprise très courant
+QUERIES = ["moreau", "dur", "elise blan", "fromages", "design che", "zzz"]
+
+
+def surname(rng):
+    """Nom de famille de 2 à 3 syllabes (~14 000 noms distincts, fréquences inégales)."""
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.choice((2, 2, 3)))).capitalize()
+
+
+def populate(engine, size):
+    rng = random.Random(42)
+    with engine.begin() as connection:
+        for start in range(0, size, INSERT_BATCH):
+            connection.execute(insert(Clients.__table__), [
+                {
+                    "first_name": rng.choice(FIRST_NAMES),
+                    "last_name": surname(rng),
+                    "email": "chiffré",
+                    "email_bidx": f"bidx{i}",
+                    "phone": "chiffré",
+                    "company_name": f"{rng.choice(COMPANY_WORDS)} {surname(rng)}",
+                }
+                for i in range(start, min(start + INSERT_BATCH, size))
+            ])
+        rebuild_search_index(connection)
+
+
+def run(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        start = time.perf_counter()
+        populate(engine, size)
+        print(f"{size:,} clients insérés et indexés en {time.perf_counter() - start:.1f} s")
+
+        Session = sessionmaker(bind=engine)
+        print(f"{'recherche':<20} | {'résultats':>9} | {'médiane':>9} | {'p95':>9}")
+        with Session() as session:
+            for terms in QUERIES:
+                timings = []
+                for _ in range(REPEAT):
+                    start = time.perf_counter()
+                    results = search_clients(session, terms)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    session.expunge_all()
+                timings.sort()
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                print(f"{terms:<20} | {len(results):>9} | {statistics.median(timings):7.2f} ms | {p95:7.2f} ms")
+        engine.dispose()
+
+
+def main(argv):
+    run(int(argv[0]) if argv else DEFAULT_SIZE)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,54 @@
+"""
+Jeux de données des benchmarks, produits par le générateur de seeds/generate.py.
+
+Pour une taille `size` (clients et contrats) et une graine `seed`, les données sont
+toujours les mêmes (cf. seeds/generate.py). Tous les utilisateurs partagent un seul
+hachage bcrypt de PASSWORD : un hachage par utilisateur allongerait la préparation
+sans rien changer aux mesures.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.models import Clients
+from app.utils.security import hash_password
+from seeds.generate import DEFAULT_SEED, PASSWORD, generate
+
+INSERT_BATCH = 10_000
+
+
+@dataclass
+class Dataset:
+    """Ce qu'un scénario a besoin de connaître du jeu de données généré."""
+
+    size: int
+    seed: int
+    gestion_id: int
+    commercial_ids: list
+    support_ids: list
+    sample_email: str
+    sample_last_name: str
+    sample_username: str
+    history_end: datetime
+
+
+def generate_dataset(engine, size, seed=DEFAULT_SEED):
+    """Remplit la base (vide, schéma créé) de `engine`. Retourne le Dataset."""
+    data = generate(engine, size, seed=seed, batch_size=INSERT_BATCH, hashed_password=hash_password(PASSWORD))
+
+    sample = size // 2
+    with Session(bind=engine) as session:
+        sample_last_name = session.get(Clients, sample + 1).last_name
+    return Dataset(
+        size=size,
+        seed=seed,
+        gestion_id=data.user_ids["gestion"][0],
+        commercial_ids=data.user_ids["commercial"],
+        support_ids=data.user_ids["support"],
+        sample_email=f"client{sample}@perf.example",
+        sample_last_name=sample_last_name,
+        sample_username="gestion0",
+        history_end=data.history_end,
+    )
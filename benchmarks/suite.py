@@ -0,0 +1,401 @@
+"""
+Suite de benchmarks : contrôleurs, dépôts, vues et chiffrement, à volume réaliste.
+
+Usage :
+    python -m benchmarks.suite                                   # 10 000 lignes
+    python -m benchmarks.suite --sizes 10000 100000 1000000
+    python -m benchmarks.suite --only contracts --repeat 50
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.suite --data-dir /tmp/bench              # bases réutilisées d'un lancement à l'autre
+
+Pour chaque taille, une base SQLite est remplie par benchmarks/datasets.py (mêmes
+données à graine égale), puis chaque scénario est exécuté jusqu'à `--repeat` fois
+(au moins MIN_RUNS, dans la limite de `--max-seconds`), avec une session neuve à
+chaque exécution. Les résultats (médiane et minimum en ms) sont enregistrés en JSON.
+
+--compare relit des résultats enregistrés et signale les scénarios dont la médiane
+dépasse celle de référence de plus de `--threshold` (0.25 = +25 %) ; le code de
+retour vaut alors 1, pour une intégration continue.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from unittest import mock
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers.auth_controller import authenticate_user
+from app.controllers.contract_controller import list_contracts_page, summarize_contracts
+from app.controllers.event_controller import (
+    find_schedule_conflicts, list_all_events, list_events_page, propose_assignments,
+)
+from app.controllers.export_controller import export_batches
+from app.controllers.revenue_controller import revenue_dashboard
+from app.controllers.search_controller import search
+from app.engine import create_app_engine
+from app.models import Base, Contracts, Users
+from app.models.mixins import blind_index, decrypt_many, decrypt_value, encrypt_many, encrypt_value
+from app.repositories.client_repository import get_client_by_email, get_clients_page
+from app.repositories.contract_repository import get_contract_totals
+from app.repositories.event_repository import find_overlapping_event
+from app.repositories.user_repository import get_user_by_login
+from benchmarks.datasets import DEFAULT_SEED, PASSWORD, Dataset, generate_dataset
+
+DEFAULT_SIZES = (10_000,)
+DEFAULT_REPEAT = 20
+DEFAULT_MAX_SECONDS = 5.0
+DEFAULT_THRESHOLD = 0.25
+MIN_RUNS = 3
+# Écart absolu (ms) en dessous duquel une variation est du bruit de mesure
+NOISE_FLOOR_MS = 0.2
+ENCRYPTION_VALUES = 1_000
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    """Enregistre un scénario `groupe.nom` : fonction (session, dataset) exécutée à chaque mesure."""
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+# --- contrôleurs ---
+
+@scenario("controllers.list_all_events")
+def _list_all_events(session, data):
+    list_all_events(session)
+
+
+@scenario("controllers.list_events_page")
+def _list_events_page(session, data):
+    list_events_page(session)
+
+
+@scenario("controllers.list_contracts_page_unpaid")
+def _list_contracts_page_unpaid(session, data):
+    list_contracts_page(session, criteria=(Contracts.amount_due > 0,), profile="contract_filter")
+
+
+@scenario("controllers.summarize_contracts_unpaid")
+def _summarize_contracts_unpaid(session, data):
+    summarize_contracts(session, criteria=(Contracts.amount_due > 0,))
+
+
+@scenario("controllers.authenticate_user")
+def _authenticate_user(session, data):
+    user, error = authenticate_user(session, data.sample_username, PASSWORD)
+    assert error is None
+
+
+@scenario("controllers.search")
+def _search(session, data):
+    search(session, data.sample_last_name)
+
+
+@scenario("controllers.revenue_dashboard")
+def _revenue_dashboard(session, data):
+    revenue_dashboard(session)
+
+
+@scenario("controllers.find_schedule_conflicts")
+def _find_schedule_conflicts(session, data):
+    find_schedule_conflicts(session)
+
+
+@scenario("controllers.propose_assignments")
+def _propose_assignments(session, data):
+    propose_assignments(session, since=data.history_end)
+
+
+@scenario("controllers.export_clients")
+def _export_clients(session, data):
+    gestion = session.get(Users, data.gestion_id)
+    batches, _ = export_batches(session, "clients", gestion)
+    for _ in batches:
+        pass
+
+
+# --- dépôts ---
+
+@scenario("repositories.get_client_by_email")
+def _get_client_by_email(session, data):
+    get_client_by_email(session, data.sample_email)
+
+
+@scenario("repositories.get_user_by_login")
+def _get_user_by_login(session, data):
+    get_user_by_login(session, data.sample_username)
+
+
+@scenario("repositories.get_clients_page_decrypted")
+def _get_clients_page_decrypted(session, data):
+    get_clients_page(session, decrypt=("email", "phone"))
+
+
+@scenario("repositories.get_contract_totals")
+def _get_contract_totals(session, data):
+    get_contract_totals(session)
+
+
+@scenario("repositories.find_overlapping_event")
+def _find_overlapping_event(session, data):
+    start = data.history_end - timedelta(days=30)
+    find_overlapping_event(session, "support", data.support_ids[0], start, start + timedelta(days=1))
+
+
+# --- vues (saisies simulées, affichage Rich vers un fichier en mémoire) ---
+
+@contextmanager
+def quiet_view(session_factory, user, answers):
+    """Exécute une vue sans terminal : utilisateur connecté `user`, réponses `answers` aux Prompt.ask."""
+    from rich.console import Console
+    from app.views import client_view, contract_view, event_view, pager
+
+    modules = (client_view, contract_view, event_view, pager)
+    answers = iter(answers)
+    with mock.patch("app.utils.auth.get_current_user", return_value=user), \
+            mock.patch("rich.prompt.Prompt.ask", side_effect=lambda *a, **k: next(answers, "q")):
+        patches = [mock.patch.object(module, "console", Console(file=io.StringIO())) for module in modules]
+        patches += [mock.patch.object(module, "SessionLocal", session_factory)
+                    for module in modules if hasattr(module, "SessionLocal")]
+        for patch in patches:
+            patch.start()
+        try:
+            yield
+        finally:
+            for patch in reversed(patches):
+                patch.stop()
+
+
+@scenario("views.filter_contracts_view")
+def _filter_contracts_view(session, data):
+    from app.views.contract_view import filter_contracts_view
+
+    gestion = session.get(Users, data.gestion_id)
+    # Contrats non entièrement payés, trois pages
+    with quiet_view(data.session_factory, gestion, ["2", "n", "n", "q"]):
+        filter_contracts_view()
+
+
+@scenario("views.show_all_clients_view")
+def _show_all_clients_view(session, data):
+    from app.views.client_view import show_all_clients_view
+
+    gestion = session.get(Users, data.gestion_id)
+    with quiet_view(data.session_factory, gestion, ["n", "n", "q"]):
+        show_all_clients_view()
+
+
+# --- chiffrement ---
+
+@scenario("models.encrypt_decrypt_roundtrip")
+def _encrypt_decrypt_roundtrip(session, data):
+    for i in range(ENCRYPTION_VALUES):
+        decrypt_value(encrypt_value(f"client{i}@bench.example"))
+
+
+@scenario("models.decrypt_many")
+def _decrypt_many(session, data):
+    decrypt_many(data.ciphertexts)
+
+
+# --- mesure ---
+
+def measure(func, session_factory, data, repeat, max_seconds):
+    """Exécute `func` avec une session neuve à chaque fois. Retourne {"median_ms", "min_ms", "runs"}."""
+    timings = []
+    deadline = time.perf_counter() + max_seconds
+    while len(timings) < repeat and (len(timings) < MIN_RUNS or time.perf_counter() < deadline):
+        session = session_factory()
+        try:
+            start = time.perf_counter()
+            func(session, data)
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            session.close()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "runs": len(timings),
+    }
+
+
+def _database_path(data_dir, size, seed):
+    # La base dépend aussi de la clé de chiffrement : son empreinte fait partie du nom
+    key = blind_index("benchmarks")[:8]
+    return os.path.join(data_dir, f"bench-{size}-{seed}-{key}.db")
+
+
+def prepare(data_dir, size, seed):
+    """Base de benchmark de `size` lignes, générée ou reprise de `data_dir`. Retourne (engine, Dataset)."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = _database_path(data_dir, size, seed)
+    meta_path = path + ".json"
+    engine = create_app_engine(f"sqlite:///{path}")
+    if os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["history_end"] = datetime.fromisoformat(meta["history_end"])
+        return engine, Dataset(**meta)
+
+    if os.path.exists(path):
+        os.remove(path)  # génération interrompue
+    Base.metadata.create_all(engine)
+    data = generate_dataset(engine, size, seed=seed)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(data), f, default=str)
+    return engine, data
+
+
+def run_suite(sizes, seed=DEFAULT_SEED, only=None, repeat=DEFAULT_REPEAT, max_seconds=DEFAULT_MAX_SECONDS,
+              data_dir=None, on_result=None):
+    """
+    Exécute les scénarios (ceux dont le nom contient `only`) pour chaque taille.
+    `on_result(taille, scénario, mesure)` est appelée après chaque mesure.
+    Retourne les résultats au format enregistré par --save.
+    """
+    names = [name for name in SCENARIOS if not only or only in name]
+    results = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "seed": seed,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            engine, data = prepare(data_dir or tmp, size, seed)
+            data.session_factory = sessionmaker(bind=engine)
+            data.ciphertexts = encrypt_many(f"client{i}@bench.example" for i in range(ENCRYPTION_VALUES))
+            timings = results["results"].setdefault(str(size), {})
+            for name in names:
+                timings[name] = measure(SCENARIOS[name], data.session_factory, data, repeat, max_seconds)
+                if on_result:
+                    on_result(size, name, timings[name])
+            engine.dispose()
+    return results
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare deux résultats, taille par taille et scénario par scénario.
+    Retourne une liste de dicts (size, name, baseline_ms, current_ms, ratio, status),
+    status valant "regression", "improvement", "ok", "new" ou "missing".
+    """
+    rows = []
+    for size, timings in current["results"].items():
+        reference = baseline["results"].get(size, {})
+        for name, timing in timings.items():
+            new = timing["median_ms"]
+            if name not in reference:
+                rows.append({"size": size, "name": name, "baseline_ms": None, "current_ms": new,
+                             "ratio": None, "status": "new"})
+                continue
+            old = reference[name]["median_ms"]
+            ratio = new / old if old else None
+            status = "ok"
+            if abs(new - old) > NOISE_FLOOR_MS:
+                if new > old * (1 + threshold):
+                    status = "regression"
+                elif new < old / (1 + threshold):
+                    status = "improvement"
+            rows.append({"size": size, "name": name, "baseline_ms": old, "current_ms": new,
+                         "ratio": ratio, "status": status})
+        for name in reference.keys() - timings.keys():
+            rows.append({"size": size, "name": name, "baseline_ms": reference[name]["median_ms"],
+                         "current_ms": None, "ratio": None, "status": "missing"})
+    return rows
+
+
+STATUS_LABELS = {
+    "regression": "RÉGRESSION",
+    "improvement": "amélioration",
+    "ok": "ok",
+    "new": "nouveau",
+    "missing": "absent",
+}
+
+
+def print_comparison(rows, threshold):
+    print(f"\nComparaison avec la référence (seuil : +{threshold:.0%})")
+    for row in rows:
+        old = "-" if row["baseline_ms"] is None else f"{row['baseline_ms']:.3f}"
+        new = "-" if row["current_ms"] is None else f"{row['current_ms']:.3f}"
+        ratio = "" if row["ratio"] is None else f"x{row['ratio']:.2f}"
+        print(f"{row['size']:>9} {row['name']:<45} {old:>11} → {new:>11} ms {ratio:>7}  "
+              f"{STATUS_LABELS[row['status']]}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmarks du CRM sur des données synthétiques.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="nombres de lignes")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="graine des données")
+    parser.add_argument("--only", help="ne lancer que les scénarios dont le nom contient ce texte")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="mesures par scénario au plus")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="durée au-delà de laquelle un scénario n'est plus répété (après MIN_RUNS)")
+    parser.add_argument("--data-dir", help="dossier où garder les bases générées (temporaire par défaut)")
+    parser.add_argument("--save", help="enregistrer les résultats dans ce fichier JSON")
+    parser.add_argument("--compare", help="résultats JSON de référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="hausse relative de la médiane tolérée (0.25 = +25 %%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    def show(size, name, timing):
+        print(f"{size:>9} {name:<45} {timing['median_ms']:>11.3f} ms (min {timing['min_ms']:.3f}, "
+              f"{timing['runs']} mesure(s))", flush=True)
+
+    results = run_suite(args.sizes, seed=args.seed, only=args.only, repeat=args.repeat,
+                        max_seconds=args.max_seconds, data_dir=args.data_dir, on_result=show)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Résultats enregistrés dans {args.save}")
+
+    if baseline is None:
+        return 0
+    rows = compare(baseline, results, args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"❌ {len(regressions)} régression(s) au-delà de +{args.threshold:.0%}.")
+        return 1
+    print("✅ Aucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+"""
+Ligne de commande non interactive du CRM, pour les scripts et les tâches planifiées.
+
+Usage :
+    python cli.py clients list --format jsonl
+    python cli.py contracts update 12 --amount-due 0 --signed
+    python cli.py events assign --apply
+    python cli.py batch operations.txt        # une commande par ligne, une seule session
+
+Authentification : jeton d'API (--token ou variable EPIC_API_TOKEN, créé par
+`python cli.py token create`), sinon le jeton de la session ouverte par main.py.
+Les commandes appellent directement les contrôleurs, avec les mêmes droits par rôle
+que les menus. Les listes sont écrites en CSV ou JSONL (sortie standard par défaut),
+les autres commandes écrivent une ligne JSON par résultat ; les erreurs vont sur la
+sortie d'erreur et le code de retour vaut 1.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import sys
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from app.config import SessionLocal
+from app.controllers.client_controller import create_client, update_client
+from app.controllers.contract_controller import create_contract, update_contract
+from app.controllers.event_controller import (
+    apply_assignments, create_event, find_schedule_conflicts, propose_assignments, update_event,
+)
+from app.controllers.export_controller import EXPORT_COLUMNS, EXPORT_TYPES, export_batches
+from app.models import Contracts, Users
+from app.repositories.pagination import DEFAULT_BATCH_SIZE
+from app.utils.assignment import ASSIGNMENT_WINDOW_DAYS
+from app.utils.auth import TOKEN_FILE
+from app.utils.exporters import STDOUT, write_export
+from app.utils.jwt_handler import API_TOKEN_EXPIRE_DAYS, create_api_token, decode_jwt_token, is_api_token
+
+TOKEN_ENV = "EPIC_API_TOKEN"
+LIST_FORMATS = ("jsonl", "csv")
+
+# (entité, action) -> rôles autorisés, comme les menus
+PERMISSIONS = {
+    ("clients", "list"): ("commercial", "gestion"),
+    ("clients", "create"): ("commercial",),
+    ("clients", "update"): ("commercial",),
+    ("contracts", "list"): ("commercial", "gestion"),
+    ("contracts", "create"): ("gestion", "commercial"),
+    ("contracts", "update"): ("gestion", "commercial"),
+    ("events", "list"): ("commercial", "gestion", "support"),
+    ("events", "create"): ("commercial",),
+    ("events", "update"): ("support", "gestion"),
+    ("events", "assign"): ("gestion",),
+    ("events", "conflicts"): ("gestion",),
+    ("token", "create"): ("commercial", "gestion", "support"),
+}
+
+
+# --- authentification ---
+
+def authenticate(session, token=None):
+    """
+    Retrouve l'utilisateur du jeton `token`, de la variable EPIC_API_TOKEN ou du
+    fichier .token (session de main.py).
+    Retourne (utilisateur, jeton_api, None) ou (None, False, erreur) ; `jeton_api` vient
+    du type inscrit dans le jeton, pas de la façon dont il a été fourni.
+    """
+    token = token or os.getenv(TOKEN_ENV)
+    if not token:
+        if not os.path.exists(TOKEN_FILE):
+            return None, False, f"🔒 Aucun jeton : utilisez --token, {TOKEN_ENV} ou connectez-vous (python main.py)."
+        with open(TOKEN_FILE, "r") as f:
+            token = f.read().strip()
+
+    payload, error = decode_jwt_token(token)
+    if error:
+        return None, False, f"❌ Erreur d'authentification : {error}"
+    user = session.get(Users, int(payload["sub"]))
+    if user is None:
+        return None, False, "❌ Erreur d'authentification : utilisateur introuvable"
+    return user, is_api_token(payload), None
+
+
+# --- conversions des arguments ---
+
+def _date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date invalide : {value} (format YYYY-MM-DD)")
+
+
+def _amount(value):
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"montant invalide : {value}")
+    if amount < 0:
+        raise argparse.ArgumentTypeError(f"montant négatif : {value}")
+    return amount
+
+
+def _given(**fields):
+    """Champs renseignés sur la ligne de commande (les autres ne sont pas modifiés)."""
+    return {field: value for field, value in fields.items() if value is not None}
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+# --- commandes ---
+
+def list_entities(session, user, args):
+    """Écrit les clients, contrats ou événements visibles par l'utilisateur (comme export_data.py)."""
+    batches, error = export_batches(session, args.entity, user, batch_size=args.batch_size)
+    if error:
+        return None, error
+    try:
+        count = write_export(args.output, EXPORT_COLUMNS[args.entity], batches, fmt=args.format,
+                             types=EXPORT_TYPES[args.entity])
+    except ValueError as e:
+        return None, f"❌ {e}"
+    # Les lignes occupent déjà la sortie standard : pas de résultat JSON en plus
+    return (None if args.output == STDOUT else {"rows": count, "output": args.output}), None
+
+
+def create_client_command(session, user, args):
+    client, error = create_client(
+        session, args.first_name, args.last_name, args.email, args.phone, args.company, user.id
+    )
+    return (None, error) if error else ({"id": client.id}, None)
+
+
+def update_client_command(session, user, args):
+    updates = _given(first_name=args.first_name, last_name=args.last_name, email=args.email,
+                     phone=args.phone, company_name=args.company)
+    if not updates:
+        return None, "❌ Aucune modification demandée."
+    client, error = update_client(session, args.id, updates, user)
+    return (None, error) if error else ({"id": client.id}, None)
+
+
+def create_contract_command(session, user, args):
+    if args.amount_due > args.total_amount:
+        return None, "❌ Le montant dû ne peut pas être supérieur au montant total."
+    commercial_id = user.id if user.role.name == "commercial" else args.commercial_id
+    if commercial_id is None:
+        return None, "❌ --commercial-id est requis pour le rôle gestion."
+    contract, error = create_contract(
+        session, args.client_id, commercial_id, args.total_amount, args.amount_due, args.signed
+    )
+    return (None, error) if error else ({"id": contract.id}, None)
+
+
+def update_contract_command(session, user, args):
+    updates = _given(total_amount=args.total_amount, amount_due=args.amount_due, is_signed=args.signed)
+    if not updates:
+        return None, "❌ Aucune modification demandée."
+    contract, error = update_contract(session, args.id, updates, user)
+    return (None, error) if error else ({"id": contract.id}, None)
+
+
+def create_event_command(session, user, args):
+    # Comme la vue : contrat signé d'un client du commercial connecté
+    contract = session.get(Contracts, args.contract_id)
+    if contract is None or contract.client.commercial_id != user.id:
+        return None, f"❌ Contrat ID {args.contract_id} introuvable parmi vos clients."
+    if not contract.is_signed:
+        return None, f"❌ Le contrat ID {args.contract_id} n'est pas signé."
+    event, error = create_event(
+        session, name=args.name, contract_id=contract.id, client_id=contract.client_id,
+        date_start=args.start, date_end=args.end, location=args.location,
+        attendees=args.attendees, notes=args.notes,
+    )
+    return (None, error) if error else ({"id": event.id}, None)
+
+
+def update_event_command(session, user, args):
+    updates = _given(support_contact_id=args.support_id, name=args.name, date_start=args.start,
+                     date_end=args.end, location=args.location, attendees=args.attendees, notes=args.notes)
+    if not updates:
+        return None, "❌ Aucune modification demandée."
+    event, error = update_event(session, args.id, updates, user)
+    return (None, error) if error else ({"id": event.id}, None)
+
+
+def assign_events_command(session, user, args):
+    proposal, error = propose_assignments(session, since=args.since, window_days=args.window_days)
+    if error:
+        return None, error
+    result = {
+        "proposed": len(proposal["assignments"]),
+        "unassigned": proposal["unassigned"],
+        "supports": {
+            str(support_id): load for support_id, load in proposal["supports"].items() if load["events"]
+        },
+        "applied": 0,
+    }
+    if args.apply and proposal["assignments"]:
+        count, error = apply_assignments(session, proposal["assignments"], user)
+        if error:
+            return None, error
+        result["applied"] = count
+    return result, None
+
+
+def schedule_conflicts_command(session, user, args):
+    return {"conflicts": find_schedule_conflicts(session, batch_size=args.batch_size)}, None
+
+
+def create_token_command(session, user, args):
+    return {"token": create_api_token(user, days=args.days), "user": user.username, "days": args.days}, None
+
+
+# --- analyse des arguments ---
+
+def _add_list_parser(actions, entity):
+    parser = actions.add_parser("list", help=f"lister les {entity} (CSV ou JSONL)")
+    parser.add_argument("--format", choices=LIST_FORMATS, default="jsonl", help="format de sortie")
+    parser.add_argument("--output", default=STDOUT, help="fichier de sortie (sortie standard par défaut)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="lignes lues par lot")
+    parser.set_defaults(handler=list_entities)
+
+
+def _add_client_fields(parser, required):
+    parser.add_argument("--first-name", required=required)
+    parser.add_argument("--last-name", required=required)
+    parser.add_argument("--email", required=required)
+    parser.add_argument("--phone", required=required)
+    parser.add_argument("--company", required=required, help="nom de l'entreprise")
+
+
+def _add_event_fields(parser, required):
+    parser.add_argument("--name", required=required)
+    parser.add_argument("--start", type=_date, required=required, help="date de début (YYYY-MM-DD)")
+    parser.add_argument("--end", type=_date, required=required, help="date de fin (YYYY-MM-DD)")
+    parser.add_argument("--location", required=required)
+    parser.add_argument("--attendees", type=int)
+    parser.add_argument("--notes")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Commandes non interactives du CRM.")
+    parser.add_argument("--token", help=f"jeton d'API (sinon {TOKEN_ENV}, puis la session de main.py)")
+    entities = parser.add_subparsers(dest="entity", required=True)
+
+    clients = entities.add_parser("clients", help="clients").add_subparsers(dest="action", required=True)
+    _add_list_parser(clients, "clients")
+    create = clients.add_parser("create", help="créer un client (commercial)")
+    _add_client_fields(create, required=True)
+    create.set_defaults(handler=create_client_command)
+    update = clients.add_parser("update", help="modifier un client (commercial)")
+    update.add_argument("id", type=int)
+    _add_client_fields(update, required=False)
+    update.set_defaults(handler=update_client_command)
+
+    contracts = entities.add_parser("contracts", help="contrats").add_subparsers(dest="action", required=True)
+    _add_list_parser(contracts, "contrats")
+    create = contracts.add_parser("create", help="créer un contrat")
+    create.add_argument("--client-id", type=int, required=True)
+    create.add_argument("--commercial-id", type=int, help="commercial du contrat (rôle gestion)")
+    create.add_argument("--total-amount", type=_amount, required=True)
+    create.add_argument("--amount-due", type=_amount, required=True)
+    create.add_argument("--signed", action="store_true")
+    create.set_defaults(handler=create_contract_command)
+    update = contracts.add_parser("update", help="modifier un contrat")
+    update.add_argument("id", type=int)
+    update.add_argument("--total-amount", type=_amount)
+    update.add_argument("--amount-due", type=_amount)
+    update.add_argument("--signed", dest="signed", action="store_true", default=None)
+    update.add_argument("--unsigned", dest="signed", action="store_false")
+    update.set_defaults(handler=update_contract_command)
+
+    events = entities.add_parser("events", help="événements").add_subparsers(dest="action", required=True)
+    _add_list_parser(events, "événements")
+    create = events.add_parser("create", help="créer un événement sur un contrat signé (commercial)")
+    create.add_argument("--contract-id", type=int, required=True)
+    _add_event_fields(create, required=True)
+    create.set_defaults(handler=create_event_command)
+    update = events.add_parser("update", help="modifier un événement")
+    update.add_argument("id", type=int)
+    update.add_argument("--support-id", type=int, help="support affecté (rôle gestion)")
+    _add_event_fields(update, required=False)
+    update.set_defaults(handler=update_event_command)
+    assign = events.add_parser("assign", help="affecter automatiquement les supports (gestion)")
+    assign.add_argument("--apply", action="store_true", help="enregistrer les affectations proposées")
+    assign.add_argument("--since", type=_date, help="événements à partir de cette date (aujourd'hui par défaut)")
+    assign.add_argument("--window-days", type=int, default=ASSIGNMENT_WINDOW_DAYS)
+    assign.set_defaults(handler=assign_events_command)
+    conflicts = events.add_parser("conflicts", help="rapport des conflits de planning (gestion)")
+    conflicts.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    conflicts.set_defaults(handler=schedule_conflicts_command)
+
+    token = entities.add_parser("token", help="jetons d'API").add_subparsers(dest="action", required=True)
+    create = token.add_parser("create", help="créer un jeton d'API pour l'utilisateur connecté")
+    create.add_argument("--days", type=int, default=API_TOKEN_EXPIRE_DAYS, help="durée de validité")
+    create.set_defaults(handler=create_token_command)
+
+    batch = entities.add_parser("batch", help="exécuter les commandes d'un fichier (une par ligne)")
+    batch.add_argument("file", help="fichier de commandes (\"-\" : entrée standard)")
+    batch.add_argument("--stop-on-error", action="store_true", help="s'arrêter à la première erreur")
+    return parser
+
+
+# --- exécution ---
+
+def _report(command, result, error, out, err):
+    if error:
+        print(json.dumps({"command": command, "ok": False, "error": error}, ensure_ascii=False), file=err)
+    elif result is not None:
+        line = {"command": command, "ok": True, **result}
+        print(json.dumps(line, ensure_ascii=False, default=_to_json), file=out)
+
+
+def run_command(session, user, args, api_token=False):
+    """
+    Exécute une commande analysée pour `user`. Retourne (résultat, erreur).
+    `api_token` : l'utilisateur s'est authentifié par jeton d'API, qui ne peut pas en créer d'autres.
+    """
+    if api_token and args.entity == "token":
+        return None, "⛔ Un jeton d'API se crée depuis une session ouverte par main.py."
+    roles = PERMISSIONS[(args.entity, args.action)]
+    if user.role.name not in roles:
+        return None, f"⛔ Accès refusé : rôle requis : {', '.join(roles)} | rôle actuel : {user.role.name}"
+    try:
+        return args.handler(session, user, args)
+    except Exception as e:
+        session.rollback()
+        return None, f"❌ Erreur inattendue : {e}"
+
+
+def run_batch(session, user, lines, parser, stop_on_error=False, api_token=False, out=sys.stdout, err=sys.stderr):
+    """
+    Exécute les commandes `lines` (syntaxe de la ligne de commande, sans « python cli.py »)
+    dans la même session. Les lignes vides et les commentaires (#) sont ignorés.
+    Retourne (nombre de commandes réussies, nombre d'erreurs).
+    """
+    done = failed = 0
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        command = f"{number}: {line}"
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except (SystemExit, ValueError):
+            args, result, error = None, None, "❌ Commande invalide."
+        if args is not None and args.entity == "batch":
+            result, error = None, "❌ Un fichier de commandes ne peut pas en appeler un autre."
+        elif args is not None:
+            result, error = run_command(session, user, args, api_token=api_token)
+        _report(command, result, error, out, err)
+        if error:
+            failed += 1
+            if stop_on_error:
+                break
+        else:
+            done += 1
+    return done, failed
+
+
+def main(argv=None):
+    """Point d'entrée du script."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    session = SessionLocal()
+    try:
+        user, api_token, error = authenticate(session, args.token)
+        if error:
+            print(error, file=sys.stderr)
+            return 1
+
+        if args.entity != "batch":
+            result, error = run_command(session, user, args, api_token=api_token)
+            _report(f"{args.entity} {args.action}", result, error, sys.stdout, sys.stderr)
+            return 1 if error else 0
+
+        if args.file == "-":
+            _, failed = run_batch(session, user, sys.stdin, parser, args.stop_on_error, api_token)
+        else:
+            with open(args.file, "r", encoding="utf-8") as f:
+                _, failed = run_batch(session, user, f, parser, args.stop_on_error, api_token)
+        return 1 if failed else 0
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,8 @@ import getpass
 from sqlalchemy.exc import IntegrityError
 from app.config import SessionLocal, engine
 from app.models import Base, Users, Roles
-from passlib.context import CryptContext
-
-# Contexte pour le hashage bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    """Retourne un mot de passe hashé (bcrypt)."""
-    return pwd_context.hash(password)
+from app.repositories.user_repository import get_user_by_email
+from app.utils.security import hash_password
 
 
 def ensure_roles(session):
@@ -37,7 +31,7 @@ def create_user(username: str, email: str, password: str, role_name: str = "gest
             return
 
         # Vérifier que l'email ou le username n'existe pas déjà
-        if session.query(Users).filter_by(email=email).first():
+        if get_user_by_email(session, email):
             print(f"❌ L'email {email} est déjà utilisé.")
             return
 
@@ -0,0 +1,69 @@
+"""
+Export en flux des clients, contrats ou événements (CSV, JSONL ou Parquet).
+
+Usage (utilisateur connecté via main.py) :
+    python export_data.py contracts contrats.csv
+    python export_data.py clients clients.jsonl --batch-size 5000
+    python export_data.py events evenements.parquet     # nécessite pyarrow
+
+Les lignes sont lues par lots (yield_per) et écrites au fur et à mesure : la mémoire
+reste constante quel que soit le volume. Le périmètre dépend du rôle de l'utilisateur
+connecté (un commercial n'exporte que ses clients, un support ses événements).
+"""
+
+import argparse
+import sys
+from app.config import SessionLocal
+from app.controllers.export_controller import EXPORT_COLUMNS, EXPORT_TYPES, export_batches
+from app.repositories.pagination import DEFAULT_BATCH_SIZE
+from app.utils.auth import get_current_user
+from app.utils.exporters import FORMATS, write_export
+
+
+def run_export(session, entity, path, current_user, fmt=None, batch_size=DEFAULT_BATCH_SIZE, on_progress=None):
+    """Exporte `entity` dans `path`. Retourne (nombre de lignes, None) ou (None, message d'erreur)."""
+    batches, error = export_batches(session, entity, current_user, batch_size=batch_size)
+    if error:
+        return None, error
+    try:
+        return write_export(path, EXPORT_COLUMNS[entity], batches, fmt=fmt, on_progress=on_progress,
+                            types=EXPORT_TYPES[entity]), None
+    except ValueError as e:
+        return None, f"❌ {e}"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Export en flux des données du CRM.")
+    parser.add_argument("entity", choices=EXPORT_COLUMNS, help="données à exporter")
+    parser.add_argument("path", help="fichier de sortie")
+    parser.add_argument("--format", choices=FORMATS, help="format (déduit de l'extension par défaut)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="lignes lues par lot")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Point d'entrée du script."""
+    args = parse_args(argv)
+    current_user = get_current_user()
+    if not current_user:
+        print("⛔ Connectez-vous (python main.py) avant d'exporter.")
+        return 1
+
+    session = SessionLocal()
+    try:
+        count, error = run_export(
+            session, args.entity, args.path, current_user, fmt=args.format, batch_size=args.batch_size,
+            on_progress=lambda written: print(f"… {written:,} ligne(s) écrite(s)", flush=True),
+        )
+    finally:
+        session.close()
+
+    if error:
+        print(error)
+        return 1
+    print(f"✅ Export terminé : {count:,} ligne(s) dans {args.path}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Import en masse de clients depuis un fichier CSV ou JSONL.
+
+Usage :
+    python import_clients.py partenaires.csv --commercial-id 3
+    python import_clients.py partenaires.jsonl --chunk-size 5000 --errors rejets.csv
+
+Colonnes / clés attendues : first_name, last_name, email, phone, company_name.
+Le fichier est lu par lots de taille fixe (mémoire constante) ; chaque lot est
+dédoublonné, chiffré et inséré en une fois, puis validé par un commit.
+"""
+
+import argparse
+import csv
+import sys
+from app.config import SessionLocal
+from app.controllers.client_controller import import_clients_chunk
+from app.models import Users
+from app.utils.importers import FORMATS, chunked, read_records
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def run_import(session, path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, commercial_id=None,
+               on_error=None, on_progress=None):
+    """
+    Importe le fichier `path` lot par lot.
+    `on_error(ligne, message)` est appelée pour chaque ligne rejetée,
+    `on_progress(lues, importées, rejetées)` après chaque lot.
+    Retourne (lues, importées, rejetées).
+    """
+    read = imported = rejected = 0
+    for chunk in chunked(read_records(path, fmt), chunk_size):
+        count, errors = import_clients_chunk(session, chunk, commercial_id=commercial_id)
+        read += len(chunk)
+        imported += count
+        rejected += len(errors)
+        if on_error:
+            for line, message in errors:
+                on_error(line, message)
+        if on_progress:
+            on_progress(read, imported, rejected)
+    return read, imported, rejected
+
+
+def check_commercial(session, commercial_id):
+    """Retourne un message d'erreur si `commercial_id` n'est pas un commercial, sinon None."""
+    commercial = session.get(Users, commercial_id)
+    if not commercial:
+        return f"❌ Commercial ID {commercial_id} introuvable."
+    if commercial.role.name != "commercial":
+        return f"❌ L'utilisateur ID {commercial_id} n'est pas un commercial."
+    return None
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Import en masse de clients (CSV ou JSONL).")
+    parser.add_argument("path", help="fichier à importer")
+    parser.add_argument("--format", choices=FORMATS, help="format du fichier (déduit de l'extension par défaut)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lignes par lot (un commit par lot)")
+    parser.add_argument("--commercial-id", type=int, help="commercial affecté aux clients importés")
+    parser.add_argument("--errors", help="fichier CSV où écrire les lignes rejetées (sinon : sortie d'erreur)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Point d'entrée du script."""
+    args = parse_args(argv)
+    session = SessionLocal()
+    errors_file = open(args.errors, "w", newline="", encoding="utf-8") if args.errors else None
+    try:
+        if args.commercial_id is not None:
+            error = check_commercial(session, args.commercial_id)
+            if error:
+                print(error)
+                return 1
+
+        if errors_file:
+            writer = csv.writer(errors_file)
+            writer.writerow(["ligne", "erreur"])
+            on_error = lambda line, message: writer.writerow([line, message])
+        else:
+            on_error = lambda line, message: print(f"⚠️  Ligne {line} : {message}", file=sys.stderr)
+
+        def on_progress(read, imported, rejected):
+            print(f"… {read:,} ligne(s) lue(s) | {imported:,} importée(s) | {rejected:,} rejetée(s)", flush=True)
+
+        read, imported, rejected = run_import(
+            session, args.path, fmt=args.format, chunk_size=args.chunk_size,
+            commercial_id=args.commercial_id, on_error=on_error, on_progress=on_progress,
+        )
+        print(f"✅ Import terminé : {imported:,} client(s) importé(s), {rejected:,} ligne(s) rejetée(s) sur {read:,}.")
+        return 0
+    finally:
+        if errors_file:
+            errors_file.close()
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,44 @@
+import argparse
+
+from app.utils.lazy import run_in_background
 from app.views.login import login
-from app.menus.main_menu import main_menu
-import sentry_sdk
 
+SENTRY_DSN = "https://9e3789b7c2b1a67367ea058d3f20bc87@o4509668801773568.ingest.de.sentry.io/4509668806099024"
+
+
+def init_sentry():
+    import sentry_sdk
 
-def main():
     sentry_sdk.init(
-        dsn="https://9e3789b7c2b1a67367ea058d3f20bc87@o4509668801773568.ingest.de.sentry.io/4509668806099024",
+        dsn=SENTRY_DSN,
         # Add data like request headers and IP for users,
         # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
         send_default_pii=True,
     )
-    
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Epic Events CRM")
+    parser.add_argument(
+        "--profile", nargs="?", const="profiles", metavar="DOSSIER",
+        help="profile chaque action de menu (cProfile) et écrit les profils dans DOSSIER (défaut : profiles)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        from app.utils.profiling import enable_profiling
+        enable_profiling(args.profile)
+
+    # Sentry s'initialise pendant la saisie des identifiants
+    run_in_background(init_sentry, "sentry-init")
+
     user = login()
     if user:
+        # Menus chargés après la connexion ; les vues, à leur première ouverture
+        from app.menus.main_menu import main_menu
         main_menu(user)
 
 
@@ -0,0 +1,64 @@
+"""Applique les migrations de schéma en attente (voir le paquet migrations)."""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
+from app.config import engine
+from app.models import Base
+from migrations import MIGRATIONS
+
+metadata = MetaData()
+
+# Migrations déjà appliquées à la base
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("name", String, primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def applied_migrations(connection):
+    """Noms des migrations déjà appliquées."""
+    return set(connection.execute(select(schema_migrations.c.name)).scalars())
+
+
+def migrate(bind, migrations=MIGRATIONS):
+    """
+    Applique, dans l'ordre, les migrations absentes de schema_migrations.
+    Chaque migration est exécutée et enregistrée dans sa propre transaction.
+    Retourne les noms des migrations appliquées.
+    """
+    metadata.create_all(bind)
+    with bind.connect() as connection:
+        done = applied_migrations(connection)
+
+    applied = []
+    for migration in migrations:
+        if migration.NAME in done:
+            continue
+        with bind.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(
+                schema_migrations.insert().values(name=migration.NAME, applied_at=datetime.utcnow())
+            )
+        applied.append(migration.NAME)
+    return applied
+
+
+def main():
+    """Point d'entrée du script."""
+    Base.metadata.create_all(bind=engine)
+    try:
+        applied = migrate(engine)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+    if applied:
+        for name in applied:
+            print(f"✅ Migration appliquée : {name}")
+    else:
+        print("ℹ️ Base déjà à jour.")
+
+
+if __name__ == "__main__":
+    main()
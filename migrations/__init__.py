@@ -0,0 +1,22 @@
+"""
+Migrations de schéma, appliquées dans l'ordre par migrate.py.
+
+Chaque module expose NAME (identifiant unique, préfixé par un numéro d'ordre)
+et upgrade(connection), exécutée dans une transaction. Les migrations doivent
+être idempotentes : une base créée par create_all possède déjà le schéma cible.
+Elles écrivent leur DDL et leurs requêtes en SQL, figés au moment de la migration,
+sans les déduire des modèles ni du code de l'application, qui évoluent ensuite.
+"""
+
+from migrations import m000_blind_index, m001_hot_query_indexes, m002_search_index, m003_event_schedule_index, m004_revenue_summaries, m005_money_cents
+from migrations import m006_event_overlap_indexes
+
+MIGRATIONS = [
+    m000_blind_index,
+    m001_hot_query_indexes,
+    m002_search_index,
+    m003_event_schedule_index,
+    m004_revenue_summaries,
+    m005_money_cents,
+    m006_event_overlap_indexes,
+]
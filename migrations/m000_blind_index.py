@@ -0,0 +1,92 @@
+"""
+Index aveugle des emails chiffrés (email_bidx) sur les bases antérieures à son introduction.
+
+Ajoute la colonne aux tables clients et users, calcule l'index des lignes qui n'en
+ont pas (par lots de BATCH_SIZE, déchiffrement en masse), puis crée les index
+uniques. Si deux lignes partagent le même email, la migration échoue et n'est pas
+enregistrée : sa transaction est annulée en entier, index déjà calculés compris
+(sous SQLite, la colonne ajoutée subsiste, vide). Relancée une fois les doublons
+corrigés, elle recalcule l'index de toutes les lignes.
+"""
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import inspect, text
+from app.models.mixins import blind_index, decrypt_many
+
+NAME = "000_blind_index"
+
+BATCH_SIZE = 500
+
+# Tables disposant d'un email chiffré (colonne email) indexé en aveugle
+INDEXED_TABLES = ("clients", "users")
+
+
+def add_blind_index_columns(connection):
+    """Ajoute la colonne email_bidx aux tables créées avant son introduction. Retourne les tables modifiées."""
+    inspector = inspect(connection)
+    altered = []
+    for table in INDEXED_TABLES:
+        if not inspector.has_table(table):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "email_bidx" not in columns:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN email_bidx VARCHAR(64)"))
+            altered.append(table)
+    return altered
+
+
+def backfill_table(connection, table, batch_size=BATCH_SIZE):
+    """
+    Calcule l'index aveugle des lignes de `table` qui n'en ont pas encore, par lots
+    de `batch_size` lignes pour borner la mémoire. Retourne le nombre de lignes mises à jour.
+    """
+    select_batch = text(f"SELECT id, email FROM {table} WHERE email_bidx IS NULL ORDER BY id LIMIT :limit")
+    update_row = text(f"UPDATE {table} SET email_bidx = :bidx WHERE id = :id")
+    updated = 0
+    while True:
+        rows = connection.execute(select_batch, {"limit": batch_size}).all()
+        if not rows:
+            break
+
+        emails = decrypt_many(ciphertext for _, ciphertext in rows)
+        connection.execute(
+            update_row, [{"id": row_id, "bidx": blind_index(email)} for (row_id, _), email in zip(rows, emails)]
+        )
+        updated += len(rows)
+
+    return updated
+
+
+def find_duplicates(connection, table):
+    """Retourne les index aveugles partagés par plusieurs lignes (emails en double)."""
+    return connection.execute(text(
+        f"SELECT email_bidx FROM {table} WHERE email_bidx IS NOT NULL "
+        "GROUP BY email_bidx HAVING COUNT(*) > 1"
+    )).scalars().all()
+
+
+def create_blind_index_indexes(connection):
+    """Crée les index uniques sur email_bidx s'ils n'existent pas encore."""
+    for table in INDEXED_TABLES:
+        connection.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{table}_email_bidx ON {table} (email_bidx)"))
+
+
+def upgrade(connection):
+    """Ajoute, remplit et indexe email_bidx ; lève RuntimeError si des emails sont en double."""
+    add_blind_index_columns(connection)
+
+    for table in INDEXED_TABLES:
+        try:
+            backfill_table(connection, table)
+        except InvalidToken:
+            raise RuntimeError(
+                f"Emails de {table} indéchiffrables : FERNET_KEY n'est pas la clé de cette base."
+            ) from None
+        duplicates = find_duplicates(connection, table)
+        if duplicates:
+            raise RuntimeError(
+                f"{len(duplicates)} email(s) en double dans {table} : "
+                "corrigez-les avant de relancer la migration."
+            )
+
+    create_blind_index_indexes(connection)
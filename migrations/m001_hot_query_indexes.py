@@ -0,0 +1,30 @@
+"""Index des clés étrangères et des colonnes filtrées par les vues de liste."""
+
+from sqlalchemy import text
+
+NAME = "001_hot_query_indexes"
+
+# DDL figée au moment de la migration (les modèles peuvent évoluer depuis) :
+# (nom, table (colonnes) [WHERE filtre de l'index partiel])
+INDEXES = (
+    ("ix_clients_commercial_id", "clients (commercial_id)"),
+    ("ix_clients_last_name_id", "clients (last_name, id)"),
+    ("ix_contracts_client_id", "contracts (client_id)"),
+    ("ix_contracts_commercial_id", "contracts (commercial_id)"),
+    ("ix_contracts_date_created_id", "contracts (date_created, id)"),
+    ("ix_contracts_signed_created", "contracts (is_signed, date_created, id)"),
+    ("ix_contracts_unpaid_created", "contracts (date_created, id) WHERE amount_due > 0"),
+    ("ix_contracts_paid_created", "contracts (date_created, id) WHERE amount_due = 0"),
+    ("ix_events_client_id", "events (client_id)"),
+    ("ix_events_contract_id", "events (contract_id)"),
+    ("ix_events_date_start_id", "events (date_start, id)"),
+    ("ix_events_date_end", "events (date_end)"),
+    ("ix_events_support_date_start", "events (support_contact_id, date_start)"),
+)
+INDEX_NAMES = tuple(name for name, _ in INDEXES)
+
+
+def upgrade(connection):
+    """Crée les index s'ils n'existent pas encore."""
+    for name, definition in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
@@ -0,0 +1,13 @@
+"""Tables plein texte (FTS5) des clients et des événements, remplies à partir des données existantes."""
+
+from app.models.search import create_search_tables, rebuild_search_index
+
+NAME = "002_search_index"
+
+
+def upgrade(connection):
+    """Crée les tables FTS5 et indexe les lignes existantes (SQLite uniquement)."""
+    if connection.dialect.name != "sqlite":
+        return
+    create_search_tables(connection)
+    rebuild_search_index(connection)
@@ -0,0 +1,17 @@
+"""Index (lieu, date de début) utilisé par la détection des conflits de planning."""
+
+from sqlalchemy import text
+
+NAME = "003_event_schedule_index"
+
+# DDL figée au moment de la migration : (nom, table (colonnes))
+INDEXES = (
+    ("ix_events_location_date_start", "events (location, date_start)"),
+)
+INDEX_NAMES = tuple(name for name, _ in INDEXES)
+
+
+def upgrade(connection):
+    """Crée les index s'ils n'existent pas encore."""
+    for name, definition in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
@@ -0,0 +1,55 @@
+"""Tables d'agrégats de chiffre d'affaires, remplies à partir des contrats existants."""
+
+from sqlalchemy import text
+
+NAME = "004_revenue_summaries"
+
+# Agrégat -> (colonne du contrat qui en est la clé, table référencée)
+REVENUE_TABLES = {
+    "commercial_revenue": ("commercial_id", "users"),
+    "client_revenue": ("client_id", "clients"),
+}
+
+# DDL figée au moment de la migration : montants en euros (FLOAT), convertis en
+# centimes par m005_money_cents
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    {key} INTEGER NOT NULL,
+    contracts INTEGER NOT NULL,
+    signed_contracts INTEGER NOT NULL,
+    signed_total FLOAT NOT NULL,
+    amount_due FLOAT NOT NULL,
+    unpaid_contracts INTEGER NOT NULL,
+    PRIMARY KEY ({key}),
+    FOREIGN KEY ({key}) REFERENCES {parent} (id)
+)
+"""
+CREATE_INDEX = "CREATE INDEX IF NOT EXISTS ix_client_revenue_amount_due ON client_revenue (amount_due)"
+
+REBUILD = """
+INSERT INTO {table} ({key}, contracts, signed_contracts, signed_total, amount_due, unpaid_contracts)
+SELECT {key},
+       COUNT(*),
+       COALESCE(SUM(CASE WHEN is_signed THEN 1 ELSE 0 END), 0),
+       COALESCE(SUM(CASE WHEN is_signed THEN total_amount ELSE 0 END), 0),
+       COALESCE(SUM(amount_due), 0),
+       COALESCE(SUM(CASE WHEN amount_due > 0 THEN 1 ELSE 0 END), 0)
+FROM contracts
+WHERE {key} IS NOT NULL
+GROUP BY {key}
+"""
+
+
+def rebuild_summaries(connection):
+    """Recalcule les deux agrégats à partir des contrats (INSERT ... SELECT), dans l'unité des contrats."""
+    for table, (key, _) in REVENUE_TABLES.items():
+        connection.execute(text(f"DELETE FROM {table}"))
+        connection.execute(text(REBUILD.format(table=table, key=key)))
+
+
+def upgrade(connection):
+    """Crée les tables d'agrégats (si besoin) et les recalcule."""
+    for table, (key, parent) in REVENUE_TABLES.items():
+        connection.execute(text(CREATE_TABLE.format(table=table, key=key, parent=parent)))
+    connection.execute(text(CREATE_INDEX))
+    rebuild_summaries(connection)
@@ -0,0 +1,78 @@
+"""
+Montants des contrats : FLOAT (euros) -> BIGINT (centimes), convertis par lots.
+
+Pour chaque colonne monétaire : ajout d'une colonne de centimes, remplissage par
+tranches d'id (CHUNK_SIZE lignes par UPDATE), suppression de l'ancienne colonne
+puis renommage. Les index partiels sur amount_due sont recréés ensuite, et les
+agrégats de chiffre d'affaires (données dérivées) sont recréés et recalculés.
+Une base créée par create_all a déjà des colonnes entières : rien n'est converti.
+"""
+
+from sqlalchemy import Integer, inspect, text
+from migrations.m004_revenue_summaries import CREATE_INDEX, REVENUE_TABLES, rebuild_summaries
+
+NAME = "005_money_cents"
+
+CHUNK_SIZE = 10_000
+MONEY_COLUMNS = ("total_amount", "amount_due")
+# Index qui portent sur une colonne monétaire (à supprimer avant la colonne, puis
+# recréés) : DDL figée au moment de la migration
+MONEY_INDEXES = (
+    ("ix_contracts_unpaid_created", "contracts (date_created, id) WHERE amount_due > 0"),
+    ("ix_contracts_paid_created", "contracts (date_created, id) WHERE amount_due = 0"),
+)
+
+# Agrégats recréés avec des montants en centimes
+CREATE_REVENUE_TABLE = """
+CREATE TABLE {table} (
+    {key} INTEGER NOT NULL,
+    contracts INTEGER NOT NULL,
+    signed_contracts INTEGER NOT NULL,
+    signed_total BIGINT NOT NULL,
+    amount_due BIGINT NOT NULL,
+    unpaid_contracts INTEGER NOT NULL,
+    PRIMARY KEY ({key}),
+    FOREIGN KEY ({key}) REFERENCES {parent} (id)
+)
+"""
+
+
+def _needs_conversion(connection):
+    columns = {column["name"]: column["type"] for column in inspect(connection).get_columns("contracts")}
+    return not isinstance(columns["total_amount"], Integer)
+
+
+def convert_contracts(connection, chunk_size=CHUNK_SIZE):
+    """Convertit les montants des contrats en centimes, par tranches de `chunk_size` ids."""
+    for column in MONEY_COLUMNS:
+        connection.execute(text(f"ALTER TABLE contracts ADD COLUMN {column}_cents BIGINT NOT NULL DEFAULT 0"))
+
+    low, high = connection.execute(text("SELECT MIN(id), MAX(id) FROM contracts")).one()
+    if low is not None:
+        assignments = ", ".join(
+            f"{column}_cents = CAST(ROUND({column} * 100) AS BIGINT)" for column in MONEY_COLUMNS
+        )
+        statement = text(f"UPDATE contracts SET {assignments} WHERE id >= :low AND id < :high")
+        for start in range(low, high + 1, chunk_size):
+            connection.execute(statement, {"low": start, "high": start + chunk_size})
+
+    for name, _ in MONEY_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    for column in MONEY_COLUMNS:
+        connection.execute(text(f"ALTER TABLE contracts DROP COLUMN {column}"))
+        connection.execute(text(f"ALTER TABLE contracts RENAME COLUMN {column}_cents TO {column}"))
+
+    for name, definition in MONEY_INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
+
+
+def upgrade(connection):
+    """Convertit les contrats si besoin, puis recrée et recalcule les agrégats en centimes."""
+    if _needs_conversion(connection):
+        convert_contracts(connection, chunk_size=CHUNK_SIZE)
+
+    for table, (key, parent) in REVENUE_TABLES.items():
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        connection.execute(text(CREATE_REVENUE_TABLE.format(table=table, key=key, parent=parent)))
+    connection.execute(text(CREATE_INDEX))
+    rebuild_summaries(connection)
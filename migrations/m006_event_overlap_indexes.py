@@ -0,0 +1,18 @@
+"""Index (clé de planning, date de fin, date de début) du test de chevauchement des événements."""
+
+from sqlalchemy import text
+
+NAME = "006_event_overlap_indexes"
+
+# DDL figée au moment de la migration : (nom, table (colonnes))
+INDEXES = (
+    ("ix_events_support_date_end_start", "events (support_contact_id, date_end, date_start)"),
+    ("ix_events_location_date_end_start", "events (location, date_end, date_start)"),
+)
+INDEX_NAMES = tuple(name for name, _ in INDEXES)
+
+
+def upgrade(connection):
+    """Crée les index s'ils n'existent pas encore."""
+    for name, definition in INDEXES:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"))
@@ -0,0 +1,49 @@
+"""
+Agrégats de chiffre d'affaires et de créances (tables commercial_revenue et client_revenue).
+
+Usage :
+    python revenue_summary.py --check      # compare les agrégats aux contrats (code 1 si écart)
+    python revenue_summary.py --rebuild    # recalcule entièrement les agrégats
+
+Les agrégats sont tenus à jour à chaque écriture de contrat via l'ORM ; le recalcul
+sert après une insertion en masse hors ORM ou pour réparer un écart signalé.
+"""
+
+import argparse
+import sys
+from app.config import SessionLocal
+from app.controllers.revenue_controller import check_revenue_summaries, rebuild_revenue_summaries
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Agrégats de chiffre d'affaires par commercial et par client.")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--check", action="store_true", help="vérifie les agrégats (action par défaut)")
+    action.add_argument("--rebuild", action="store_true", help="recalcule les agrégats à partir des contrats")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Point d'entrée du script."""
+    args = parse_args(argv)
+    session = SessionLocal()
+    try:
+        if args.rebuild:
+            counts = rebuild_revenue_summaries(session)
+            print(f"✅ Agrégats recalculés : {counts['commercial']:,} commercial(aux), {counts['client']:,} client(s).")
+            return 0
+
+        mismatches = check_revenue_summaries(session)
+        if not mismatches:
+            print("✅ Agrégats cohérents avec les contrats.")
+            return 0
+        for scope, key, column, expected, stored in mismatches:
+            print(f"❌ {scope} {key} : {column} attendu {expected}, enregistré {stored}")
+        print(f"{len(mismatches)} écart(s) : lancez python revenue_summary.py --rebuild")
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
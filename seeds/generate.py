@@ -0,0 +1,385 @@
+"""
+Générateur de données synthétiques pour les environnements de performance.
+
+Usage :
+    python -m seeds.generate --clients 100000
+    python -m seeds.generate --clients 1000000 --reset --workers 8
+    python -m seeds.generate --clients 50000 --seed 7 --bcrypt-rounds 6 --database-url sqlite:///perf.db
+
+Pour une graine donnée, les données sont toujours les mêmes (seuls les chiffrés
+Fernet, aléatoires par construction, et les sels bcrypt diffèrent), quelle que
+soit la taille des lots :
+- les trois rôles, 2 gestionnaires, un commercial pour 1 000 clients et un support
+  pour 2 000 contrats (au moins 2 de chaque), mot de passe PASSWORD ;
+- `clients` clients (email et téléphone chiffrés, index aveugle), suivis par les
+  commerciaux à tour de rôle, et un contrat par client, signé dans 70 % des cas,
+  dont 40 % restent à payer ;
+- un événement par contrat signé. Chaque support et chaque lieu a un planning
+  d'événements consécutifs, sans chevauchement ; un événement sur dix, après
+  ORIGIN + HISTORY_DAYS, n'a pas encore de support.
+
+Les lignes sont insérées par insert() en masse, avec des ids explicites (pas de
+relecture), et validées lot par lot. Les hachages bcrypt et le chiffrement se font
+dans un pool de processus, le chiffrement du lot suivant pendant l'insertion du
+lot courant. Les agrégats de chiffre d'affaires et l'index plein texte, que les
+insertions en masse ne tiennent pas à jour, sont recalculés à la fin.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models import Base, Clients, Contracts, Events, Roles, Users
+from app.models.mixins import blind_index, encrypt_value
+from app.models.search import rebuild_search_index
+from app.repositories.revenue_repository import rebuild_revenue
+from app.utils.security import BCRYPT_ROUNDS, make_password_context
+
+DEFAULT_SEED = 20250101
+DEFAULT_CLIENTS = 100_000
+DEFAULT_BATCH_SIZE = 20_000
+DEFAULT_WORKERS = os.cpu_count() or 1
+DEFAULT_BCRYPT_ROUNDS = BCRYPT_ROUNDS
+PASSWORD = "perf-password"
+ORIGIN = datetime(2020, 1, 6)
+# Les événements sans support commencent après cette période d'historique
+HISTORY_DAYS = 3 * 365
+
+ROLES = ("gestion", "commercial", "support")
+FIRST_NAMES = ("Alice", "Bruno", "Chloé", "David", "Emma", "Farid", "Gaëlle", "Hugo", "Inès", "Jules",
+               "Karim", "Léa", "Manon", "Nathan", "Océane", "Paul", "Quentin", "Rose", "Sami", "Tom")
+LAST_NAMES = ("Martin", "Bernard", "Dubois", "Durand", "Lefebvre", "Moreau", "Laurent", "Garnier", "Roux",
+              "Faure", "Girard", "Bonnet", "Mercier", "Blanc", "Guerin", "Muller", "Henry", "Perrin")
+COMPANIES = ("Atelier", "Studio", "Agence", "Maison", "Collectif", "Groupe", "Cabinet", "Fabrique")
+EVENT_KINDS = ("Salon", "Gala", "Séminaire", "Conférence", "Soirée", "Lancement", "Mariage", "Festival")
+CITIES = ("Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux", "Toulouse", "Nice")
+
+# Tables générées, dans l'ordre d'insertion (et de suppression inverse)
+TABLES = (Users, Clients, Contracts, Events)
+
+
+@dataclass
+class GeneratedData:
+    """Résumé de ce qui a été généré (ids des utilisateurs par rôle, nombres de lignes)."""
+
+    seed: int
+    user_ids: dict
+    clients: int = 0
+    contracts: int = 0
+    signed_contracts: int = 0
+    events: int = 0
+    history_end: datetime = field(default=ORIGIN + timedelta(days=HISTORY_DAYS))
+
+
+def user_counts(clients):
+    """Nombre d'utilisateurs par rôle pour `clients` clients."""
+    return {"gestion": 2, "commercial": max(2, clients // 1000), "support": max(2, clients // 2000)}
+
+
+# --- travail des processus du pool ---
+
+def _hash_passwords(args):
+    passwords, rounds = args
+    context = make_password_context(rounds)
+    return [context.hash(password) for password in passwords]
+
+
+def _encrypt_rows(rows, fields):
+    """Chiffre les champs `fields` des lignes (dicts) et calcule l'index aveugle de l'email."""
+    for row in rows:
+        row["email_bidx"] = blind_index(row["email"])
+        for name in fields:
+            row[name] = encrypt_value(row[name])
+    return rows
+
+
+def _chunks(values, count):
+    size = max(1, -(-len(values) // count))
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+class Workers:
+    """Pool de processus (ou exécution sur place si workers <= 1) pour bcrypt et Fernet."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def hash_passwords(self, passwords, rounds):
+        if self.executor is None:
+            return _hash_passwords((passwords, rounds))
+        hashes = []
+        for chunk in self.executor.map(_hash_passwords, [(chunk, rounds) for chunk in _chunks(passwords, self.workers)]):
+            hashes.extend(chunk)
+        return hashes
+
+    def encrypted_batches(self, batches, fields):
+        """
+        Chiffre les lots de lignes `batches` dans le pool, avec un lot d'avance :
+        le lot suivant est chiffré pendant que l'appelant insère le lot courant.
+        """
+        if self.executor is None:
+            for rows in batches:
+                yield _encrypt_rows(rows, fields)
+            return
+        queue = deque()
+        for rows in batches:
+            queue.append([self.executor.submit(_encrypt_rows, chunk, fields)
+                          for chunk in _chunks(rows, self.workers)])
+            if len(queue) > 1:
+                yield [row for future in queue.popleft() for row in future.result()]
+        while queue:
+            yield [row for future in queue.popleft() for row in future.result()]
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+# --- lignes ---
+
+def _batched(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _user_rows(rng, role_ids, counts):
+    user_id = 0
+    for role_name, count in counts.items():
+        for i in range(count):
+            user_id += 1
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                "id": user_id,
+                "username": f"{role_name}{i}",
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": f"{role_name}{i}@perf.example",
+                "role_id": role_ids[role_name],
+            }
+
+
+def _client_rows(rng, clients, commercial_ids):
+    for i in range(clients):
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        created = ORIGIN + timedelta(minutes=i)
+        yield {
+            "id": i + 1,
+            "first_name": first_name,
+            "last_name": f"{last_name}{i}",
+            "email": f"client{i}@perf.example",
+            "phone": f"+33 6 {i % 100:02d} {i // 100 % 100:02d} {i // 10_000 % 100:02d} {rng.randrange(100):02d}",
+            "company_name": f"{rng.choice(COMPANIES)} {last_name} {i}",
+            "commercial_id": commercial_ids[i % len(commercial_ids)],
+            "date_created": created,
+            "date_updated": created,
+        }
+
+
+def _contract_rows(rng, clients, commercial_ids, signed):
+    for i in range(clients):
+        total = Decimal(rng.randrange(50_000, 5_000_000)).scaleb(-2)
+        is_signed = rng.random() < 0.7
+        unpaid = rng.random() < 0.4
+        if is_signed:
+            signed.append(i + 1)
+        yield {
+            "id": i + 1,
+            "client_id": i + 1,
+            "commercial_id": commercial_ids[i % len(commercial_ids)],
+            "total_amount": total,
+            "amount_due": (total / 2).quantize(Decimal("0.01")) if unpaid else Decimal("0.00"),
+            "is_signed": is_signed,
+            "date_created": ORIGIN + timedelta(minutes=i),
+        }
+
+
+def _event_rows(rng, signed, support_ids, history_end):
+    for i, contract_id in enumerate(signed):
+        slot = i // len(support_ids)
+        date_start = ORIGIN + timedelta(days=3 * slot)
+        unassigned = date_start > history_end and i % 10 == 0
+        yield {
+            "id": i + 1,
+            "name": f"{rng.choice(EVENT_KINDS)} {i}",
+            "contract_id": contract_id,
+            "client_id": contract_id,
+            "support_contact_id": None if unassigned else support_ids[i % len(support_ids)],
+            "date_start": date_start,
+            "date_end": date_start + timedelta(days=1),
+            "location": f"{CITIES[i % len(CITIES)]} – Salle {i % len(support_ids)}",
+            "attendees": rng.randrange(10, 500),
+            "notes": None,
+        }
+
+
+# --- base ---
+
+def _insert_batches(engine, model, batches, on_progress=None):
+    """Insère chaque lot dans sa propre transaction. Retourne le nombre de lignes."""
+    count = 0
+    for rows in batches:
+        with engine.begin() as connection:
+            connection.execute(insert(model.__table__), rows)
+        count += len(rows)
+        if on_progress:
+            on_progress(model.__tablename__, count)
+    return count
+
+
+def _role_ids(engine):
+    with engine.begin() as connection:
+        existing = dict(connection.execute(select(Roles.name, Roles.id)).all())
+        missing = [{"name": name} for name in ROLES if name not in existing]
+        if missing:
+            connection.execute(insert(Roles.__table__), missing)
+        return dict(connection.execute(select(Roles.name, Roles.id)).all())
+
+
+def check_empty(engine):
+    """Retourne un message d'erreur si les tables générées contiennent déjà des lignes, sinon None."""
+    with engine.connect() as connection:
+        for model in TABLES:
+            if connection.scalar(select(func.count()).select_from(model.__table__)):
+                return (f"❌ La table {model.__tablename__} n'est pas vide : utilisez --reset "
+                        "pour recréer la base.")
+    return None
+
+
+def _reset_sequences(engine):
+    """PostgreSQL : les ids explicites n'avancent pas les séquences, on les recale."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        for model in TABLES:
+            table = model.__tablename__
+            connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+            ))
+
+
+def generate(engine, clients, seed=DEFAULT_SEED, batch_size=DEFAULT_BATCH_SIZE, workers=DEFAULT_WORKERS,
+             bcrypt_rounds=DEFAULT_BCRYPT_ROUNDS, hashed_password=None, on_progress=None):
+    """
+    Génère les données dans la base de `engine` (schéma créé, tables générées vides).
+    `hashed_password` : hachage commun à tous les utilisateurs (aucun bcrypt n'est alors calculé).
+    `on_progress(table, lignes insérées)` est appelée après chaque lot.
+    Retourne le GeneratedData.
+    """
+    # Un générateur par table : les données ne dépendent pas de la taille des lots
+    rngs = {name: random.Random(f"{seed}:{name}") for name in ("users", "clients", "contracts", "events")}
+    pool = Workers(workers)
+    try:
+        counts = user_counts(clients)
+        role_ids = _role_ids(engine)
+        users = list(_user_rows(rngs["users"], role_ids, counts))
+        if hashed_password is None:
+            hashes = pool.hash_passwords([PASSWORD] * len(users), bcrypt_rounds)
+        else:
+            hashes = [hashed_password] * len(users)
+        for row, hashed in zip(users, hashes):
+            row["hashed_password"] = hashed
+        user_ids = {
+            role_name: [row["id"] for row in users if row["role_id"] == role_ids[role_name]]
+            for role_name in counts
+        }
+        data = GeneratedData(seed=seed, user_ids=user_ids)
+        _insert_batches(engine, Users, pool.encrypted_batches(_batched(users, batch_size), ("email",)),
+                        on_progress)
+
+        commercials, supports = user_ids["commercial"], user_ids["support"]
+        client_batches = _batched(_client_rows(rngs["clients"], clients, commercials), batch_size)
+        data.clients = _insert_batches(
+            engine, Clients, pool.encrypted_batches(client_batches, ("email", "phone")), on_progress
+        )
+
+        signed = []
+        data.contracts = _insert_batches(
+            engine, Contracts, _batched(_contract_rows(rngs["contracts"], clients, commercials, signed), batch_size),
+            on_progress,
+        )
+        data.signed_contracts = len(signed)
+        data.events = _insert_batches(
+            engine, Events,
+            _batched(_event_rows(rngs["events"], signed, supports, data.history_end), batch_size),
+            on_progress,
+        )
+    finally:
+        pool.close()
+
+    _reset_sequences(engine)
+    with engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            rebuild_search_index(connection)
+    with Session(bind=engine) as session:
+        rebuild_revenue(session)
+        session.commit()
+    return data
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Génère des données synthétiques en volume.")
+    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS,
+                        help="nombre de clients (et de contrats) ; utilisateurs et événements en découlent")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="graine des données")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="lignes par lot et par commit")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="processus pour bcrypt et Fernet")
+    parser.add_argument("--bcrypt-rounds", type=int, default=DEFAULT_BCRYPT_ROUNDS,
+                        help="coût bcrypt des mots de passe générés (rehachés à la connexion si inférieur à BCRYPT_ROUNDS)")
+    parser.add_argument("--database-url", help="base cible (DATABASE_URL par défaut)")
+    parser.add_argument("--reset", action="store_true", help="supprimer et recréer toutes les tables d'abord")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Point d'entrée du script."""
+    args = parse_args(argv)
+    if args.database_url:
+        from app.engine import create_app_engine
+        engine = create_app_engine(args.database_url)
+    else:
+        from app.config import engine
+
+    if args.reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    error = check_empty(engine)
+    if error:
+        print(error)
+        return 1
+
+    started = time.perf_counter()
+
+    def show(table, count):
+        print(f"… {table} : {count:,} ligne(s) ({time.perf_counter() - started:.1f} s)", flush=True)
+
+    data = generate(engine, args.clients, seed=args.seed, batch_size=args.batch_size, workers=args.workers,
+                    bcrypt_rounds=args.bcrypt_rounds, on_progress=show)
+    users = sum(len(ids) for ids in data.user_ids.values())
+    print(f"✅ {users:,} utilisateur(s), {data.clients:,} client(s), {data.contracts:,} contrat(s) "
+          f"({data.signed_contracts:,} signé(s)), {data.events:,} événement(s) "
+          f"en {time.perf_counter() - started:.1f} s. Mot de passe : {PASSWORD}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,8 @@
 from sqlalchemy.exc import IntegrityError
 from app.config import SessionLocal, engine
 from app.models import Base, Roles, Users
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def hash_password(password: str) -> str:
-    """Retourne un mot de passe hashé (bcrypt)."""
-    return pwd_context.hash(password)
+from app.repositories.user_repository import get_user_by_email
+from app.utils.security import hash_password
 
 
 def seed_roles(session):
@@ -58,7 +52,7 @@ def seed_users(session):
     ]
 
     for data in demo_users:
-        if not session.query(Users).filter_by(email=data["email"]).first():
+        if not get_user_by_email(session, data["email"]):
             session.add(
                 Users(
                     username=data["username"],
@@ -1,5 +1,6 @@
 from app.config import SessionLocal
 from app.models import Users, Roles
+from app.repositories.user_repository import get_user_by_email
 from app.utils.security import hash_password
 
 # 🔑 Crée une session DB
@@ -47,7 +48,7 @@ users_data = [
 
 # 🔑 Créer les users sans doublons
 for user_data in users_data:
-    existing_user = session.query(Users).filter_by(email=user_data["email"]).first()
+    existing_user = get_user_by_email(session, user_data["email"])
     if existing_user:
         print(f"⚠️ Utilisateur {user_data['email']} déjà présent, skip.")
         continue
@@ -1,6 +1,8 @@
 import os
 from cryptography.fernet import Fernet
 
-# Définir FERNET_KEY si absent (avant tout import)
+# Définir FERNET_KEY et SECRET_KEY si absents (avant tout import)
 if "FERNET_KEY" not in os.environ:
-    os.environ["FERNET_KEY"] = Fernet.generate_key().decode()
\ No newline at end of file
+    os.environ["FERNET_KEY"] = Fernet.generate_key().decode()
+if "SECRET_KEY" not in os.environ:
+    os.environ["SECRET_KEY"] = "test-secret-key"
@@ -1,8 +1,26 @@
 # tests/conftest.py
+import os
+import shutil
+import socket
+import subprocess
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from app.engine import create_app_engine
 from app.models.base import Base
+from app.utils.audit import AuditPipeline, set_audit_pipeline
+from tests.helpers import FakeTransport
+
+
+@pytest.fixture(autouse=True)
+def audit_transport():
+    """Les enregistrements d'audit vont dans un transport local (rien n'est envoyé à Sentry)."""
+    transport = FakeTransport()
+    pipeline = AuditPipeline(transport, flush_interval=0.01, rate_limit=0)
+    previous = set_audit_pipeline(pipeline)
+    yield transport
+    pipeline.close()
+    set_audit_pipeline(previous)
 
 
 @pytest.fixture(scope="session")
@@ -23,3 +41,75 @@ def session(engine):
     session.close()
     transaction.rollback()
     connection.close()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _postgres_driver():
+    """Nom du pilote PostgreSQL installé (dépendance optionnelle), ou None."""
+    for module, dialect in (("psycopg", "postgresql+psycopg"), ("psycopg2", "postgresql+psycopg2")):
+        try:
+            __import__(module)
+            return dialect
+        except ImportError:
+            continue
+    return None
+
+
+@pytest.fixture(scope="session")
+def pg_url(tmp_path_factory):
+    """
+    URL d'une base PostgreSQL jetable.
+    - TEST_POSTGRES_URL si elle est définie ;
+    - sinon un cluster temporaire lancé avec initdb / pg_ctl s'ils sont dans le PATH.
+    Les tests sont ignorés si aucun serveur ni pilote n'est disponible.
+    """
+    dialect = _postgres_driver()
+    if dialect is None:
+        pytest.skip("pilote PostgreSQL (psycopg / psycopg2) non installé")
+
+    url = os.getenv("TEST_POSTGRES_URL")
+    if url:
+        yield url
+        return
+
+    if not (shutil.which("initdb") and shutil.which("pg_ctl")):
+        pytest.skip("PostgreSQL non disponible (ni TEST_POSTGRES_URL, ni initdb/pg_ctl)")
+
+    data_dir = tmp_path_factory.mktemp("pgdata")
+    port = _free_port()
+    subprocess.run(["initdb", "-D", str(data_dir), "-U", "postgres", "-A", "trust"],
+                   check=True, capture_output=True)
+    subprocess.run(["pg_ctl", "-D", str(data_dir), "-w", "-l", str(data_dir / "server.log"),
+                    "-o", f"-p {port} -k {data_dir} -c listen_addresses=127.0.0.1", "start"],
+                   check=True, capture_output=True)
+    try:
+        yield f"{dialect}://postgres@127.0.0.1:{port}/postgres"
+    finally:
+        subprocess.run(["pg_ctl", "-D", str(data_dir), "-m", "fast", "stop"], capture_output=True)
+
+
+@pytest.fixture(scope="session")
+def pg_engine(pg_url):
+    """Moteur PostgreSQL (options de pool de l'application) avec le schéma créé."""
+    engine = create_app_engine(pg_url)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def pg_session(pg_engine):
+    """Session PostgreSQL par test avec rollback."""
+    connection = pg_engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(bind=connection)()
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
@@ -2,11 +2,16 @@ import pytest
 from sqlalchemy.orm import Session
 from app.models import Users
 from app.controllers.auth_controller import authenticate_user
+from app.utils.security import make_password_context
 
 
 class FakeSession:
     def __init__(self, fake_user):
         self.fake_user = fake_user
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
 
     def query(self, model):
         return self
@@ -28,8 +33,8 @@ def test_authenticate_user_success(monkeypatch):
         last_name="User"
     )
 
-    # monkeypatch de verify_password pour retourner True
-    monkeypatch.setattr("app.controllers.auth_controller.verify_password", lambda p, h: True)
+    # monkeypatch de verify_and_update_password pour retourner True
+    monkeypatch.setattr("app.controllers.auth_controller.verify_and_update_password", lambda p, h: (True, None))
 
     session = FakeSession(fake_user)
     user, error = authenticate_user(session, "test@example.com", "plainpassword")
@@ -48,7 +53,7 @@ def test_authenticate_user_wrong_password(monkeypatch):
         last_name="User"
     )
 
-    monkeypatch.setattr("app.controllers.auth_controller.verify_password", lambda p, h: False)
+    monkeypatch.setattr("app.controllers.auth_controller.verify_and_update_password", lambda p, h: (False, None))
 
     session = FakeSession(fake_user)
     user, error = authenticate_user(session, "wrong@example.com", "wrongpassword")
@@ -60,10 +65,28 @@ def test_authenticate_user_wrong_password(monkeypatch):
 def test_authenticate_user_not_found(monkeypatch):
     session = FakeSession(None)
 
-    # même si verify_password est correct, aucun user trouvé
-    monkeypatch.setattr("app.controllers.auth_controller.verify_password", lambda p, h: True)
+    # même si le mot de passe est correct, aucun user trouvé
+    monkeypatch.setattr("app.controllers.auth_controller.verify_and_update_password", lambda p, h: (True, None))
 
     user, error = authenticate_user(session, "unknown@example.com", "password")
 
     assert user is None
     assert error == "Identifiants invalides."
+
+
+def test_authenticate_user_rehashes_outdated_cost(monkeypatch):
+    old_hash = make_password_context(4).hash("plainpassword")
+    fake_user = Users(id=3, username="olduser", email="old@example.com", hashed_password=old_hash)
+    monkeypatch.setattr("app.controllers.auth_controller.verify_and_update_password",
+                        make_password_context(5).verify_and_update)
+
+    session = FakeSession(fake_user)
+    user, error = authenticate_user(session, "olduser", "plainpassword")
+
+    assert error is None
+    assert user.hashed_password.startswith("$2b$05$") and session.commits == 1
+    assert make_password_context(5).verify("plainpassword", user.hashed_password)
+
+    # Coût à jour : rien n'est réécrit
+    authenticate_user(session, "olduser", "plainpassword")
+    assert session.commits == 1
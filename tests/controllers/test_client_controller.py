@@ -187,7 +187,7 @@ def test_update_client_email_already_used(monkeypatch, fake_session):
             def first(inner_self):
                 if "id" in inner_self.kwargs:
                     return client
-                elif "email" in inner_self.kwargs:
+                elif "email_bidx" in inner_self.kwargs:
                     return other_client
                 return None
         return FakeQuery()
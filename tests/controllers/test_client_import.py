@@ -0,0 +1,59 @@
+import json
+from app.controllers.client_controller import import_clients_chunk, validate_client_row
+from app.models import Clients
+from app.models.mixins import blind_index
+from import_clients import run_import
+
+
+def row(i, **overrides):
+    data = dict(first_name="Jean", last_name=f"Client{i}", email=f"client{i}@import.com",
+                phone="0600000000", company_name="ImportCorp")
+    data.update(overrides)
+    return data
+
+
+def test_validate_client_row():
+    assert validate_client_row(row(1))[1] is None
+    assert validate_client_row(row(1, email=" "))[1] == "champ(s) manquant(s) : email"
+    assert "email invalide" in validate_client_row(row(1, email="pas-un-email"))[1]
+    assert "téléphone invalide" in validate_client_row(row(1, phone="abc"))[1]
+    assert validate_client_row(None) == (None, "ligne illisible")
+
+
+def test_import_clients_chunk(session, audit_transport):
+    session.add(Clients(**row(0)))
+    session.flush()
+
+    rows = [
+        (2, row(0)),                            # déjà en base
+        (3, row(1)),
+        (4, row(2)),
+        (5, row(1, email="CLIENT1@import.com")),  # doublon dans le lot
+        (6, row(3, phone="??")),               # invalide
+    ]
+    imported, errors = import_clients_chunk(session, rows, commercial_id=None)
+
+    assert imported == 2
+    assert [line for line, _ in errors] == [5, 6, 2]
+    client = session.query(Clients).filter_by(email_bidx=blind_index("client2@import.com")).one()
+    assert client.email == "client2@import.com"
+    assert client.phone == "0600000000"
+    assert client._email != "client2@import.com"
+
+
+def test_run_import_streams_chunks(session, tmp_path):
+    path = tmp_path / "clients.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(10, 17):
+            f.write(json.dumps(row(i)) + "\n")
+        f.write("{cassé\n")
+
+    progress, errors = [], []
+    result = run_import(session, str(path), chunk_size=3,
+                        on_error=lambda line, message: errors.append((line, message)),
+                        on_progress=lambda *counts: progress.append(counts))
+
+    assert result == (8, 7, 1)
+    assert progress == [(3, 3, 0), (6, 6, 0), (8, 7, 1)]
+    assert errors == [(8, "ligne illisible")]
+    assert session.query(Clients).filter(Clients.last_name.like("Client1%")).count() == 7
@@ -37,15 +37,6 @@ class FakeUser:
         self.id = id
         self.role = type("Role", (), {"name": role_name})
 
-# === Fakes pour désactiver sentry_sdk ===
-
-def fake_capture_message(*args, **kwargs):
-    pass
-
-def fake_capture_exception(*args, **kwargs):
-    pass
-
-
 # === Tests ===
 
 def test_create_contract_success(monkeypatch):
@@ -55,8 +46,6 @@ def test_create_contract_success(monkeypatch):
     commercial.role = type("Role", (), {"name": "commercial"})
     session.query_data = [client, commercial]
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = create_contract(session, client_id=1, commercial_id=2, total_amount=1000, amount_due=500)
 
     assert error is None
@@ -70,8 +59,6 @@ def test_create_contract_client_not_found(monkeypatch):
     session = FakeSession()
     session.query_data = [None]  # client introuvable
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = create_contract(session, client_id=99, commercial_id=2, total_amount=1000, amount_due=500)
 
     assert contract is None
@@ -83,8 +70,6 @@ def test_create_contract_commercial_not_found(monkeypatch):
     client = Clients(id=1)
     session.query_data = [client, None]
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = create_contract(session, client_id=1, commercial_id=99, total_amount=1000, amount_due=500)
 
     assert contract is None
@@ -98,8 +83,6 @@ def test_create_contract_user_not_commercial(monkeypatch):
     user.role = type("Role", (), {"name": "support"})
     session.query_data = [client, user]
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = create_contract(session, client_id=1, commercial_id=2, total_amount=1000, amount_due=500)
 
     assert contract is None
@@ -113,8 +96,6 @@ def test_create_contract_signed(monkeypatch):
     commercial.role = type("Role", (), {"name": "commercial"})
     session.query_data = [client, commercial]
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = create_contract(
         session, client_id=1, commercial_id=2, total_amount=1000, amount_due=500, is_signed=True
     )
@@ -133,8 +114,6 @@ def test_update_contract_success(monkeypatch):
     current_user = FakeUser(id=5, role_name="commercial")
     updates = {"total_amount": 1500}
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     updated, error = update_contract(session, contract_id=1, updates=updates, current_user=current_user)
 
     assert error is None
@@ -148,8 +127,6 @@ def test_update_contract_not_found(monkeypatch):
 
     current_user = FakeUser(id=1, role_name="gestion")
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = update_contract(session, contract_id=42, updates={}, current_user=current_user)
 
     assert contract is None
@@ -163,15 +140,15 @@ def test_update_contract_unauthorized(monkeypatch):
 
     current_user = FakeUser(id=3, role_name="commercial")
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     contract, error = update_contract(session, 1, {}, current_user)
 
     assert contract is None
     assert error == "⛔ Vous n’êtes pas autorisé à modifier ce contrat."
 
 
-def test_update_contract_signed(monkeypatch):
+def test_update_contract_signed(monkeypatch, audit_transport):
+    from app.utils.audit import get_audit_pipeline
+
     contract = Contracts(id=1, client_id=1, commercial_id=2)
     session = FakeSession()
     session.query_data = [contract]
@@ -179,10 +156,12 @@ def test_update_contract_signed(monkeypatch):
     current_user = FakeUser(id=2, role_name="commercial")
     updates = {"is_signed": True}
 
-    monkeypatch.setattr("app.controllers.contract_controller.sentry_sdk.capture_message", fake_capture_message)
-
     updated, error = update_contract(session, 1, updates, current_user)
 
     assert error is None
     assert updated.is_signed is True
     assert session.committed
+    # La signature est auditée (en arrière-plan)
+    get_audit_pipeline().flush(timeout=2)
+    assert audit_transport.actions() == ["contract.signed"]
+    assert audit_transport.records[0]["data"]["user_id"] == 2
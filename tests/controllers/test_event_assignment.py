@@ -0,0 +1,78 @@
+from datetime import datetime
+import pytest
+from app.controllers.event_controller import apply_assignments, propose_assignments
+from app.models import Events, Roles, Users
+
+
+class FakeUser:
+    def __init__(self, id, role_name):
+        self.id = id
+        self.role = type("Role", (), {"name": role_name})
+
+
+def day(n):
+    return datetime(2025, 9, n)
+
+
+@pytest.fixture
+def supports(session):
+    role = Roles(name="support")
+    users = [
+        Users(username=f"assign{i}", first_name="Sam", last_name=f"Assign{i}",
+              email=f"assign{i}@assignment.com", hashed_password="x", role=role)
+        for i in (1, 2)
+    ]
+    session.add_all(users)
+    session.flush()
+    return users
+
+
+def add_event(session, name, start, end, support=None, attendees=10):
+    event = Events(name=name, date_start=start, date_end=end, attendees=attendees,
+                   support_contact_id=support.id if support else None)
+    session.add(event)
+    session.flush()
+    return event
+
+
+def test_propose_then_apply(session, supports, audit_transport):
+    from app.utils.audit import get_audit_pipeline
+
+    busy, free = supports
+    add_event(session, "Déjà affecté", day(10), day(10), support=busy)
+    past = add_event(session, "Passé", day(1), day(1))
+    first = add_event(session, "Salon", day(10), day(11), attendees=200)
+    second = add_event(session, "Gala", day(12), day(12), attendees=80)
+
+    plan, error = propose_assignments(session, since=day(5), window_days=7)
+
+    assert error is None
+    assert plan["assignments"] == [(first.id, free.id), (second.id, busy.id)]
+    assert plan["unassigned"] == []
+    assert plan["supports"][free.id] == {"name": "Sam Assign2", "events": 1, "attendees": 200}
+
+    count, error = apply_assignments(session, plan["assignments"], FakeUser(9, "gestion"))
+
+    assert (count, error) == (2, None)
+    session.expire_all()
+    assert session.get(Events, first.id).support_contact_id == free.id
+    assert session.get(Events, past.id).support_contact_id is None
+    get_audit_pipeline().flush(timeout=2)
+    assert audit_transport.actions() == ["event.auto_assign"]
+
+
+def test_apply_skips_events_assigned_meanwhile(session, supports):
+    event = add_event(session, "Salon", day(10), day(10))
+    plan, _ = propose_assignments(session, since=day(5))
+    event.support_contact_id = supports[1].id
+    session.flush()
+
+    count, error = apply_assignments(session, plan["assignments"], FakeUser(9, "gestion"))
+
+    assert count == 0
+
+
+def test_propose_without_supports(session):
+    plan, error = propose_assignments(session, since=day(5))
+    assert plan is None
+    assert error == "❌ Aucun support disponible."
@@ -0,0 +1,143 @@
+from datetime import datetime
+import pytest
+from app.controllers.event_controller import create_event, update_event, find_schedule_conflicts
+from app.models import Clients, Contracts, Events, Roles, Users
+from app.utils.schedule import overlapping_pairs
+
+
+class FakeUser:
+    def __init__(self, id, role_name):
+        self.id = id
+        self.role = type("Role", (), {"name": role_name})
+
+
+def day(n):
+    return datetime(2025, 7, n)
+
+
+@pytest.fixture
+def planning(session):
+    """Un client, un contrat, deux supports et un événement du 10 au 12 à Paris assuré par le premier."""
+    role = Roles(name="support")
+    supports = [
+        Users(username=f"support{i}", first_name="Sam", last_name=f"Support{i}",
+              email=f"support{i}@conflicts.com", hashed_password="x", role=role)
+        for i in (1, 2)
+    ]
+    client = Clients(first_name="Léa", last_name="Petit", email="lea@conflicts.com", phone="0600000000",
+                     company_name="Petit SA")
+    session.add_all(supports + [client])
+    session.flush()
+    contract = Contracts(client_id=client.id, total_amount=1000, amount_due=0, is_signed=True)
+    session.add(contract)
+    session.flush()
+    event = Events(name="Gala", client_id=client.id, contract_id=contract.id, support_contact_id=supports[0].id,
+                   date_start=day(10), date_end=day(12), location="Paris")
+    session.add(event)
+    session.flush()
+    return {"client": client, "contract": contract, "supports": supports, "event": event}
+
+
+def new_event(session, planning, start, end, location="Lyon", support=None):
+    return create_event(
+        session, name="Nouveau", contract_id=planning["contract"].id, client_id=planning["client"].id,
+        support_contact_id=support, date_start=start, date_end=end, location=location,
+    )
+
+
+def test_create_rejects_busy_location(session, planning):
+    event, error = new_event(session, planning, day(12), day(13), location="Paris")
+
+    assert event is None
+    assert error == ("❌ Conflit de planning : le lieu « Paris » est déjà réservé "
+                     f"pour l'événement ID {planning['event'].id} (Gala, 10/07/2025 → 12/07/2025).")
+
+
+def test_create_rejects_overlap_hidden_by_existing_conflict(session, planning):
+    # Planning hérité déjà en conflit : A (1 → 31) couvre B (5 → 6), tous deux pour le second support
+    support_id = planning["supports"][1].id
+    long_event = Events(name="A", client_id=planning["client"].id, contract_id=planning["contract"].id,
+                        support_contact_id=support_id, date_start=day(1), date_end=day(31))
+    short_event = Events(name="B", client_id=planning["client"].id, contract_id=planning["contract"].id,
+                         support_contact_id=support_id, date_start=day(5), date_end=day(6))
+    session.add_all([long_event, short_event])
+    session.flush()
+
+    event, error = new_event(session, planning, day(20), day(21), support=support_id)
+
+    assert event is None
+    assert f"l'événement ID {long_event.id} (A," in error
+
+
+def test_create_rejects_busy_support(session, planning):
+    support_id = planning["supports"][0].id
+    event, error = new_event(session, planning, day(11), day(11), support=support_id)
+
+    assert event is None
+    assert error.startswith(f"❌ Conflit de planning : le support ID {support_id} est déjà affecté")
+
+
+def test_create_accepts_free_slots(session, planning):
+    busy_support = planning["supports"][0].id
+    assert new_event(session, planning, day(13), day(14), location="Paris")[1] is None
+    assert new_event(session, planning, day(8), day(9), support=busy_support)[1] is None
+    assert new_event(session, planning, day(10), day(12), support=planning["supports"][1].id)[1] is None
+
+
+def test_create_rejects_inverted_dates(session, planning):
+    event, error = new_event(session, planning, day(14), day(13))
+    assert error == "❌ La date de fin doit être postérieure à la date de début."
+
+
+def test_update_ignores_the_event_itself(session, planning):
+    event = planning["event"]
+    support = FakeUser(event.support_contact_id, "support")
+
+    updated, error = update_event(session, event.id, {"date_end": day(15)}, support)
+
+    assert error is None
+    assert updated.date_end == day(15)
+
+
+def test_assigning_busy_support_is_rejected(session, planning):
+    other, _ = new_event(session, planning, day(11), day(11))
+    gestion = FakeUser(99, "gestion")
+
+    updated, error = update_event(session, other.id, {"support_contact_id": planning["supports"][0].id}, gestion)
+
+    assert updated is None
+    assert "Conflit de planning" in error
+    assert other.support_contact_id is None
+
+
+def test_conflict_report_finds_existing_overlaps(session, planning):
+    # Conflits antérieurs à la vérification : ajoutés sans passer par le contrôleur
+    event = planning["event"]
+    inner = Events(name="Cocktail", client_id=event.client_id, contract_id=event.contract_id,
+                   support_contact_id=event.support_contact_id, date_start=day(11), date_end=day(11),
+                   location="Paris")
+    later = Events(name="Salon", client_id=event.client_id, contract_id=event.contract_id,
+                   support_contact_id=event.support_contact_id, date_start=day(13), date_end=day(14),
+                   location="Nice")
+    session.add_all([inner, later])
+    session.flush()
+
+    conflicts = find_schedule_conflicts(session, batch_size=1)
+
+    assert [(c["type"], c["key"], c["first"]["id"], c["second"]["id"]) for c in conflicts] == [
+        ("Support", event.support_contact_id, event.id, inner.id),
+        ("Lieu", "Paris", event.id, inner.id),
+    ]
+    assert conflicts[0]["overlap"] == (day(11), day(11))
+
+
+def test_overlapping_pairs_sweep():
+    rows = [
+        ("a", 1, "long", 0, 100),
+        ("a", 2, "inclus", 10, 20),
+        ("a", 3, "touche", 20, 30),
+        ("a", 4, "après", 101, 110),
+        ("b", 5, "autre clé", 0, 200),
+    ]
+    pairs = [(key, first[1], second[1]) for key, first, second in overlapping_pairs(rows)]
+    assert pairs == [("a", 1, 2), ("a", 1, 3), ("a", 2, 3)]
@@ -39,6 +39,14 @@ class FakeUser:
         self.role = type("Role", (), {"name": role_name})
 
 
+@pytest.fixture(autouse=True)
+def free_schedule(monkeypatch):
+    """Les fausses sessions ne savent pas chercher de conflit : planning toujours libre."""
+    monkeypatch.setattr(
+        "app.controllers.event_controller.service_find_overlapping_event", lambda *args, **kwargs: None
+    )
+
+
 # === Tests create_event ===
 
 def test_create_event_success():
@@ -0,0 +1,161 @@
+import csv
+import json
+from datetime import datetime
+from decimal import Decimal
+import pytest
+from app.controllers.export_controller import EXPORT_COLUMNS, EXPORT_TYPES, export_batches
+from app.models import Clients, Contracts, Events, Roles, Users
+from app.utils.exporters import COLUMN_TYPES, write_export
+from export_data import run_export
+
+
+class Principal:
+    def __init__(self, id, role_name):
+        self.id = id
+        self.role = type("Role", (), {"name": role_name})
+
+
+@pytest.fixture
+def data(session):
+    """Deux commerciaux avec deux clients chacun (un contrat et un événement par client)."""
+    roles = {name: Roles(name=f"exp-{name}") for name in ("gestion", "commercial", "support")}
+    session.add_all(roles.values())
+    session.flush()
+    users = {}
+    for name, role in (("gestion", "gestion"), ("com1", "commercial"), ("com2", "commercial"), ("sup", "support")):
+        users[name] = Users(username=f"exp-{name}", first_name=name, last_name="Export",
+                            email=f"exp-{name}@test.com", hashed_password="x", role_id=roles[role].id)
+    session.add_all(users.values())
+    session.flush()
+    for i in range(4):
+        commercial = users["com1"] if i < 2 else users["com2"]
+        client = Clients(first_name="Client", last_name=f"Exp{i}", email=f"exp-client{i}@test.com",
+                         phone="0600000000", company_name="ExpCorp", commercial_id=commercial.id)
+        contract = Contracts(client=client, commercial_id=commercial.id, total_amount=100 * (i + 1),
+                             amount_due=0, is_signed=True, date_created=datetime(2024, 1, i + 1))
+        session.add_all([client, contract])
+        session.flush()
+        session.add(Events(name=f"Event {i}", client_id=client.id, contract_id=contract.id,
+                           support_contact_id=users["sup"].id if i % 2 else None,
+                           date_start=datetime(2024, 6, i + 1), date_end=datetime(2024, 6, i + 1, 18)))
+    session.flush()
+    session.expunge_all()
+    # Utilisateurs connectés (comme ceux du contexte d'authentification)
+    return {
+        name: Principal(user.id, role)
+        for (name, role), user in zip(
+            (("gestion", "gestion"), ("com1", "commercial"), ("com2", "commercial"), ("sup", "support")),
+            users.values(),
+        )
+    }
+
+
+def exported(session, entity, user, batch_size=1000):
+    batches, error = export_batches(session, entity, user, batch_size=batch_size)
+    assert error is None
+    return [row for batch in batches for row in batch]
+
+
+def test_gestion_exports_everything_in_batches(session, data):
+    batches, _ = export_batches(session, "clients", data["gestion"], batch_size=3)
+    sizes = [len(batch) for batch in batches]
+
+    assert sizes == [3, 1]
+    rows = exported(session, "clients", data["gestion"])
+    assert [row["email"] for row in rows] == [f"exp-client{i}@test.com" for i in range(4)]
+    assert rows[0]["phone"] == "0600000000"
+
+
+def test_commercial_exports_own_clients_only(session, data):
+    commercial = data["com1"]
+
+    assert {row["commercial_id"] for row in exported(session, "clients", commercial)} == {commercial.id}
+    assert [row["client_name"] for row in exported(session, "contracts", commercial)] == ["Client Exp0", "Client Exp1"]
+    assert [row["name"] for row in exported(session, "events", commercial)] == ["Event 0", "Event 1"]
+
+
+def test_support_exports_own_events_only(session, data):
+    support = data["sup"]
+
+    rows = exported(session, "events", support)
+    assert [row["name"] for row in rows] == ["Event 1", "Event 3"]
+    assert rows[0]["support_contact_name"] == "sup Export"
+    assert export_batches(session, "clients", support)[1].startswith("⛔")
+
+
+def test_unknown_entity(session, data):
+    assert export_batches(session, "invoices", data["gestion"])[0] is None
+
+
+def test_run_export_csv_and_jsonl(session, data, tmp_path):
+    csv_path = tmp_path / "contrats.csv"
+    count, error = run_export(session, "contracts", str(csv_path), data["gestion"], batch_size=2)
+    assert (count, error) == (4, None)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["total_amount"] for row in rows] == ["100.00", "200.00", "300.00", "400.00"]
+    assert rows[0]["date_created"] == "2024-01-01T00:00:00"
+
+    jsonl_path = tmp_path / "evenements.jsonl"
+    progress = []
+    count, error = run_export(session, "events", str(jsonl_path), data["gestion"], batch_size=3,
+                              on_progress=progress.append)
+    assert (count, error) == (4, None)
+    assert progress == [3, 4]
+    with open(jsonl_path, encoding="utf-8") as f:
+        assert json.loads(f.readline())["name"] == "Event 0"
+
+
+def test_run_export_parquet(session, data, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "clients.parquet"
+
+    count, error = run_export(session, "clients", str(path), data["gestion"], batch_size=3)
+
+    assert (count, error) == (4, None)
+    assert pq.read_table(path).column("email").to_pylist()[0] == "exp-client0@test.com"
+
+
+def test_run_export_parquet_keeps_nullable_columns_across_batches(session, data, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "evenements.parquet"
+
+    # Premier lot : événement sans support (colonnes vides), puis des lots remplis
+    count, error = run_export(session, "events", str(path), data["gestion"], batch_size=1)
+
+    assert (count, error) == (4, None)
+    table = pq.read_table(path)
+    assert str(table.schema.field("support_contact_name").type) == "string"
+    assert table.column("support_contact_name").to_pylist() == [None, "sup Export", None, "sup Export"]
+
+
+def test_parquet_money_columns_have_a_fixed_decimal_type(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "contrats.parquet"
+    batches = [[{"id": 1, "total_amount": Decimal("1.00")}], [{"id": 2, "total_amount": Decimal("98765432.10")}]]
+
+    write_export(str(path), ("id", "total_amount"), batches, types={"id": "int", "total_amount": "money"})
+
+    assert pq.read_table(path).column("total_amount").to_pylist() == [Decimal("1.00"), Decimal("98765432.10")]
+
+
+def test_every_export_column_has_a_type():
+    for entity, columns in EXPORT_COLUMNS.items():
+        assert set(EXPORT_TYPES[entity]) == set(columns)
+        assert set(EXPORT_TYPES[entity].values()) <= set(COLUMN_TYPES)
+
+
+def test_run_export_parquet_without_pyarrow(session, data, tmp_path, monkeypatch):
+    import builtins
+    real_import = builtins.__import__
+
+    def no_pyarrow(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_pyarrow)
+    count, error = run_export(session, "clients", str(tmp_path / "clients.parquet"), data["gestion"])
+
+    assert count is None
+    assert "pyarrow" in error
@@ -0,0 +1,97 @@
+import pytest
+from app.controllers.revenue_controller import (
+    check_revenue_summaries, rebuild_revenue_summaries, revenue_dashboard
+)
+from app.models import ClientRevenue, Clients, CommercialRevenue, Contracts, Roles, Users
+
+
+def stored(session, model, key):
+    row = session.get(model, key)
+    session.refresh(row)
+    return (row.contracts, row.signed_contracts, row.signed_total, row.amount_due, row.unpaid_contracts)
+
+
+@pytest.fixture
+def crm(session):
+    role = Roles(name="commercial")
+    commercials = [
+        Users(username=f"com{i}", first_name="Camille", last_name=f"Com{i}",
+              email=f"com{i}@revenue.com", hashed_password="x", role=role)
+        for i in (1, 2)
+    ]
+    session.add_all(commercials)
+    session.flush()
+    clients = [
+        Clients(first_name="Léa", last_name=f"Client{i}", email=f"client{i}@revenue.com", phone="0600000000",
+                company_name=f"Société {i}", commercial_id=commercials[0].id)
+        for i in (1, 2)
+    ]
+    session.add_all(clients)
+    session.flush()
+    return {"commercials": commercials, "clients": clients}
+
+
+def add_contract(session, client, commercial, total, due, signed=False):
+    contract = Contracts(client_id=client.id, commercial_id=commercial.id,
+                         total_amount=total, amount_due=due, is_signed=signed)
+    session.add(contract)
+    session.flush()
+    return contract
+
+
+def test_aggregates_follow_contract_writes(session, crm):
+    com1, com2 = crm["commercials"]
+    client1, client2 = crm["clients"]
+    signed = add_contract(session, client1, com1, 1000, 400, signed=True)
+    draft = add_contract(session, client2, com1, 500, 500)
+
+    assert stored(session, CommercialRevenue, com1.id) == (2, 1, 1000, 900, 2)
+    assert stored(session, ClientRevenue, client2.id) == (1, 0, 0, 500, 1)
+
+    # Signature et paiement
+    draft.is_signed = True
+    draft.amount_due = 0
+    session.flush()
+    assert stored(session, CommercialRevenue, com1.id) == (2, 2, 1500, 400, 1)
+
+    # Changement de commercial : le contrat passe d'un agrégat à l'autre
+    signed.commercial_id = com2.id
+    session.flush()
+    assert stored(session, CommercialRevenue, com1.id) == (1, 1, 500, 0, 0)
+    assert stored(session, CommercialRevenue, com2.id) == (1, 1, 1000, 400, 1)
+
+    session.delete(signed)
+    session.flush()
+    assert stored(session, CommercialRevenue, com2.id) == (0, 0, 0, 0, 0)
+    assert check_revenue_summaries(session) == []
+
+
+def test_check_reports_and_rebuild_repairs(session, crm):
+    com1 = crm["commercials"][0]
+    client1 = crm["clients"][0]
+    add_contract(session, client1, com1, 1000, 400, signed=True)
+    # Écart simulé (ex. contrats insérés hors ORM)
+    session.connection().exec_driver_sql(
+        f"UPDATE commercial_revenue SET amount_due = 0 WHERE commercial_id = {com1.id}"
+    )
+
+    assert check_revenue_summaries(session) == [("commercial", com1.id, "amount_due", 400, 0)]
+
+    counts = rebuild_revenue_summaries(session)
+
+    assert counts == {"commercial": 1, "client": 1}
+    assert check_revenue_summaries(session) == []
+
+
+def test_dashboard_reads_aggregates(session, crm):
+    com1 = crm["commercials"][0]
+    client1, client2 = crm["clients"]
+    add_contract(session, client1, com1, 1000, 400, signed=True)
+    add_contract(session, client2, com1, 500, 0, signed=True)
+
+    dashboard = revenue_dashboard(session)
+
+    assert [row["name"] for row in dashboard["commercials"]] == ["Camille Com1"]
+    assert dashboard["totals"]["signed_total"] == 1500
+    assert dashboard["totals"]["amount_due"] == 400
+    assert [row["company_name"] for row in dashboard["clients"]] == ["Société 1"]
@@ -44,9 +44,6 @@ class FakeSession:
 def fake_hash_password(password):
     return f"hashed-{password}"
 
-def fake_capture_message(*args, **kwargs):
-    pass
-
 
 # === TESTS CREATE_USER ===
 
@@ -58,7 +55,6 @@ def test_create_user_success(monkeypatch):
     ]
 
     monkeypatch.setattr("app.controllers.user_controller.hash_password", fake_hash_password)
-    monkeypatch.setattr("app.controllers.user_controller.sentry_sdk.capture_message", fake_capture_message)
 
     user, error = create_user(
         session,
@@ -124,7 +120,6 @@ def test_update_user_success(monkeypatch):
     session.query_data = [existing_user]
 
     monkeypatch.setattr("app.controllers.user_controller.hash_password", fake_hash_password)
-    monkeypatch.setattr("app.controllers.user_controller.sentry_sdk.capture_message", fake_capture_message)
 
     updates = {
         "username": "newuser",
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """
+    Compte les requêtes SQL exécutées sur un moteur (liste des instructions dans
+    `statements`, paramètres correspondants dans `parameters`).
+    """
+    def __init__(self):
+        self.statements = []
+        self.parameters = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(engine):
+    """Compte les requêtes exécutées sur `engine` dans le bloc `with`."""
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+@contextmanager
+def assert_max_queries(engine, maximum):
+    """Échoue si le bloc `with` exécute plus de `maximum` requêtes sur `engine`."""
+    with count_queries(engine) as counter:
+        yield counter
+    assert counter.count <= maximum, (
+        f"{counter.count} requêtes exécutées (maximum {maximum}) :\n" + "\n".join(counter.statements)
+    )
+
+
+class FakeTransport:
+    """Transport d'audit local : garde les lots reçus au lieu de les envoyer à Sentry."""
+    def __init__(self):
+        self.batches = []
+
+    def send(self, records):
+        self.batches.append(list(records))
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+    def actions(self):
+        return [record["action"] for record in self.records]
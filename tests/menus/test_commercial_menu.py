@@ -32,7 +32,7 @@ def test_commercial_menu_quit(monkeypatch, commercial_user):
 
 # === TEST MENU CLIENTS ===
 def test_commercial_clients_menu(monkeypatch, commercial_user):
-    actions = iter(["1", "2", "3", "0"])
+    actions = iter(["1", "2", "3", "4", "0"])
     monkeypatch.setattr("app.menus.commercial_menu.Prompt.ask", lambda *a, **k: next(actions))
 
     called = []
@@ -45,9 +45,10 @@ def test_commercial_clients_menu(monkeypatch, commercial_user):
     monkeypatch.setattr("app.menus.commercial_menu.create_client_view", make_mock("create"))
     monkeypatch.setattr("app.menus.commercial_menu.update_client_view", make_mock("update"))
     monkeypatch.setattr("app.menus.commercial_menu.show_all_clients_view", make_mock("list"))
+    monkeypatch.setattr("app.menus.commercial_menu.search_view", make_mock("search"))
 
     menu.commercial_clients_menu(commercial_user)
-    assert called == ["create", "update", "list"]
+    assert called == ["create", "update", "list", "search"]
 
 
 # === TEST MENU CONTRATS ===
@@ -53,7 +53,7 @@ def test_gestion_main_menu_quit(monkeypatch, gestion_user):
 # === TEST : collaborateurs_menu ===
 def test_collaborateurs_menu(monkeypatch, gestion_user):
     calls = []
-    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "4", "0"])
+    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "4", "5", "0"])
 
     mock_and_track(monkeypatch, menu, "create_user_view", "create", calls)
     mock_and_track(monkeypatch, menu, "update_user_view", "update", calls)
@@ -67,38 +67,42 @@ def test_collaborateurs_menu(monkeypatch, gestion_user):
 # === TEST : clients_menu ===
 def test_clients_menu(monkeypatch, gestion_user):
     calls = []
-    mock_prompt_ask_sequence(monkeypatch, ["1", "0"])
+    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "0"])
 
     mock_and_track(monkeypatch, menu, "show_all_clients_view", "list_clients", calls)
+    mock_and_track(monkeypatch, menu, "search_view", "search", calls)
 
     menu.clients_menu(gestion_user)
-    assert calls == ["list_clients"]
+    assert calls == ["list_clients", "search"]
 
 
 # === TEST : contrats_menu ===
 def test_contrats_menu(monkeypatch, gestion_user):
     calls = []
-    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "0"])
+    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "4", "0"])
 
     mock_and_track(monkeypatch, menu, "create_contract_view", "create", calls)
     mock_and_track(monkeypatch, menu, "update_contract_view", "update", calls)
     mock_and_track(monkeypatch, menu, "show_all_contracts_view", "list", calls)
+    mock_and_track(monkeypatch, menu, "revenue_dashboard_view", "dashboard", calls)
 
     menu.contrats_menu(gestion_user)
-    assert calls == ["create", "update", "list"]
+    assert calls == ["create", "update", "list", "dashboard"]
 
 
 # === TEST : evenements_menu ===
 def test_evenements_menu(monkeypatch, gestion_user):
     calls = []
-    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "0"])
+    mock_prompt_ask_sequence(monkeypatch, ["1", "2", "3", "4", "5", "0"])
 
     mock_and_track(monkeypatch, menu, "update_event_view", "update", calls)
     mock_and_track(monkeypatch, menu, "show_all_events_view", "list", calls)
     mock_and_track(monkeypatch, menu, "filter_events_view", "filter", calls)
+    mock_and_track(monkeypatch, menu, "schedule_conflicts_view", "conflicts", calls)
+    mock_and_track(monkeypatch, menu, "auto_assign_view", "assign", calls)
 
     menu.evenements_menu(gestion_user)
-    assert calls == ["update", "list", "filter"]
+    assert calls == ["update", "list", "filter", "conflicts", "assign"]
 
 
 # === TEST : refus d'accès pour utilisateur non gestionnaire ===
@@ -0,0 +1,159 @@
+import pytest
+from app.models import Clients, Users, Roles
+from app.models.mixins import blind_index
+from app.repositories.client_repository import get_client_by_email
+from app.repositories.user_repository import get_user_by_email, get_user_by_login
+
+
+def make_client(email, **kwargs):
+    data = dict(first_name="Jean", last_name="Dupont", email=email,
+                phone="0600000000", company_name="TestCorp")
+    data.update(kwargs)
+    return Clients(**data)
+
+
+# === blind_index ===
+
+def test_blind_index_is_deterministic():
+    assert blind_index("a@test.com") == blind_index("a@test.com")
+    assert blind_index("a@test.com") != blind_index("b@test.com")
+
+
+def test_blind_index_normalizes_value():
+    assert blind_index("  Alice@Test.com ") == blind_index("alice@test.com")
+
+
+def test_blind_index_none():
+    assert blind_index(None) is None
+
+
+def test_setting_email_updates_blind_index():
+    client = make_client("old@test.com")
+    assert client.email_bidx == blind_index("old@test.com")
+
+    client.email = "new@test.com"
+    assert client.email_bidx == blind_index("new@test.com")
+
+
+# === Recherche indexée (base SQLite en mémoire) ===
+
+def test_get_client_by_email(session):
+    client = make_client("jean@client.com")
+    session.add(client)
+    session.flush()
+
+    assert get_client_by_email(session, "JEAN@client.com") is client
+    assert get_client_by_email(session, "jean@client.com", exclude_id=client.id) is None
+    assert get_client_by_email(session, "unknown@client.com") is None
+
+
+def test_get_user_by_login(session):
+    role = Roles(name="test-role")
+    session.add(role)
+    session.flush()
+    user = Users(username="jdoe", first_name="John", last_name="Doe",
+                 email="jdoe@example.com", hashed_password="x", role_id=role.id)
+    session.add(user)
+    session.flush()
+
+    assert get_user_by_login(session, "jdoe") is user
+    assert get_user_by_login(session, "jdoe@example.com") is user
+    assert get_user_by_email(session, "jdoe@example.com", exclude_id=user.id) is None
+
+
+def test_backfill_fills_missing_blind_index(session):
+    from migrations.m000_blind_index import backfill_table
+
+    client = make_client("legacy@client.com")
+    session.add(client)
+    session.flush()
+    # Simule une ligne créée avant l'introduction de l'index aveugle
+    session.query(Clients).filter_by(id=client.id).update({"email_bidx": None})
+    session.expire_all()
+
+    assert backfill_table(session.connection(), "clients") >= 1
+    assert get_client_by_email(session, "legacy@client.com").id == client.id
+
+
+# === Déchiffrement en masse ===
+
+def test_decrypt_pool_is_shut_down_at_exit(monkeypatch):
+    import atexit
+    from app.models import mixins
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(mixins, "DECRYPT_WORKERS", 2)
+    monkeypatch.setattr(mixins, "_decrypt_executor", None)
+    values = [mixins.encrypt_value(f"user{i}@test.com") for i in range(6)]
+
+    assert mixins.decrypt_many(values, chunk_size=2) == [f"user{i}@test.com" for i in range(6)]
+    executor = mixins._decrypt_executor
+    assert registered == [mixins.shutdown_decrypt_executor]
+
+    mixins.shutdown_decrypt_executor()
+    assert mixins._decrypt_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(len, [])
+
+
+def test_decrypt_many_keeps_order_and_none():
+    from app.models.mixins import decrypt_many, fernet
+
+    values = [fernet.encrypt(f"user{i}@test.com".encode()).decode() for i in range(5)] + [None]
+    assert decrypt_many(values) == [f"user{i}@test.com" for i in range(5)] + [None]
+
+
+def test_decrypt_many_uses_worker_pool(monkeypatch):
+    from app.models import mixins
+
+    monkeypatch.setattr(mixins, "DECRYPT_WORKERS", 2)
+    values = [mixins.fernet.encrypt(str(i).encode()).decode() for i in range(10)]
+    assert mixins.decrypt_many(values, chunk_size=3) == [str(i) for i in range(10)]
+
+
+# === Déchiffrement différé ===
+
+def test_encrypted_attribute_is_decrypted_once(monkeypatch, session):
+    from app.models import mixins
+
+    session.add(make_client("lazy@test.com"))
+    session.flush()
+    session.expunge_all()
+    client = session.query(Clients).one()
+
+    calls = []
+    original = mixins.decrypt_value
+    monkeypatch.setattr(mixins, "decrypt_value", lambda v: calls.append(v) or original(v))
+
+    assert client.email == "lazy@test.com"
+    assert client.email == "lazy@test.com"
+    assert len(calls) == 1
+
+
+def test_setting_same_value_keeps_ciphertext(session):
+    client = make_client("same@test.com")
+    session.add(client)
+    session.flush()
+    ciphertext = client._email
+
+    client.email = "same@test.com"
+
+    assert client._email == ciphertext
+    assert client not in session.dirty
+
+
+def test_class_level_equality_uses_blind_index(session):
+    session.add(make_client("eq@test.com"))
+    session.flush()
+
+    assert session.query(Clients).filter(Clients.email == " EQ@test.com").count() == 1
+    assert session.query(Clients).filter(Clients.email.in_(["eq@test.com", "x@test.com"])).count() == 1
+    assert session.query(Clients).filter(Clients.email != "eq@test.com").count() == 0
+
+
+def test_class_level_encrypted_expressions_raise():
+    with pytest.raises(TypeError):
+        Clients.email.like("eq%")
+    with pytest.raises(TypeError):
+        Clients.phone == "0600000000"  # pas d'index aveugle
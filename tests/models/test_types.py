@@ -0,0 +1,54 @@
+from decimal import Decimal
+from app.models import Clients, Contracts
+from app.models.types import from_cents, to_cents, to_money
+from app.repositories.contract_repository import get_contract_totals
+
+
+def test_to_money_rounds_to_the_cent():
+    assert to_money(0.1) == Decimal("0.10")
+    assert to_money("19.995") == Decimal("20.00")
+    assert to_money(7) == Decimal("7.00")
+    assert to_money(None) is None
+
+
+def test_cents_round_trip():
+    assert to_cents(1234.56) == 123456
+    assert to_cents(Decimal("0.3")) == 30
+    assert from_cents(123456) == Decimal("1234.56")
+    assert from_cents(123456.0) == Decimal("1234.56")   # colonne REAL d'une ancienne base SQLite
+
+
+def add_contracts(session, *amounts):
+    client = Clients(first_name="Jean", last_name="Money", email="jean@money.com",
+                     phone="0600000000", company_name="Money SA", commercial_id=1)
+    session.add(client)
+    session.flush()
+    for total, due, signed in amounts:
+        session.add(Contracts(client_id=client.id, commercial_id=1, total_amount=total, amount_due=due,
+                              is_signed=signed))
+    session.flush()
+    session.expunge_all()
+
+
+def test_amounts_are_exact(session):
+    add_contracts(session, (0.1, 0.1, True), (0.2, 0.2, True), (0.3, 0.0, False))
+
+    contracts = session.query(Contracts).order_by(Contracts.id).all()
+
+    assert contracts[0].total_amount == Decimal("0.10")
+    assert sum(c.total_amount for c in contracts[:2]) == contracts[2].total_amount
+    assert session.query(Contracts).filter(Contracts.amount_due == 0).count() == 1
+
+
+def test_contract_totals_are_computed_by_the_database(session):
+    add_contracts(session, (1000, 250.5, True), (0.1, 0.1, True), (0.2, 0.2, False))
+
+    totals = get_contract_totals(session)
+
+    assert totals == {
+        "contracts": 3, "signed_contracts": 2,
+        "total_amount": Decimal("1000.30"), "signed_total": Decimal("1000.10"), "amount_due": Decimal("250.80"),
+    }
+    unpaid = get_contract_totals(session, criteria=(Contracts.amount_due > 0,), commercial_id=1)
+    assert unpaid["contracts"] == 3
+    assert get_contract_totals(session, commercial_id=99)["contracts"] == 0
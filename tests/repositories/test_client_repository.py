@@ -0,0 +1,33 @@
+from app.models import Clients
+from app.models.mixins import _PLAINTEXT_CACHE
+from app.repositories.client_repository import get_all_clients
+
+
+def add_clients(session, *last_names):
+    for last_name in last_names:
+        session.add(Clients(first_name="Jean", last_name=last_name, email=f"{last_name}@test.com",
+                            phone="0600000000", company_name="TestCorp"))
+    session.flush()
+    session.expunge_all()
+
+
+def test_get_all_clients_is_lazy_by_default(session):
+    add_clients(session, "Zola", "Aubert")
+
+    clients = get_all_clients(session)
+
+    assert [c.last_name for c in clients] == ["Aubert", "Zola"]
+    assert all(_PLAINTEXT_CACHE not in c.__dict__ for c in clients)
+    assert clients[0].email == "Aubert@test.com"
+
+
+def test_get_all_clients_decrypts_requested_fields_in_bulk(session):
+    add_clients(session, "Zola", "Aubert")
+
+    clients = get_all_clients(session, decrypt=("email",))
+
+    cache = clients[0].__dict__[_PLAINTEXT_CACHE]
+    assert cache["_email"][1] == "Aubert@test.com"
+    assert "_phone" not in cache
+    assert clients[1].phone == "0600000000"
+    assert not session.dirty
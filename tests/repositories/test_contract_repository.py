@@ -0,0 +1,39 @@
+import pytest
+from app.models import Clients, Contracts, Roles, Users
+from app.repositories.contract_repository import get_contracts, get_contracts_page, iter_contracts
+from tests.helpers import count_queries
+
+
+@pytest.fixture
+def commercial(session):
+    """Un commercial avec deux clients, un contrat chacun, et le client d'un autre commercial."""
+    role = Roles(name="repo-commercial")
+    users = [Users(username=f"repo-com{i}", first_name="Com", last_name=str(i), email=f"repo-com{i}@test.com",
+                   hashed_password="x", role=role) for i in range(2)]
+    session.add_all(users)
+    session.flush()
+    for i, user in enumerate((users[0], users[0], users[1])):
+        client = Clients(first_name="Client", last_name=f"Repo{i}", email=f"repo-client{i}@test.com",
+                         phone="0600000000", company_name="RepoCorp", commercial_id=user.id)
+        session.add(Contracts(client=client, commercial_id=user.id, total_amount=100, amount_due=0))
+    session.flush()
+    session.expunge_all()
+    return users[0]
+
+
+@pytest.mark.parametrize("load, profile", [
+    (lambda s, user, profile: get_contracts(s, commercial_id=user.id, profile=profile), "contract_list"),
+    (lambda s, user, profile: get_contracts_page(s, commercial_id=user.id, profile=profile)[0], "contract_list"),
+    (lambda s, user, profile: get_contracts_page(s, commercial_id=user.id, profile=profile)[0], "contract_filter"),
+    (lambda s, user, profile: [c for batch in iter_contracts(s, commercial_id=user.id) for c in batch],
+     "contract_list"),
+])
+def test_commercial_filter_joins_clients_once(session, commercial, load, profile):
+    engine = session.get_bind().engine
+    with count_queries(engine) as counter:
+        contracts = load(session, commercial, profile)
+        names = sorted(contract.client.last_name for contract in contracts)
+
+    assert names == ["Repo0", "Repo1"]
+    [statement] = counter.statements  # client lu dans la jointure, sans requête de plus
+    assert statement.count("JOIN clients") == 1, statement
@@ -0,0 +1,54 @@
+from datetime import datetime
+from app.models import Clients, Contracts, Events
+from app.repositories.client_repository import get_clients_page
+from app.repositories.contract_repository import get_contracts_page
+from app.repositories.event_repository import get_events_page
+
+
+def collect_pages(fetch_page, limit):
+    """Parcourt toutes les pages et retourne (éléments, tailles des pages)."""
+    items, sizes, cursor = [], [], None
+    while True:
+        page, cursor = fetch_page(after=cursor, limit=limit)
+        items.extend(page)
+        sizes.append(len(page))
+        if cursor is None:
+            return items, sizes
+
+
+def test_clients_pages_follow_last_name_order(session):
+    for i, last_name in enumerate(["Martin", "Bernard", "Martin", "Dubois", "Petit"]):
+        session.add(Clients(first_name="Jean", last_name=last_name, email=f"c{i}@test.com",
+                            phone="0600000000", company_name="TestCorp"))
+    session.flush()
+
+    clients, sizes = collect_pages(lambda **k: get_clients_page(session, **k), limit=2)
+
+    assert sizes == [2, 2, 1]
+    assert [c.last_name for c in clients] == ["Bernard", "Dubois", "Martin", "Martin", "Petit"]
+    assert len({c.id for c in clients}) == 5
+
+
+def test_contracts_pages_are_most_recent_first(session):
+    same_day = datetime(2024, 1, 1)
+    for day in (same_day, same_day, datetime(2024, 3, 1), datetime(2023, 6, 1)):
+        session.add(Contracts(total_amount=100, amount_due=0, date_created=day))
+    session.flush()
+
+    contracts, sizes = collect_pages(lambda **k: get_contracts_page(session, **k), limit=3)
+
+    assert sizes == [3, 1]
+    keys = [(c.date_created, c.id) for c in contracts]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_events_last_page_has_no_cursor(session):
+    for day in (1, 2, 3):
+        session.add(Events(name=f"Event {day}", date_start=datetime(2024, 5, day),
+                           date_end=datetime(2024, 5, day, 18)))
+    session.flush()
+
+    events, cursor = get_events_page(session, limit=3)
+
+    assert cursor is None
+    assert [e.name for e in events] == ["Event 3", "Event 2", "Event 1"]
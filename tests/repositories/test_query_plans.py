@@ -0,0 +1,133 @@
+from datetime import datetime
+import pytest
+from app.models import Base, Contracts, Events
+from app.repositories.contract_repository import get_contracts, get_contracts_page
+from app.repositories.event_repository import find_overlapping_event, get_events, get_events_page
+from tests.helpers import count_queries
+
+NOW = datetime(2024, 6, 1)
+
+
+def query_plan(session, run):
+    """Exécute `run(session)` et retourne le plan (EXPLAIN QUERY PLAN) de la première requête."""
+    with count_queries(session.get_bind().engine) as counter:
+        run(session)
+    statement, parameters = counter.statements[0], counter.parameters[0]
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+# Index partiels : les parcourir ne lit que les lignes qui vérifient leur filtre
+PARTIAL_INDEXES = {
+    index.name
+    for table in Base.metadata.tables.values()
+    for index in table.indexes
+    if index.dialect_options["sqlite"]["where"] is not None
+}
+
+
+def table_lines(plan, table):
+    lines = [line for line in plan if f" {table} " in f" {line} "]
+    assert lines, plan
+    return lines
+
+
+def assert_uses_index(plan, table, index=None):
+    """
+    Vérifie que `table` est lue par une recherche dans un index (SEARCH), ou par le
+    parcours d'un index partiel, et non par un parcours complet (SCAN), même ordonné.
+    """
+    for line in table_lines(plan, table):
+        if index is not None:
+            assert f" {index} " in f"{line} ", plan
+        searched = line.startswith("SEARCH ") and ("INDEX" in line or "PRIMARY KEY" in line)
+        assert searched or (index in PARTIAL_INDEXES and line.startswith("SCAN ")), plan
+
+
+def assert_scans_in_order(plan, table, index):
+    """Vérifie que `table` est parcourue dans l'ordre de `index`, sans tri temporaire."""
+    assert table_lines(plan, table) == [f"SCAN {table} USING INDEX {index}"], plan
+    assert not any("TEMP B-TREE" in line for line in plan), plan
+
+
+CONTRACT_FILTERS = {
+    "non signés": ((Contracts.is_signed == False,), "ix_contracts_signed_created"),
+    "non payés": ((Contracts.amount_due > 0,), "ix_contracts_unpaid_created"),
+    "non signés et non payés": ((Contracts.is_signed == False, Contracts.amount_due > 0), None),
+    "signés": ((Contracts.is_signed == True,), "ix_contracts_signed_created"),
+    "payés": ((Contracts.amount_due == 0,), "ix_contracts_paid_created"),
+}
+
+
+@pytest.mark.parametrize("label", CONTRACT_FILTERS)
+def test_filter_contracts_uses_index(session, label):
+    criteria, index = CONTRACT_FILTERS[label]
+    plan = query_plan(session, lambda s: get_contracts_page(s, criteria=criteria, profile="contract_filter"))
+    assert_uses_index(plan, "contracts", index)
+
+
+def test_filter_contracts_of_commercial_uses_index(session):
+    plan = query_plan(session, lambda s: get_contracts_page(
+        s, criteria=(Contracts.is_signed == False,), commercial_id=1, profile="contract_filter"))
+    assert_uses_index(plan, "contracts")
+    assert_uses_index(plan, "clients")
+
+
+def test_contracts_page_uses_index(session):
+    plan = query_plan(session, lambda s: get_contracts_page(s, after=(NOW, 10)))
+    assert_uses_index(plan, "contracts", "ix_contracts_date_created_id")
+
+
+def test_update_contract_list_of_commercial_uses_index(session):
+    plan = query_plan(session, lambda s: get_contracts(s, commercial_id=1))
+    assert_uses_index(plan, "contracts")
+    assert_uses_index(plan, "clients", "ix_clients_commercial_id")
+
+
+# Filtres de filter_events_view : (critère, tri, index attendu)
+EVENT_FILTERS = {
+    "à venir": (Events.date_start > NOW, None, "ix_events_date_start_id"),
+    "passés": (Events.date_end < NOW, Events.date_end.desc(), "ix_events_date_end"),
+    "sans support": (Events.support_contact_id == None, None, "ix_events_support_date_start"),
+}
+
+# Filtres peu sélectifs (la plupart des événements ont un support) ou sans index :
+# parcours de la table dans l'ordre d'affichage, sans tri
+SCANNED_EVENT_FILTERS = {
+    "avec support": Events.support_contact_id != None,
+    "plus de 50 participants": Events.attendees > 50,
+}
+
+
+@pytest.mark.parametrize("label", EVENT_FILTERS)
+def test_filter_events_uses_index(session, label):
+    criterion, order_by, index = EVENT_FILTERS[label]
+    plan = query_plan(session, lambda s: get_events(s, (criterion,), order_by=order_by))
+    assert_uses_index(plan, "events", index)
+    assert not any("TEMP B-TREE" in line for line in plan), plan
+
+
+@pytest.mark.parametrize("label", SCANNED_EVENT_FILTERS)
+def test_unselective_event_filters_scan_in_date_order(session, label):
+    plan = query_plan(session, lambda s: get_events(s, (SCANNED_EVENT_FILTERS[label],)))
+    assert_scans_in_order(plan, "events", "ix_events_date_start_id")
+
+
+def test_user_events_uses_index(session):
+    plan = query_plan(session, lambda s: get_events(s, (Events.support_contact_id == 1,), profile="event_user"))
+    assert_uses_index(plan, "events", "ix_events_support_date_start")
+
+
+def test_events_page_uses_index(session):
+    plan = query_plan(session, lambda s: get_events_page(s, after=(NOW, 10)))
+    assert_uses_index(plan, "events", "ix_events_date_start_id")
+
+
+@pytest.mark.parametrize("key, value, index", [
+    ("support", 1, "ix_events_support_date_end_start"),
+    ("location", "Paris", "ix_events_location_date_end_start"),
+])
+def test_schedule_conflict_check_uses_index(session, key, value, index):
+    plan = query_plan(session, lambda s: find_overlapping_event(s, key, value, NOW, NOW, exclude_id=3))
+    assert_uses_index(plan, "events", index)
+    assert not any("TEMP B-TREE" in line for line in plan), plan
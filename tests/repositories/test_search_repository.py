@@ -0,0 +1,95 @@
+from datetime import datetime
+import pytest
+from app.controllers.client_controller import import_clients_chunk
+from app.controllers.search_controller import search
+from app.models import Clients, Events
+from app.repositories.search_repository import build_match_query, search_clients, search_events
+
+
+def make_client(first_name, last_name, company_name, email):
+    return Clients(first_name=first_name, last_name=last_name, company_name=company_name,
+                   email=email, phone="0600000000")
+
+
+@pytest.fixture
+def clients(session):
+    items = [
+        make_client("Élise", "Moreau", "Les Ateliers Berthe", "elise@search.com"),
+        make_client("Jacques", "Durand", "VinoBle", "jacques@search.com"),
+        make_client("Durand", "Martin", "Durandal Conseil", "martin@search.com"),
+    ]
+    session.add_all(items)
+    session.flush()
+    return items
+
+
+def test_build_match_query():
+    assert build_match_query("dur  Jac") == '"dur"* "Jac"*'
+    assert build_match_query('"OR) NEAR(') == '"OR"* "NEAR"*'
+    assert build_match_query(" *** ") is None
+
+
+def test_search_prefix_ignores_accents(session, clients):
+    assert [c.last_name for c in search_clients(session, "eli")] == ["Moreau"]
+    assert [c.last_name for c in search_clients(session, "ateliers ber")] == ["Moreau"]
+
+
+def test_search_ranks_last_name_first(session, clients):
+    # "Durand" est le nom de famille de Jacques, le prénom / l'entreprise de Martin
+    assert [c.last_name for c in search_clients(session, "durand")] == ["Durand", "Martin"]
+
+
+def test_best_match_is_found_among_many_matches(session):
+    # 600 correspondances faibles (entreprise) avant la meilleure (nom), créée en dernier
+    session.add_all(make_client("Paul", f"Nom{i}", "Durandal Conseil", f"p{i}@search.com") for i in range(600))
+    session.add(make_client("Jacques", "Durand", "VinoBle", "late@search.com"))
+    session.flush()
+
+    assert search_clients(session, "durand", limit=5)[0].email == "late@search.com"
+
+
+def test_index_follows_updates_and_deletes(session, clients):
+    elise = clients[0]
+    elise.last_name = "Lefèvre"
+    session.flush()
+    assert search_clients(session, "moreau") == []
+    assert search_clients(session, "lefevre") == [elise]
+
+    session.delete(elise)
+    session.flush()
+    assert search_clients(session, "lefevre") == []
+
+
+def test_encrypted_fields_are_not_indexed(session, clients):
+    assert search_clients(session, "search") == []
+    assert search_clients(session, "0600000000") == []
+
+
+def test_search_by_email_uses_blind_index(session, clients):
+    results, error = search(session, "JACQUES@search.com")
+    assert error is None
+    assert results == {"clients": [clients[1]], "events": []}
+
+
+def test_search_events(session, clients):
+    event = Events(name="Salon du vin", client_id=clients[1].id, date_start=datetime(2024, 6, 1),
+                   date_end=datetime(2024, 6, 2), location="Bordeaux", notes="Prévoir dégustation")
+    session.add(event)
+    session.flush()
+
+    assert search_events(session, "bord") == [event]
+    assert search_events(session, "degust") == [event]
+    results, _ = search(session, "salon")
+    assert results["events"] == [event] and results["clients"] == []
+
+
+def test_search_empty_terms(session):
+    assert search(session, "  ")[1].startswith("❌")
+
+
+def test_bulk_import_is_indexed(session):
+    rows = [(2, dict(first_name="Zoé", last_name="Bulkimport", email="zoe@bulk.com",
+                     phone="0600000000", company_name="Bulk"))]
+    assert import_clients_chunk(session, rows)[0] == 1
+
+    assert [c.first_name for c in search_clients(session, "bulkimp")] == ["Zoé"]
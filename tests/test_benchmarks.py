@@ -0,0 +1,62 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.engine import create_app_engine
+from app.models import Base, Clients, Contracts, Events
+from app.models.revenue import CommercialRevenue
+from benchmarks.datasets import generate_dataset
+from benchmarks.suite import compare, measure
+
+
+def results(timings, size="1000"):
+    return {"results": {size: {name: {"median_ms": ms, "min_ms": ms, "runs": 3} for name, ms in timings.items()}}}
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = results({"a": 10.0, "b": 10.0, "c": 10.0, "noise": 0.1, "gone": 1.0})
+    current = results({"a": 12.0, "b": 13.0, "c": 5.0, "noise": 0.25, "added": 1.0})
+
+    statuses = {row["name"]: row["status"] for row in compare(baseline, current, threshold=0.25)}
+
+    assert statuses == {"a": "ok", "b": "regression", "c": "improvement", "noise": "ok",
+                        "added": "new", "gone": "missing"}
+
+
+def test_measure_repeats_with_a_fresh_session():
+    sessions = []
+    timing = measure(lambda session, data: sessions.append(session), lambda: Session(), None,
+                     repeat=4, max_seconds=0)
+    assert timing["runs"] == 3  # MIN_RUNS, la durée maximale étant dépassée
+    assert len({id(session) for session in sessions}) == 3
+
+
+def snapshot(engine):
+    with Session(bind=engine) as session:
+        return (
+            session.execute(select(Clients.last_name, Clients.company_name).order_by(Clients.id)).all(),
+            session.execute(select(Contracts.total_amount, Contracts.amount_due, Contracts.is_signed)
+                            .order_by(Contracts.id)).all(),
+            session.execute(select(Events.support_contact_id, Events.date_start, Events.location)
+                            .order_by(Events.id)).all(),
+        )
+
+
+def test_dataset_is_deterministic(tmp_path):
+    engines = []
+    for name in ("a", "b"):
+        engine = create_app_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        data = generate_dataset(engine, 300, seed=7)
+        engines.append(engine)
+
+    first, second = snapshot(engines[0]), snapshot(engines[1])
+    assert first == second
+    clients, contracts, events = first
+    assert len(clients) == len(contracts) == 300
+    assert len(events) == sum(signed for _, _, signed in contracts)
+
+    with Session(bind=engines[0]) as session:
+        # Agrégats recalculés après les insertions en masse
+        assert session.scalar(select(func.sum(CommercialRevenue.contracts))) == 300
+        assert session.get(Clients, 151).email == data.sample_email
+    for engine in engines:
+        engine.dispose()
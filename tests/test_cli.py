@@ -0,0 +1,169 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+import jwt
+import pytest
+import cli
+from app.models import Clients, Contracts, Events, Roles, Users
+from app.utils.jwt_handler import ALGORITHM, SECRET_KEY, create_api_token, create_jwt_token
+
+
+@pytest.fixture
+def data(session):
+    """Un utilisateur par rôle, un client du commercial avec un contrat signé et un événement."""
+    roles = {name: Roles(name=name) for name in ("gestion", "commercial", "support")}
+    users = {
+        name: Users(username=f"cli-{name}", first_name=name, last_name="Cli", email=f"cli-{name}@test.com",
+                    hashed_password="x", role=role)
+        for name, role in roles.items()
+    }
+    session.add_all(users.values())
+    session.flush()
+    client = Clients(first_name="Client", last_name="Cli", email="cli-client@test.com", phone="0600000000",
+                     company_name="CliCorp", commercial_id=users["commercial"].id)
+    contract = Contracts(client=client, commercial_id=users["commercial"].id, total_amount=1000,
+                         amount_due=400, is_signed=True, date_created=datetime(2025, 1, 1))
+    session.add_all([client, contract])
+    session.flush()
+    event = Events(name="Salon", client_id=client.id, contract_id=contract.id,
+                   date_start=datetime(2030, 3, 1), date_end=datetime(2030, 3, 2), attendees=50)
+    session.add(event)
+    session.flush()
+    return {**users, "client": client, "contract": contract, "event": event}
+
+
+def batch(session, user, text, **options):
+    out, err = io.StringIO(), io.StringIO()
+    done, failed = cli.run_batch(session, user, io.StringIO(text), cli.build_parser(), out=out, err=err, **options)
+    results = [json.loads(line) for line in out.getvalue().splitlines() if line.startswith("{")]
+    errors = [json.loads(line) for line in err.getvalue().splitlines() if line.startswith("{")]
+    return done, failed, results, errors
+
+
+def test_authenticate_with_api_token_then_session_file(session, data, tmp_path, monkeypatch):
+    user, api_token, error = cli.authenticate(session, create_api_token(data["gestion"]))
+    assert error is None and user.id == data["gestion"].id and api_token
+
+    token_file = tmp_path / ".token"
+    token_file.write_text(create_jwt_token(data["support"]))
+    monkeypatch.setattr(cli, "TOKEN_FILE", str(token_file))
+    monkeypatch.delenv(cli.TOKEN_ENV, raising=False)
+    user, api_token, error = cli.authenticate(session)
+    assert error is None and user.id == data["support"].id and not api_token
+
+
+def test_token_type_comes_from_the_token_itself(session, data, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(cli, "SessionLocal", lambda: session)
+    monkeypatch.delenv(cli.TOKEN_ENV, raising=False)
+
+    # Jeton d'API copié dans .token : toujours un jeton d'API, qui ne peut pas en créer d'autres
+    token_file = tmp_path / ".token"
+    token_file.write_text(create_api_token(data["gestion"]))
+    monkeypatch.setattr(cli, "TOKEN_FILE", str(token_file))
+    assert cli.main(["token", "create"]) == 1
+    assert "main.py" in capsys.readouterr().err
+
+    # Jeton de session passé par --token : il peut créer un jeton d'API
+    assert cli.main(["--token", create_jwt_token(data["gestion"]), "token", "create"]) == 0
+    assert json.loads(capsys.readouterr().out)["token"]
+
+
+def test_authenticate_rejects_expired_and_missing_tokens(session, data, tmp_path, monkeypatch):
+    expired = jwt.encode(
+        {"sub": str(data["gestion"].id), "exp": datetime.now(timezone.utc) - timedelta(minutes=1)},
+        SECRET_KEY, algorithm=ALGORITHM,
+    )
+    user, _, error = cli.authenticate(session, expired)
+    assert user is None and "expiré" in error
+
+    monkeypatch.setattr(cli, "TOKEN_FILE", str(tmp_path / "absent"))
+    monkeypatch.delenv(cli.TOKEN_ENV, raising=False)
+    user, _, error = cli.authenticate(session)
+    assert user is None and "Aucun jeton" in error
+
+
+def test_batch_runs_every_operation_in_one_session(session, data):
+    contract, event = data["contract"], data["event"]
+    done, failed, results, errors = batch(session, data["gestion"], f"""
+        # Fin de mois
+        contracts update {contract.id} --amount-due 0
+        events update {event.id} --support-id {data['support'].id}
+        events conflicts
+    """)
+
+    assert (done, failed, errors) == (3, 0, [])
+    assert [result["id"] for result in results[:2]] == [contract.id, event.id]
+    assert results[2]["conflicts"] == []
+    session.refresh(contract)
+    session.refresh(event)
+    assert str(contract.amount_due) == "0.00"
+    assert event.support_contact_id == data["support"].id
+
+
+def test_batch_reports_errors_and_keeps_going(session, data):
+    done, failed, results, errors = batch(session, data["support"], f"""
+        clients create --first-name A --last-name B --email a@b.fr --phone 0600000000 --company C
+        events update {data['event'].id} --name Gala
+        contracts frobnicate
+        batch other.txt
+        events update {data['event'].id} --notes ok
+    """)
+
+    assert (done, failed) == (0, 5)
+    assert "rôle requis : commercial" in errors[0]["error"]
+    assert "permission" in errors[1]["error"]  # événement d'un autre support
+    assert errors[2]["error"] == "❌ Commande invalide."
+    assert "autre" in errors[3]["error"]
+    assert results == []
+
+
+def test_batch_stop_on_error(session, data):
+    done, failed, _, errors = batch(session, data["commercial"], """
+        contracts update 999999 --signed
+        clients update 1 --company X
+    """, stop_on_error=True)
+
+    assert (done, failed) == (0, 1)
+    assert "999999" in errors[0]["error"]
+
+
+def test_commercial_creates_client_contract_and_event(session, data):
+    commercial = data["commercial"]
+    done, failed, results, errors = batch(session, commercial, f"""
+        clients create --first-name Ada --last-name Cli --email ada-cli@test.com --phone 0611111111 --company Ada
+        contracts create --client-id {data['client'].id} --total-amount 99.90 --amount-due 99.90 --signed
+        events create --contract-id {data['contract'].id} --name "Soirée client" --start 2030-04-01 --end 2030-04-01 --location Lyon
+    """)
+
+    assert (failed, errors) == (0, [])
+    client = session.get(Clients, results[0]["id"])
+    contract = session.get(Contracts, results[1]["id"])
+    event = session.get(Events, results[2]["id"])
+    assert client.commercial_id == commercial.id
+    assert (contract.commercial_id, str(contract.total_amount)) == (commercial.id, "99.90")
+    assert (event.name, event.client_id) == ("Soirée client", data["client"].id)
+
+
+def test_events_assign_proposes_then_applies(session, data):
+    args = "events assign --since 2030-01-01"
+    _, _, results, _ = batch(session, data["gestion"], args)
+    assert results[0]["proposed"] == 1 and results[0]["applied"] == 0
+    assert data["event"].support_contact_id is None
+
+    _, _, results, _ = batch(session, data["gestion"], args + " --apply")
+    assert results[0]["applied"] == 1
+    session.refresh(data["event"])
+    assert data["event"].support_contact_id == data["support"].id
+
+
+def test_main_lists_as_jsonl_with_api_token(session, data, monkeypatch, capsys):
+    monkeypatch.setattr(cli, "SessionLocal", lambda: session)
+    token = create_api_token(data["commercial"])
+
+    assert cli.main(["--token", token, "clients", "list", "--format", "jsonl"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["email"] for row in rows] == ["cli-client@test.com"]
+
+    # Un jeton d'API ne permet pas d'en créer d'autres
+    assert cli.main(["--token", token, "token", "create"]) == 1
+    assert "main.py" in capsys.readouterr().err
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import text
+from app.engine import create_app_engine, SQLITE_PROFILES
+
+
+def pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_balanced_profile_pragmas(tmp_path):
+    engine = create_app_engine(f"sqlite:///{tmp_path / 'app.db'}", profile="balanced")
+
+    assert pragma(engine, "journal_mode") == "wal"
+    assert pragma(engine, "synchronous") == 1  # NORMAL
+    assert pragma(engine, "busy_timeout") == 5000
+    assert pragma(engine, "temp_store") == 2  # MEMORY
+    assert pragma(engine, "cache_size") == SQLITE_PROFILES["balanced"]["pragmas"]["cache_size"]
+    assert engine.pool.size() == SQLITE_PROFILES["balanced"]["pool"]["pool_size"]
+    engine.dispose()
+
+
+def test_safe_profile_keeps_rollback_journal(tmp_path):
+    engine = create_app_engine(f"sqlite:///{tmp_path / 'app.db'}", profile="safe")
+
+    assert pragma(engine, "journal_mode") == "delete"
+    assert pragma(engine, "synchronous") == 2  # FULL
+    engine.dispose()
+
+
+def test_memory_database_skips_file_settings():
+    engine = create_app_engine("sqlite:///:memory:", profile="fast")
+
+    assert pragma(engine, "journal_mode") == "memory"
+    assert pragma(engine, "synchronous") == 0  # OFF
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        create_app_engine("sqlite:///:memory:", profile="turbo")
@@ -0,0 +1,83 @@
+"""Démarrage jusqu'à l'écran de connexion, mesuré par python -X importtime et à la première saisie."""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Budget (ms) de l'import de main.py, c'est-à-dire du démarrage jusqu'à l'écran de connexion
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", 50))
+HEAVY_MODULES = {"sqlalchemy", "sentry_sdk", "rich", "cryptography", "passlib", "jwt", "bcrypt"}
+
+# "import time: <propre> | <cumulé> | <nom indenté>", en microsecondes
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$", re.MULTILINE)
+
+
+def import_times(statement):
+    """Modules importés par `statement` dans un nouvel interpréteur : {nom: temps cumulé (µs)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, env=os.environ.copy(),
+    )
+    assert result.returncode == 0, result.stderr
+    return {name: int(cumulative) for _, cumulative, _, name in IMPORT_LINE.findall(result.stderr)}
+
+
+# Remplace input() : à la première saisie, écrit les modules chargés et le temps écoulé, puis quitte
+AT_PROMPT = """
+import builtins, json, os, sys, time
+start = time.perf_counter()
+def at_prompt(prompt=""):
+    modules = sorted({{name.split(".")[0] for name in sys.modules}})
+    print(json.dumps({{"modules": modules, "ms": (time.perf_counter() - start) * 1000}}), flush=True)
+    os._exit(0)
+builtins.input = at_prompt
+{statement}
+"""
+
+
+def at_login_prompt(statement):
+    """Exécute `statement` jusqu'à la première saisie : (modules chargés, ms écoulées)."""
+    result = subprocess.run(
+        [sys.executable, "-c", AT_PROMPT.format(statement=statement)],
+        cwd=ROOT, capture_output=True, text=True, env=os.environ.copy(),
+    )
+    assert result.returncode == 0, result.stderr
+    state = json.loads(result.stdout.splitlines()[-1])
+    return set(state["modules"]), state["ms"]
+
+
+def test_login_prompt_loads_no_heavy_module():
+    # login() ne charge la base qu'une fois les identifiants saisis
+    loaded, _ = at_login_prompt("from app.views.login import login\nlogin()")
+    assert not loaded & HEAVY_MODULES
+
+
+def test_main_reaches_login_prompt_within_budget():
+    # main() n'attend pas l'initialisation de Sentry, lancée en arrière-plan
+    best = min(at_login_prompt("import main\nmain.main([])")[1] for _ in range(3))
+    assert best <= STARTUP_BUDGET_MS, f"main() jusqu'à la saisie : {best:.1f} ms (budget {STARTUP_BUDGET_MS} ms)"
+
+
+def test_login_screen_within_budget():
+    # Meilleur de trois mesures : le budget vise une régression, pas la charge de la machine
+    best = min(import_times("import main")["main"] for _ in range(3)) / 1000
+    assert best <= STARTUP_BUDGET_MS, f"import de main.py : {best:.1f} ms (budget {STARTUP_BUDGET_MS} ms)"
+
+
+def test_login_screen_loads_no_heavy_module():
+    loaded = {name.split(".")[0] for name in import_times("import main")}
+    assert not loaded & HEAVY_MODULES
+
+
+def test_menus_load_views_on_first_use():
+    views = {name for name in import_times("import app.menus.main_menu") if name.startswith("app.views.")}
+    assert views <= {"app.views.login"}
+
+
+def test_models_do_not_build_fernet_on_import():
+    assert "cryptography.fernet" not in import_times("import app.models")
@@ -0,0 +1,201 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+from app.models import Base
+from migrate import migrate
+from migrations import m001_hot_query_indexes, m002_search_index, m003_event_schedule_index, m004_revenue_summaries
+from migrations import m000_blind_index, m005_money_cents, m006_event_overlap_indexes
+
+
+def index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_migration_creates_missing_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    # Simule une base créée avant l'ajout des index
+    with engine.begin() as connection:
+        for name in (m001_hot_query_indexes.INDEX_NAMES + m003_event_schedule_index.INDEX_NAMES
+                     + m006_event_overlap_indexes.INDEX_NAMES):
+            connection.exec_driver_sql(f"DROP INDEX {name}")
+    assert "ix_contracts_signed_created" not in index_names(engine, "contracts")
+
+    assert migrate(engine) == [
+        m000_blind_index.NAME, m001_hot_query_indexes.NAME, m002_search_index.NAME, m003_event_schedule_index.NAME,
+        m004_revenue_summaries.NAME, m005_money_cents.NAME, m006_event_overlap_indexes.NAME,
+    ]
+
+    assert "ix_contracts_signed_created" in index_names(engine, "contracts")
+    assert "ix_events_support_date_start" in index_names(engine, "events")
+    assert "ix_clients_commercial_id" in index_names(engine, "clients")
+    assert "ix_events_location_date_start" in index_names(engine, "events")
+    assert "ix_events_support_date_end_start" in index_names(engine, "events")
+    engine.dispose()
+
+
+def test_migrations_do_not_depend_on_current_models(tmp_path, monkeypatch):
+    from app.models import Contracts, Events
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for name in m001_hot_query_indexes.INDEX_NAMES + m006_event_overlap_indexes.INDEX_NAMES:
+            connection.exec_driver_sql(f"DROP INDEX {name}")
+    # Index renommés ou supprimés des modèles après l'écriture des migrations
+    for model in (Contracts, Events):
+        monkeypatch.setattr(model.__table__, "indexes", set())
+
+    assert len(migrate(engine)) == 7
+
+    assert "ix_contracts_unpaid_created" in index_names(engine, "contracts")
+    assert "ix_events_support_date_end_start" in index_names(engine, "events")
+    engine.dispose()
+
+
+def test_migrate_is_idempotent(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    Base.metadata.create_all(engine)
+
+    assert migrate(engine) == [
+        m000_blind_index.NAME, m001_hot_query_indexes.NAME, m002_search_index.NAME, m003_event_schedule_index.NAME,
+        m004_revenue_summaries.NAME, m005_money_cents.NAME, m006_event_overlap_indexes.NAME,
+    ]
+    assert migrate(engine) == []
+    engine.dispose()
+
+
+def test_search_migration_indexes_existing_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Base antérieure à la recherche : pas de tables FTS, des clients existants
+        connection.exec_driver_sql("DROP TABLE clients_fts")
+        connection.exec_driver_sql("DROP TABLE events_fts")
+        connection.exec_driver_sql(
+            "INSERT INTO clients (first_name, last_name, email, email_bidx, phone, company_name) "
+            "VALUES ('Élise', 'Moreau', 'x', 'bidx', 'y', 'Les Ateliers Berthe')"
+        )
+
+    migrate(engine)
+
+    with engine.connect() as connection:
+        found = connection.exec_driver_sql("SELECT rowid FROM clients_fts WHERE clients_fts MATCH 'elise'").all()
+    assert len(found) == 1
+    engine.dispose()
+
+
+def test_revenue_migration_aggregates_existing_contracts(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Base antérieure aux agrégats : contrats existants, pas de table d'agrégats
+        connection.exec_driver_sql("DROP TABLE commercial_revenue")
+        connection.exec_driver_sql("DROP TABLE client_revenue")
+        connection.exec_driver_sql(
+            "INSERT INTO contracts (client_id, commercial_id, total_amount, amount_due, is_signed) "
+            "VALUES (1, 2, 1000, 400, 1), (1, 2, 500, 500, 0)"
+        )
+
+    migrate(engine)
+
+    with engine.connect() as connection:
+        row = connection.exec_driver_sql(
+            "SELECT contracts, signed_contracts, signed_total, amount_due, unpaid_contracts "
+            "FROM commercial_revenue WHERE commercial_id = 2"
+        ).one()
+    assert tuple(row) == (2, 1, 1000, 900, 2)
+    engine.dispose()
+
+
+LEGACY_CONTRACTS = """
+CREATE TABLE contracts (
+    id INTEGER PRIMARY KEY,
+    client_id INTEGER REFERENCES clients(id),
+    commercial_id INTEGER REFERENCES users(id),
+    total_amount FLOAT NOT NULL,
+    amount_due FLOAT NOT NULL,
+    date_created DATETIME,
+    is_signed BOOLEAN
+)
+"""
+
+
+def test_money_migration_converts_floats_to_cents(tmp_path, monkeypatch):
+    from decimal import Decimal
+    from sqlalchemy.orm import Session
+    from app.models import CommercialRevenue, Contracts
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Base antérieure aux centimes : montants FLOAT en euros
+        connection.exec_driver_sql("DROP TABLE contracts")
+        connection.exec_driver_sql(LEGACY_CONTRACTS)
+        connection.exec_driver_sql(
+            "INSERT INTO contracts (client_id, commercial_id, total_amount, amount_due, is_signed) VALUES "
+            "(1, 2, 1234.56, 0.1, 1), (1, 2, 0.2, 0.2, 1), (1, 2, 99.99, 0, 0)"
+        )
+    monkeypatch.setattr(m005_money_cents, "CHUNK_SIZE", 2)
+
+    migrate(engine)
+
+    with engine.connect() as connection:
+        raw = connection.exec_driver_sql("SELECT total_amount, amount_due FROM contracts ORDER BY id").all()
+    assert [tuple(row) for row in raw] == [(123456, 10), (20, 20), (9999, 0)]
+    assert "ix_contracts_unpaid_created" in index_names(engine, "contracts")
+    with Session(engine) as session:
+        assert session.get(Contracts, 1).total_amount == Decimal("1234.56")
+        assert session.query(Contracts).filter(Contracts.amount_due == 0).count() == 1
+        # 0.1 + 0.2 : exactement 0.30, sans dérive de flottant
+        assert session.get(CommercialRevenue, 2).amount_due == Decimal("0.30")
+    engine.dispose()
+
+
+def test_blind_index_migration_upgrades_baseline_database(tmp_path):
+    from sqlalchemy.orm import Session
+    from app.models.mixins import encrypt_value
+    from app.repositories.client_repository import get_client_by_email
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Base antérieure à l'index aveugle : pas de colonne email_bidx
+        for table in ("clients", "users"):
+            connection.exec_driver_sql(f"DROP INDEX ix_{table}_email_bidx")
+            connection.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN email_bidx")
+        connection.exec_driver_sql(
+            "INSERT INTO clients (first_name, last_name, email, phone, company_name) VALUES (?, ?, ?, ?, ?)",
+            ("Ana", "Legacy", encrypt_value("ana@legacy.com"), encrypt_value("0600000000"), "Old"),
+        )
+
+    assert migrate(engine)[0] == m000_blind_index.NAME
+
+    assert "ix_clients_email_bidx" in index_names(engine, "clients")
+    with Session(engine) as session:
+        assert get_client_by_email(session, "ANA@legacy.com").last_name == "Legacy"
+    engine.dispose()
+
+
+def test_blind_index_migration_refuses_duplicate_emails(tmp_path):
+    from app.models.mixins import encrypt_value
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_clients_email_bidx")
+        connection.exec_driver_sql("ALTER TABLE clients DROP COLUMN email_bidx")
+        for _ in range(2):
+            connection.exec_driver_sql(
+                "INSERT INTO clients (first_name, last_name, email, phone, company_name) VALUES (?, ?, ?, ?, ?)",
+                ("Ana", "Twin", encrypt_value("ana@twin.com"), encrypt_value("0600000000"), "Old"),
+            )
+
+    with pytest.raises(RuntimeError, match="en double dans clients"):
+        migrate(engine)
+
+    # Doublon corrigé : la migration reprend
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DELETE FROM clients WHERE id = 2")
+    assert migrate(engine)[0] == m000_blind_index.NAME
+    assert "ix_clients_email_bidx" in index_names(engine, "clients")
+    engine.dispose()
@@ -0,0 +1,48 @@
+from app.engine import postgres_engine_options
+from app.models import Clients
+from app.models.mixins import blind_index
+from app.repositories.client_repository import get_client_by_email, get_clients_page
+
+
+def test_postgres_engine_options(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "1500")
+
+    options = postgres_engine_options()
+
+    assert options["pool_size"] == 4
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"options": "-c statement_timeout=1500"}
+
+
+# === Base PostgreSQL réelle (ignorés si indisponible) ===
+
+def make_client(email, last_name="Dupont"):
+    return Clients(first_name="Jean", last_name=last_name, email=email,
+                   phone="0600000000", company_name="TestCorp")
+
+
+def test_encrypted_columns_roundtrip(pg_session):
+    client = make_client("pg@client.com")
+    pg_session.add(client)
+    pg_session.flush()
+    pg_session.expunge_all()
+
+    loaded = pg_session.query(Clients).one()
+    assert loaded._email != "pg@client.com"
+    assert loaded.email == "pg@client.com"
+    assert loaded.phone == "0600000000"
+    assert loaded.email_bidx == blind_index("pg@client.com")
+
+
+def test_blind_index_lookup_and_keyset_page(pg_session):
+    for i in range(3):
+        pg_session.add(make_client(f"c{i}@client.com", last_name=f"Nom{i}"))
+    pg_session.flush()
+
+    assert get_client_by_email(pg_session, "C1@client.com").last_name == "Nom1"
+
+    page, cursor = get_clients_page(pg_session, limit=2)
+    assert [c.last_name for c in page] == ["Nom0", "Nom1"]
+    rest, cursor = get_clients_page(pg_session, after=cursor, limit=2)
+    assert [c.last_name for c in rest] == ["Nom2"] and cursor is None
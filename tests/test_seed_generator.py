@@ -0,0 +1,66 @@
+from passlib.context import CryptContext
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.engine import create_app_engine
+from app.models import Base, Clients, Contracts, Events, Users
+from seeds.generate import PASSWORD, check_empty, generate, main
+
+
+def new_engine(path):
+    engine = create_app_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def rows(engine):
+    with Session(bind=engine) as session:
+        return (
+            session.execute(select(Users.username, Users.first_name, Users.role_id).order_by(Users.id)).all(),
+            session.execute(select(Clients.last_name, Clients.company_name, Clients.commercial_id).order_by(Clients.id)).all(),
+            session.execute(select(Contracts.client_id, Contracts.total_amount, Contracts.is_signed)
+                            .order_by(Contracts.id)).all(),
+            session.execute(select(Events.contract_id, Events.support_contact_id, Events.date_start)
+                            .order_by(Events.id)).all(),
+        )
+
+
+def test_same_seed_same_data_whatever_the_batch_size(tmp_path):
+    first, second = new_engine(tmp_path / "a.db"), new_engine(tmp_path / "b.db")
+    generate(first, 250, seed=3, batch_size=1000, workers=1, hashed_password="x")
+    generate(second, 250, seed=3, batch_size=7, workers=2, hashed_password="x")
+
+    assert rows(first) == rows(second)
+    assert check_empty(first) is not None
+
+
+def test_generated_data_is_consistent(tmp_path):
+    engine = new_engine(tmp_path / "perf.db")
+    data = generate(engine, 120, seed=1, batch_size=50, workers=2, bcrypt_rounds=4)
+
+    with Session(bind=engine) as session:
+        users = {user.id: user for user in session.query(Users)}
+        assert {len(ids) for ids in data.user_ids.values()} == {2}
+        assert CryptContext(schemes=["bcrypt"]).verify(PASSWORD, users[data.user_ids["gestion"][0]].hashed_password)
+        assert users[1].email == "gestion0@perf.example"  # chiffré, relu en clair
+
+        for client in session.query(Clients):
+            assert users[client.commercial_id].role.name == "commercial"
+        assert session.get(Clients, 7).email == "client6@perf.example"
+
+        events = session.query(Events).all()
+        assert len(events) == data.signed_contracts == session.query(Contracts).filter_by(is_signed=True).count()
+        for event in events:
+            contract = session.get(Contracts, event.contract_id)
+            assert event.client_id == contract.client_id and contract.is_signed
+            if event.support_contact_id is not None:
+                assert users[event.support_contact_id].role.name == "support"
+
+
+def test_main_refuses_a_non_empty_database_without_reset(tmp_path, capsys):
+    url = f"sqlite:///{tmp_path / 'perf.db'}"
+    arguments = ["--clients", "20", "--workers", "1", "--bcrypt-rounds", "4", "--database-url", url]
+
+    assert main(arguments) == 0
+    assert main(arguments) == 1
+    assert "--reset" in capsys.readouterr().out
+    assert main(arguments + ["--reset"]) == 0
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from app.utils.assignment import SupportLoadIndex, plan_assignments
+
+
+def day(n, hours=0):
+    return datetime(2025, 9, 1) + timedelta(days=n, hours=hours)
+
+
+def test_is_free_checks_the_previous_event():
+    index = SupportLoadIndex([1], timedelta(days=7))
+    index.add(1, day(2), day(3))
+    index.add(1, day(10), day(10))
+
+    assert index.is_free(1, day(4), day(9))
+    assert not index.is_free(1, day(3), day(4))   # bornes incluses
+    assert not index.is_free(1, day(0), day(20))
+    assert not index.is_free(1, day(10), day(10))
+
+
+def test_is_free_sees_overlaps_hidden_by_existing_conflicts():
+    # Planning hérité en conflit : (1 → 31) couvre (5 → 6), ajoutés dans les deux ordres
+    for events in ([(day(1), day(31)), (day(5), day(6))], [(day(5), day(6)), (day(1), day(31))]):
+        index = SupportLoadIndex([1], timedelta(days=7))
+        for date_start, date_end in events:
+            index.add(1, date_start, date_end)
+
+        assert not index.is_free(1, day(10), day(11))
+        assert index.is_free(1, day(32), day(33))
+
+
+def test_loads_follow_the_sliding_window():
+    index = SupportLoadIndex([1, 2], timedelta(days=2))
+    index.add(1, day(0), day(1), 30)
+    index.add(2, day(10), day(10), 5)
+
+    index.advance(day(2))
+    assert index.loads == {1: (1, 30), 2: (0, 0)}
+    index.advance(day(8))
+    assert index.loads == {1: (0, 0), 2: (1, 5)}
+
+
+def test_plan_balances_load_and_skips_busy_supports():
+    # Le support 1 a déjà deux événements cette semaine, le 2 un seul
+    schedule = [(1, day(0), day(0), 10), (1, day(2), day(2), 10), (2, day(1), day(1), 10)]
+    events = [
+        (101, day(3), day(3), 50),   # -> 2 (moins chargé)
+        (102, day(4), day(4), 50),   # 1 et 2 ont chacun deux événements : 1 a moins de participants
+        (103, day(4), day(4), 50),   # 1 occupé ce jour-là -> 2
+        (104, day(4), day(4), 50),   # personne de libre
+    ]
+
+    assignments, unassigned = plan_assignments([1, 2], schedule, events, window_days=7)
+
+    assert assignments == [(101, 2), (102, 1), (103, 2)]
+    assert unassigned == [104]
+
+
+def test_plan_spreads_many_events_evenly():
+    events = [(i, day(i // 4, hours=i % 4 * 5), day(i // 4, hours=i % 4 * 5 + 4), 10) for i in range(400)]
+
+    assignments, unassigned = plan_assignments([1, 2, 3, 4], [], events, window_days=3)
+
+    assert unassigned == []
+    counts = [sum(1 for _, support in assignments if support == s) for s in (1, 2, 3, 4)]
+    assert max(counts) - min(counts) <= 1
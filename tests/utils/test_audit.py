@@ -0,0 +1,117 @@
+import time
+import pytest
+from app.utils import audit
+from app.utils.audit import AuditPipeline, SentryTransport, audit_log, make_record
+from tests.helpers import FakeTransport
+
+
+def records(n, action="test.action"):
+    return [make_record(action, f"message {i}", index=i) for i in range(n)]
+
+
+def test_records_are_sent_in_batches():
+    transport = FakeTransport()
+    pipeline = AuditPipeline(transport, batch_size=10, flush_interval=0.01, rate_limit=0)
+    # File remplie avant le démarrage du thread : les lots sont complets
+    for record in records(25):
+        pipeline.queue.put_nowait(record)
+    pipeline.start()
+
+    assert pipeline.flush(timeout=2)
+    pipeline.close()
+    assert [len(batch) for batch in transport.batches] == [10, 10, 5]
+    assert [r["data"]["index"] for r in transport.records] == list(range(25))
+
+
+def test_drop_newest_when_queue_is_full():
+    pipeline = AuditPipeline(FakeTransport(), max_queue=3, drop_policy="newest")
+    pipeline.start = lambda: None  # pas de thread : la file reste pleine
+
+    results = [pipeline.submit(record) for record in records(5)]
+
+    assert results == [True, True, True, False, False]
+    assert pipeline.dropped == 2
+    assert [pipeline.queue.get_nowait()["data"]["index"] for _ in range(3)] == [0, 1, 2]
+
+
+def test_drop_oldest_when_queue_is_full():
+    pipeline = AuditPipeline(FakeTransport(), max_queue=3, drop_policy="oldest")
+    pipeline.start = lambda: None
+
+    assert all(pipeline.submit(record) for record in records(5))
+    assert pipeline.dropped == 2
+    assert [pipeline.queue.get_nowait()["data"]["index"] for _ in range(3)] == [2, 3, 4]
+
+
+def test_drops_are_reported_in_next_batch():
+    transport = FakeTransport()
+    pipeline = AuditPipeline(transport, max_queue=1, flush_interval=0.01, rate_limit=0)
+    start = pipeline.start
+    pipeline.start = lambda: None
+    pipeline.submit(make_record("a", "premier"))
+    pipeline.submit(make_record("b", "perdu"))
+    start()
+
+    assert pipeline.flush(timeout=2)
+    pipeline.close()
+    assert transport.actions() == ["a", "audit.dropped"]
+    assert transport.records[-1]["data"]["dropped"] == 1
+
+
+def test_rate_limit_spreads_sending():
+    transport = FakeTransport()
+    pipeline = AuditPipeline(transport, batch_size=5, flush_interval=0.01, rate_limit=100)
+    start = time.monotonic()
+    for record in records(15):
+        pipeline.submit(record)
+
+    assert pipeline.flush(timeout=5)
+    pipeline.close()
+    # 5 envois immédiats (réserve), puis 10 à 100/s
+    assert time.monotonic() - start >= 0.09
+    assert len(transport.records) == 15
+
+
+def test_transport_failure_does_not_stop_worker():
+    class FailingTransport(FakeTransport):
+        def send(self, records):
+            if not self.batches:
+                self.batches.append([])
+                raise RuntimeError("Sentry indisponible")
+            super().send(records)
+
+    transport = FailingTransport()
+    pipeline = AuditPipeline(transport, batch_size=1, flush_interval=0.01, rate_limit=0)
+    pipeline.submit(make_record("a", "échoue"))
+    assert pipeline.flush(timeout=2)
+    pipeline.submit(make_record("b", "passe"))
+    assert pipeline.flush(timeout=2)
+    pipeline.close()
+
+    assert pipeline.failed == 1
+    assert transport.actions() == ["b"]
+
+
+def test_unknown_drop_policy():
+    with pytest.raises(ValueError):
+        AuditPipeline(FakeTransport(), drop_policy="random")
+
+
+def test_audit_log_uses_process_pipeline(audit_transport):
+    assert audit_log("client.create", "Client créé", client_id=1)
+    audit.get_audit_pipeline().flush(timeout=2)
+
+    record = audit_transport.records[0]
+    assert record["action"] == "client.create"
+    assert record["level"] == "info"
+    assert record["data"] == {"client_id": 1}
+
+
+def test_sentry_transport(monkeypatch):
+    calls = []
+    monkeypatch.setattr(audit.sentry_sdk, "capture_message", lambda message, **kwargs: calls.append((message, kwargs)))
+
+    SentryTransport().send([make_record("user.create", "Utilisateur créé", user_id=3)])
+
+    assert calls == [("Utilisateur créé", {"level": "info", "tags": {"audit.action": "user.create"},
+                                          "extras": {"user_id": 3}})]
@@ -3,15 +3,18 @@ import builtins
 import pytest
 
 from app.utils import auth
+from app.utils.auth_context import clear_auth_context
 
 
 # ======= Fixtures ======= #
 @pytest.fixture(autouse=True)
 def cleanup_token_file():
-    # Supprime le fichier token avant et après chaque test
+    # Supprime le fichier token (et le contexte en cache) avant et après chaque test
+    clear_auth_context()
     if os.path.exists(auth.TOKEN_FILE):
         os.remove(auth.TOKEN_FILE)
     yield
+    clear_auth_context()
     if os.path.exists(auth.TOKEN_FILE):
         os.remove(auth.TOKEN_FILE)
 
@@ -37,7 +40,7 @@ def test_get_current_user_invalid_token(monkeypatch, capsys):
         f.write("FAKE_TOKEN")
 
     # Simule decode_jwt_token qui retourne une erreur
-    def fake_decode(token):
+    def fake_decode(token, **kwargs):
         return None, "Token invalide"
     monkeypatch.setattr(auth, "decode_jwt_token", fake_decode)
 
@@ -47,29 +50,108 @@ def test_get_current_user_invalid_token(monkeypatch, capsys):
     assert user is None
 
 
-def test_get_current_user_valid(monkeypatch):
-    # Crée un token valide
-    with open(auth.TOKEN_FILE, "w") as f:
-        f.write("VALID_TOKEN")
+def test_get_current_user_rejects_api_token(capsys):
+    from app.utils.jwt_handler import create_api_token
 
-    payload = {"sub": 123}
+    # Un jeton d'API (cli.py) ne vaut pas session interactive
+    user = DummyUser()
+    user.username = "script"
+    write_token(create_api_token(user))
+    assert auth.get_current_user() is None
+    assert "Jeton d'API refusé" in capsys.readouterr().out
 
-    def fake_decode(token):
-        return payload, None
 
-    dummy_user = DummyUser()
+class DummySession:
+    def __init__(self, user, calls):
+        self.user = user
+        self.calls = calls
+    def query(self, model):
+        return self
+    def get(self, user_id):
+        self.calls.append(user_id)
+        return self.user
+    def expunge(self, obj):
+        pass
+    def close(self):
+        self.calls.append("close")
 
-    class DummySession:
-        def query(self, model):
-            return self
-        def get(self, user_id):
-            return dummy_user
 
-    monkeypatch.setattr(auth, "decode_jwt_token", fake_decode)
-    monkeypatch.setattr(auth, "SessionLocal", lambda: DummySession())
+def use_dummy_session(monkeypatch, payload, user):
+    """Token valide + session factice ; retourne la liste des appels (get / close)."""
+    calls = []
+    monkeypatch.setattr(auth, "decode_jwt_token", lambda token, **kwargs: (payload, None))
+    monkeypatch.setattr(auth, "SessionLocal", lambda: DummySession(user, calls))
+    return calls
+
+
+def write_token(content):
+    with open(auth.TOKEN_FILE, "w") as f:
+        f.write(content)
+
+
+def test_get_current_user_valid(monkeypatch):
+    # Crée un token valide
+    write_token("VALID_TOKEN")
+    calls = use_dummy_session(monkeypatch, {"sub": 123}, DummyUser())
 
     user = auth.get_current_user()
     assert isinstance(user, DummyUser)
+    # La session est fermée après le chargement
+    assert calls == [123, "close"]
+
+
+def test_get_current_user_is_cached(monkeypatch):
+    write_token("VALID_TOKEN")
+    calls = use_dummy_session(monkeypatch, {"sub": 123}, DummyUser())
+
+    first = auth.get_current_user()
+    # Appels suivants : ni décodage ni requête
+    monkeypatch.setattr(auth, "decode_jwt_token", lambda token, **kwargs: pytest.fail("token redécodé"))
+    assert auth.get_current_user() is first
+    assert auth.get_current_user() is first
+    assert calls == [123, "close"]
+
+
+def test_get_current_user_reloads_when_token_changes(monkeypatch):
+    write_token("VALID_TOKEN")
+    calls = use_dummy_session(monkeypatch, {"sub": 123}, DummyUser())
+    auth.get_current_user()
+
+    write_token("ANOTHER_VALID_TOKEN")
+    auth.get_current_user()
+    assert calls.count(123) == 2
+
+
+def test_get_current_user_cache_expires(monkeypatch):
+    write_token("VALID_TOKEN")
+    calls = use_dummy_session(monkeypatch, {"sub": 123, "exp": 0}, DummyUser())
+
+    auth.get_current_user()
+    auth.get_current_user()
+    assert calls.count(123) == 2
+
+
+def test_clear_auth_context_on_role_change(monkeypatch):
+    write_token("VALID_TOKEN")
+    calls = use_dummy_session(monkeypatch, {"sub": 1}, DummyUser())
+    auth.get_current_user()
+
+    clear_auth_context(user_id=2)  # un autre utilisateur : cache conservé
+    auth.get_current_user()
+    assert calls.count(1) == 1
+
+    clear_auth_context(user_id=1)
+    auth.get_current_user()
+    assert calls.count(1) == 2
+
+
+def test_get_current_user_token_removed(monkeypatch, capsys):
+    write_token("VALID_TOKEN")
+    use_dummy_session(monkeypatch, {"sub": 123}, DummyUser())
+    auth.get_current_user()
+
+    os.remove(auth.TOKEN_FILE)
+    assert auth.get_current_user() is None
 
 
 # ======= Tests jwt_required ======= #
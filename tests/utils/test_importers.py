@@ -0,0 +1,31 @@
+import pytest
+from app.utils.importers import chunked, detect_format, read_records
+
+
+def test_read_csv_records(tmp_path):
+    path = tmp_path / "clients.csv"
+    path.write_text("first_name,email\nJean,jean@test.com\nMarie,marie@test.com\n", encoding="utf-8")
+
+    assert list(read_records(str(path))) == [
+        (2, {"first_name": "Jean", "email": "jean@test.com"}),
+        (3, {"first_name": "Marie", "email": "marie@test.com"}),
+    ]
+
+
+def test_read_jsonl_records_with_invalid_line(tmp_path):
+    path = tmp_path / "clients.jsonl"
+    path.write_text('{"first_name": "Jean"}\n\nnot json\n[1, 2]\n', encoding="utf-8")
+
+    assert list(read_records(str(path))) == [(1, {"first_name": "Jean"}), (3, None), (4, None)]
+
+
+def test_detect_format():
+    assert detect_format("a.CSV") == "csv"
+    assert detect_format("a.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("a.xlsx")
+
+
+def test_chunked():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
@@ -0,0 +1,34 @@
+import threading
+from app.utils import lazy
+
+
+def test_lazy_import_loads_on_first_call(monkeypatch):
+    imported = []
+    real_import = lazy.importlib.import_module
+
+    def tracking_import(name):
+        imported.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(lazy.importlib, "import_module", tracking_import)
+    dumps = lazy.lazy_import("json", "dumps")
+
+    assert imported == [] and dumps.__name__ == "dumps"
+    assert dumps({"a": 1}) == '{"a": 1}'
+    assert dumps([]) == "[]"
+    assert imported == ["json"]
+
+
+def test_first_lazy_call_waits_for_background_work():
+    started, release, done = threading.Event(), threading.Event(), []
+
+    def slow_init():
+        started.set()
+        release.wait(timeout=2)
+        done.append(True)
+
+    lazy.run_in_background(slow_init, "test-init")
+    started.wait(timeout=2)
+    release.set()
+    assert lazy.lazy_import("json", "loads")("[1]") == [1]
+    assert done == [True]
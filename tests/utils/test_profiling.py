@@ -0,0 +1,128 @@
+import builtins
+import io
+import pstats
+import threading
+from rich.console import Console
+from rich.prompt import Prompt
+from rich.table import Table
+import main
+from app.menus import gestion_menu
+from app.utils import profiling
+from app.utils.helpers import safe_input_int
+from app.views import pager as pager_module
+from app.views.pager import TablePager
+
+
+def slow_listing():
+    return sorted(str(i) for i in range(20000))
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", "")
+    with profiling.profile_action("Lister") as profiler:
+        slow_listing()
+    assert profiler is None
+
+
+def test_menu_action_writes_profile_and_summary(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling, "PROFILE_TOP", 5)
+    choices = iter(["1", "0"])
+    monkeypatch.setattr(gestion_menu, "safe_prompt_ask", lambda *args, **kwargs: next(choices))
+    output = io.StringIO()
+    monkeypatch.setattr(gestion_menu, "console", Console(file=output, width=200))
+
+    actions = [("1", "Lister tous les événements", lambda user: slow_listing()), ("0", "Retour", None)]
+    gestion_menu.display_action_menu(actions, user="u")
+
+    [prof] = tmp_path.glob("*-lister-tous-les-evenements.prof")
+    stats = pstats.Stats(str(prof))
+    assert any(name == "slow_listing" for _, _, name in stats.stats)
+    summary = prof.with_suffix(".txt").read_text()
+    assert summary.startswith("Lister tous les événements : ") and "slow_listing" in summary
+    assert "slow_listing" in output.getvalue()
+
+
+def waiting_for_user(*args, **kwargs):
+    return "3"
+
+
+def profiled_names(directory):
+    [prof] = directory.glob("*.prof")
+    return {name for _, _, name in pstats.Stats(str(prof)).stats}
+
+
+def test_prompts_are_not_profiled(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(Console, "input", waiting_for_user)
+    monkeypatch.setattr(builtins, "input", waiting_for_user)
+
+    with profiling.profile_action("Créer un client"):
+        Prompt.ask("Prénom")
+        safe_input_int("ID : ")
+        slow_listing()
+
+    names = profiled_names(tmp_path)
+    assert "slow_listing" in names and "waiting_for_user" not in names
+
+
+def test_pager_prefetch_is_profiled(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(pager_module.console, "print", lambda *args, **kwargs: None)
+    choices = iter(["n", "q"])
+    monkeypatch.setattr(pager_module.Prompt, "ask", lambda *args, **kwargs: next(choices))
+
+    def prefetched_rows():
+        return [("2",)]
+
+    def fetch_page(after, limit):
+        if threading.current_thread() is threading.main_thread():
+            return [("1",)], 1
+        return prefetched_rows(), None
+
+    with profiling.profile_action("Lister"):
+        TablePager(fetch_page, lambda page_number: Table("N"), page_size=1).run()
+
+    assert "prefetched_rows" in profiled_names(tmp_path)
+
+
+class BusyProfile:
+    """cProfile.Profile de Python 3.12+ quand un autre profileur est déjà actif."""
+
+    def enable(self):
+        raise ValueError("Another profiling tool is already active")
+
+
+def test_profiled_prefetch_survives_an_active_profiler(monkeypatch, tmp_path):
+    import cProfile
+
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(pager_module.console, "print", lambda *args, **kwargs: None)
+    choices = iter(["n", "q"])
+    monkeypatch.setattr(pager_module.Prompt, "ask", lambda *args, **kwargs: next(choices))
+    loaded = []
+
+    def fetch_page(after, limit):
+        loaded.append(after)
+        return [(str(after),)], (1 if after is None else None)
+
+    with profiling.profile_action("Lister") as profiler:
+        monkeypatch.setattr(cProfile, "Profile", BusyProfile)
+        monkeypatch.setattr(profiler, "enable", BusyProfile().enable)
+        assert TablePager(fetch_page, lambda page_number: Table("N"), page_size=1).run()
+        with profiling.paused_profiling():
+            pass
+
+    assert loaded == [None, 1]
+    assert list(tmp_path.glob("*.prof"))
+
+
+def test_main_profile_flag_enables_profiling(monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", "")
+    monkeypatch.setattr(main, "run_in_background", lambda func, name: None)
+    monkeypatch.setattr(main, "login", lambda: None)
+
+    main.main(["--profile"])
+    assert profiling.PROFILE_DIR == "profiles"
+    main.main(["--profile", "/tmp/out"])
+    assert profiling.PROFILE_DIR == "/tmp/out"
@@ -0,0 +1,45 @@
+import threading
+from app.utils import security
+
+
+def test_pool_hashes_and_verifies_with_configured_cost():
+    pool = security.PasswordPool(security.make_password_context(4), workers=2, max_pending=4)
+    try:
+        hashed = pool.hash("secret").result()
+        assert hashed.startswith("$2b$04$")
+        assert pool.verify("secret", hashed).result()
+        assert pool.verify_and_update("wrong", hashed).result() == (False, None)
+    finally:
+        pool.close()
+
+
+def test_pool_bounds_pending_requests():
+    pool = security.PasswordPool(security.make_password_context(4), workers=1, max_pending=2)
+    release = threading.Event()
+    pool.context = type("Blocking", (), {"hash": lambda self, password: release.wait()})()
+    try:
+        pool.hash("a"), pool.hash("b")
+        third = threading.Thread(target=pool.hash, args=("c",))
+        third.start()
+        third.join(0.1)
+        assert third.is_alive()  # en attente d'une place
+        release.set()
+        third.join(1)
+        assert not third.is_alive()
+    finally:
+        pool.close()
+
+
+def test_shared_helpers_use_shared_pool():
+    pool = security.PasswordPool(security.make_password_context(5))
+    previous = security.set_password_pool(pool)
+    try:
+        hashed = security.hash_password("secret")
+        assert hashed.startswith("$2b$05$") and security.verify_password("secret", hashed)
+        assert security.verify_and_update_password("secret", hashed) == (True, None)
+
+        valid, new_hash = security.verify_and_update_password("secret", security.make_password_context(4).hash("secret"))
+        assert valid and new_hash.startswith("$2b$05$")  # coût 4 dépassé
+    finally:
+        security.set_password_pool(previous)
+        pool.close()
@@ -0,0 +1,143 @@
+import io
+import json
+import time
+import pytest
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.controllers.client_controller import list_all_clients
+from app.menus import utils as menu_utils
+from app.models.base import Base
+from app.utils import sql_metrics
+from app.views import pager as pager_module
+from app.views.pager import TablePager
+
+
+@pytest.fixture
+def metrics_engine(monkeypatch):
+    """Base en mémoire instrumentée, mesure désactivée par défaut."""
+    for name, value in (("SQL_METRICS", False), ("SQL_SLOW_MS", 0.0), ("SQL_METRICS_FILE", "")):
+        monkeypatch.setattr(sql_metrics, name, value)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sql_metrics.instrument_engine(engine)
+
+
+def test_disabled_by_default_records_nothing(metrics_engine):
+    with sql_metrics.track_action("Lister tous les clients") as stats:
+        with Session(metrics_engine) as session:
+            list_all_clients(session)
+    assert stats is None
+
+
+def test_action_groups_queries_by_caller_and_dumps_jsonl(metrics_engine, monkeypatch, tmp_path):
+    dump = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS", True)
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS_FILE", str(dump))
+    output = io.StringIO()
+
+    with sql_metrics.track_action("Lister tous les clients", Console(file=output, width=200)) as stats:
+        with Session(metrics_engine) as session:
+            list_all_clients(session)
+            session.execute(text("UPDATE clients SET company_name = 'X'"))
+
+    callers = [query.caller for query in stats.queries]
+    assert callers[0] == "app.controllers.client_controller.list_all_clients"
+    assert stats.queries[0].rows == 0
+    assert callers[-1] is None and stats.queries[-1].rows == 0
+    assert "Lister tous les clients : 2 requête(s)" in output.getvalue()
+
+    record = json.loads(dump.read_text())
+    assert record["action"] == "Lister tous les clients" and record["query_count"] == 2
+    assert record["queries"][0]["statement"].startswith("SELECT")
+
+
+def test_slow_queries_are_logged_outside_actions(metrics_engine, monkeypatch, tmp_path):
+    log = tmp_path / "slow.log"
+    monkeypatch.setattr(sql_metrics, "SQL_SLOW_MS", 0.000001)
+    monkeypatch.setattr(sql_metrics, "SQL_SLOW_LOG", str(log))
+
+    with Session(metrics_engine) as session:
+        list_all_clients(session)
+
+    line = log.read_text().splitlines()[0]
+    assert "[-] app.controllers.client_controller.list_all_clients rows=0 : SELECT" in line
+
+
+def test_select_rows_are_counted_as_they_are_read(metrics_engine, monkeypatch):
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS", True)
+    with metrics_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE numbers (n INTEGER)"))
+        connection.execute(text("INSERT INTO numbers VALUES (1), (2), (3)"))
+
+    with sql_metrics.track_action("Lister") as stats:
+        with metrics_engine.connect() as connection:
+            assert len(connection.execute(text("SELECT n FROM numbers")).all()) == 3
+            connection.execute(text("SELECT n FROM numbers")).first()
+
+    assert [query.rows for query in stats.queries] == [3, 1]
+
+
+STREAM_ROWS = 200000
+STREAM = text(
+    "WITH RECURSIVE numbers(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM numbers WHERE n < :count) "
+    "SELECT n FROM numbers"
+)
+
+
+def test_reading_rows_is_part_of_the_query_time(metrics_engine, monkeypatch, tmp_path):
+    log = tmp_path / "slow.log"
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS", True)
+    monkeypatch.setattr(sql_metrics, "SQL_SLOW_MS", 20.0)
+    monkeypatch.setattr(sql_metrics, "SQL_SLOW_LOG", str(log))
+
+    with sql_metrics.track_action("Lister") as stats:
+        with metrics_engine.connect() as connection:
+            streaming = connection.execution_options(stream_results=True, max_row_buffer=1000)
+            start = time.perf_counter()
+            for _ in streaming.execute(STREAM, {"count": STREAM_ROWS}).partitions(1000):
+                pass
+            wall_ms = (time.perf_counter() - start) * 1000
+
+    [query] = stats.queries
+    assert query.rows == STREAM_ROWS
+    # SQLite calcule les lignes pendant les fetch : sans leur lecture, la requête
+    # mesurerait moins d'une milliseconde (le reste du temps est la boucle Python)
+    assert query.duration_ms >= 0.3 * wall_ms and query.duration_ms >= 20.0
+    assert f"[Lister] - rows={STREAM_ROWS} : WITH RECURSIVE" in log.read_text()
+
+
+def test_pager_prefetch_is_attributed_to_the_action(metrics_engine, monkeypatch):
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS", True)
+    monkeypatch.setattr(pager_module.console, "print", lambda *args, **kwargs: None)
+    choices = iter(["n", "n", "q"])
+    monkeypatch.setattr(pager_module.Prompt, "ask", lambda *args, **kwargs: next(choices))
+
+    def fetch_page(after, limit):
+        with metrics_engine.connect() as connection:
+            connection.execute(text("SELECT 1")).all()
+        start = after or 0
+        return [(str(start),)], (start + 1 if start < 2 else None)
+
+    with sql_metrics.track_action("Lister") as stats:
+        TablePager(fetch_page, lambda page_number: Table("N"), page_size=1).run()
+
+    assert len(stats.queries) == 3  # la première page et deux pages préchargées
+
+
+def test_menu_action_is_tracked(metrics_engine, monkeypatch, tmp_path):
+    dump = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(sql_metrics, "SQL_METRICS_FILE", str(dump))
+    choices = iter(["1", "0"])
+    monkeypatch.setattr(menu_utils, "safe_prompt_ask", lambda *args, **kwargs: next(choices))
+    monkeypatch.setattr(menu_utils, "safe_input", lambda *args: None)
+    monkeypatch.setattr(menu_utils, "console", Console(file=io.StringIO()))
+
+    def show_clients(user):
+        with Session(metrics_engine) as session:
+            list_all_clients(session)
+
+    menu_utils.display_action_menu([("1", "Voir les clients", show_clients), ("0", "Retour", None)], user="u")
+
+    assert json.loads(dump.read_text())["action"] == "Voir les clients"
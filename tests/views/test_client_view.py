@@ -46,11 +46,11 @@ def fake_session(monkeypatch):
 # ---- TESTS ----
 
 def test_show_all_clients_view_empty(monkeypatch, fake_session, fake_user):
-    monkeypatch.setattr(cv, "list_all_clients", lambda s: [])
+    monkeypatch.setattr(cv, "list_clients_page", lambda s, **k: ([], None))
     show_all_clients_view(fake_user)
 
 def test_show_all_clients_view_ok(monkeypatch, fake_session, fake_user):
-    monkeypatch.setattr(cv, "list_all_clients", lambda s: [FakeClient()])
+    monkeypatch.setattr(cv, "list_clients_page", lambda s, **k: ([FakeClient()], None))
     show_all_clients_view(fake_user)
 
 def test_create_client_view_ok(monkeypatch, fake_session, fake_user):
@@ -71,6 +71,12 @@ class FakeQuery:
     def join(self, *args, **kwargs):
         return self
 
+    def options(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
     def all(self):
         return self.data
 
@@ -33,7 +33,7 @@ class FakeUser:
 def test_show_all_events_view(monkeypatch):
     fake_user = FakeUser("support")
 
-    def fake_list_all_events(session):
+    def fake_list_events_page(session, **kwargs):
         class FakeEvent:
             def __init__(self):
                 self.id = 1
@@ -47,9 +47,9 @@ def test_show_all_events_view(monkeypatch):
                     "first_name": "Support",
                     "last_name": "User"
                 })
-        return [FakeEvent()]
+        return [FakeEvent()], None
 
-    monkeypatch.setattr(event_view, "list_all_events", fake_list_all_events)
+    monkeypatch.setattr(event_view, "list_events_page", fake_list_events_page)
     event_view.show_all_events_view(fake_user)
 
 
@@ -76,6 +76,7 @@ def test_create_event_view(monkeypatch):
         support_users=[FakeSupportUser(1)]
     ))
 
+    monkeypatch.setattr(event_view, "list_all_clients", lambda session: session.query(Clients).all())
     monkeypatch.setattr(event_view, "create_event", create_event_success)
     event_view.create_event_view(fake_user)
 
@@ -203,6 +204,9 @@ class FakeQuery:
     def order_by(self, *args, **kwargs):
         return self
 
+    def options(self, *args, **kwargs):
+        return self
+
     def get(self, id):
         return next((item for item in self.items if item.id == id), None)
 
@@ -0,0 +1,76 @@
+import pytest
+from rich.table import Table
+import app.views.pager as pager_module
+from app.views.pager import TablePager
+
+
+class FakeSource:
+    """Source paginée de `total` lignes numérotées, qui enregistre les curseurs demandés."""
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def __call__(self, after, limit):
+        self.calls.append(after)
+        start = after or 0
+        rows = [(str(i),) for i in range(start, min(start + limit, self.total))]
+        next_cursor = start + limit if start + limit < self.total else None
+        return rows, next_cursor
+
+
+def build_table(page_number):
+    table = Table(title=f"Page {page_number}")
+    table.add_column("N")
+    return table
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    pages = []
+    monkeypatch.setattr(pager_module.console, "print",
+                        lambda obj, *a, **k: pages.append(obj.title) if isinstance(obj, Table) else None)
+    return pages
+
+
+def answers(monkeypatch, *values):
+    values = list(values)
+    monkeypatch.setattr(pager_module.Prompt, "ask", lambda *a, **k: values.pop(0))
+
+
+def test_pager_empty_source(rendered):
+    assert TablePager(FakeSource(0), build_table, page_size=2).run() is False
+    assert rendered == []
+
+
+def test_pager_single_page_does_not_prompt(monkeypatch, rendered):
+    monkeypatch.setattr(pager_module.Prompt, "ask", lambda *a, **k: pytest.fail("prompt inattendu"))
+    assert TablePager(FakeSource(2), build_table, page_size=2).run() is True
+    assert rendered == ["Page 1"]
+
+
+def test_pager_navigation(monkeypatch, rendered):
+    source = FakeSource(5)
+    answers(monkeypatch, "n", "n", "n", "p", "j", "1", "q")
+
+    TablePager(source, build_table, page_size=2).run()
+
+    assert rendered == ["Page 1", "Page 2", "Page 3", "Page 3", "Page 2", "Page 1"]
+    # Chaque page n'est chargée qu'une fois (préchargement compris)
+    assert source.calls == [None, 2, 4]
+
+
+def test_pager_jump_past_last_page(monkeypatch, rendered):
+    answers(monkeypatch, "j", "10", "q")
+
+    TablePager(FakeSource(5), build_table, page_size=2).run()
+
+    assert rendered == ["Page 1", "Page 3"]
+
+
+def test_pager_stops_without_stdin(monkeypatch, rendered):
+    def no_stdin(*args, **kwargs):
+        raise OSError
+    monkeypatch.setattr(pager_module.Prompt, "ask", no_stdin)
+
+    assert TablePager(FakeSource(5), build_table, page_size=2).run() is True
+    assert rendered == ["Page 1"]
@@ -0,0 +1,83 @@
+from datetime import datetime
+import pytest
+from sqlalchemy.orm import sessionmaker
+from app.models import Clients, Contracts, Events, Roles, Users
+import app.views.client_view as client_view
+import app.views.contract_view as contract_view
+import app.views.event_view as event_view
+from tests.helpers import assert_max_queries
+
+ROWS = 5
+
+
+@pytest.fixture
+def dataset(session):
+    """ROWS commerciaux/supports, chacun avec un client, un contrat et un événement."""
+    commercial_role, support_role = Roles(name="qc-commercial"), Roles(name="qc-support")
+    session.add_all([commercial_role, support_role])
+    session.flush()
+    for i in range(ROWS):
+        commercial = Users(username=f"qc-com{i}", first_name="Com", last_name=str(i),
+                           email=f"qc-com{i}@test.com", hashed_password="x", role_id=commercial_role.id)
+        support = Users(username=f"qc-sup{i}", first_name="Sup", last_name=str(i),
+                        email=f"qc-sup{i}@test.com", hashed_password="x", role_id=support_role.id)
+        client = Clients(first_name="Client", last_name=str(i), email=f"qc-client{i}@test.com",
+                         phone="0600000000", company_name=f"Corp {i}", commercial=commercial)
+        contract = Contracts(client=client, commercial_id=None, total_amount=100, amount_due=10,
+                             date_created=datetime(2024, 1, i + 1), is_signed=False)
+        session.add_all([commercial, support, client, contract])
+        session.flush()
+        session.add(Events(name=f"Event {i}", client_id=client.id, contract_id=contract.id,
+                           support_contact=support, date_start=datetime(2024, 6, i + 1),
+                           date_end=datetime(2024, 6, i + 1, 18), location="Paris", attendees=10))
+    session.flush()
+    session.expunge_all()
+    return session
+
+
+@pytest.fixture
+def view_sessions(monkeypatch, dataset):
+    """Les vues ouvrent leurs sessions sur la connexion de test."""
+    factory = sessionmaker(bind=dataset.connection())
+    for module in (client_view, contract_view, event_view):
+        monkeypatch.setattr(module, "SessionLocal", factory)
+    return dataset.get_bind().engine
+
+
+def test_show_all_clients_rows_query_count(view_sessions):
+    with assert_max_queries(view_sessions, 1):
+        rows, _ = client_view.fetch_client_rows(None, 50)
+    assert len(rows) == ROWS
+
+
+def test_show_all_contracts_rows_query_count(view_sessions):
+    with assert_max_queries(view_sessions, 1):
+        rows, _ = contract_view.fetch_contract_rows(None, 50)
+    assert len(rows) == ROWS
+
+
+def test_show_all_events_rows_query_count(view_sessions):
+    with assert_max_queries(view_sessions, 1):
+        rows, _ = event_view.fetch_event_rows(None, 50)
+    assert len(rows) == ROWS
+    assert all(row[-1].startswith("Sup ") for row in rows)
+
+
+def test_event_list_profile_query_count(view_sessions, dataset):
+    from app.controllers.event_controller import list_events
+
+    with assert_max_queries(view_sessions, 1):
+        events = list_events(dataset)
+        supports = [event.support_contact.first_name for event in events]
+        roles = [event.support_contact.role.name for event in events]
+    assert len(supports) == len(roles) == ROWS
+
+
+def test_contract_filter_profile_query_count(view_sessions, dataset):
+    from app.controllers.contract_controller import list_contracts_page
+
+    with assert_max_queries(view_sessions, 1):
+        contracts, _ = list_contracts_page(dataset, criteria=(Contracts.is_signed == False,),
+                                           profile="contract_filter")
+        names = [contract.client.commercial.first_name for contract in contracts]
+    assert names == ["Com"] * ROWS